@@ -4,88 +4,138 @@ author: Jerry Lane
 purpose: This file builds the elements of the initial game and then
 sends it to the director instance to start the game.
 """
-# import needed modules for game setup
+# import needed modules for game setup; the game's own modules are imported by the function that
+# needs them, so the tournament, server and replay commands start without the window's services
+import argparse
+import random
+import sys
 import globals
-from game.casting.actor import Actor
-from game.casting.cast import Cast
-from game.casting.fleet import Fleet
-from game.directing.director import Director
-from game.services.keyboard_service import KeyboardService
-from game.services.video_service import VideoService
-from game.shared.point import Point
 
 # game loader function
-def main():
+def main(args = None):
     """
-    parameters: none
+    parameters: args[] (List) - command line arguments
     return: nothing
     purpose: This function creates and loads the beginning objects
     needed to run the game.
     """
-    # create the cast
-    cast = Cast()
-    
-    # create the banners - first the player's message area
-    banner = Actor()
-    banner.set_text(" ")
-    banner.set_font_size(globals.FONT_SIZE)
-    banner.set_color(globals.GREEN)
-    banner.set_position(Point(globals.CELL_SIZE, globals.MAX_Y - globals.CELL_SIZE))
-    cast.add_actor("banners", banner)
+    from game.casting.board import parse_board_size, set_board_size
+    from game.casting.game_setup import ENEMIES, create_cast, create_volley_service
+    from game.directing.director import Director
+    from game.services.hint_service import HintService
+    from game.services.keyboard_service import KeyboardService
+    from game.services.match_client import parse_address
+    from game.services.profile_service import ProfileService
+    from game.services.replay_service import ReplayService
+    from game.services.save_service import SaveService
+    from game.services.video_service import VideoService
 
-    # second - create the enemy banner area
-    banner = Actor()
-    banner.set_text(" ")
-    banner.set_font_size(globals.FONT_SIZE)
-    banner.set_color(globals.RED_BOLD)
-    banner.set_position(Point(globals.MAX_X - (globals.CELL_SIZE * 23), globals.MAX_Y - globals.CELL_SIZE))
-    cast.add_actor("banners", banner)
-    
-    # create the cursor position in top half of the screen
-    x = int(globals.MAX_X / 2)
-    y = int(globals.MAX_Y / 4)
-    position = Point(x, y)
+    # read the command line options
+    parser = argparse.ArgumentParser(prog = "battleships")
+    parser.add_argument("--profile", metavar = "FILE", help = "time each frame and write the report to FILE on exit")
+    parser.add_argument("--overlay", action = "store_true", help = "show the frame times on screen")
+    parser.add_argument("--seed", type = int, help = "seed to play the game from (default: random)")
+    parser.add_argument("--record", metavar = "FILE", help = "write a replay log of the game to FILE on exit")
+    parser.add_argument("--save", metavar = "FILE", help = "write a snapshot of the game to FILE on exit and whenever F5 is pressed")
+    parser.add_argument("--load", metavar = "FILE", help = "continue the game saved in FILE")
+    parser.add_argument("--board", metavar = "COLSxROWS", type = parse_board_size, \
+        help = f"size of each side's board, up to {globals.MAX_BOARD}x{globals.MAX_BOARD} (default: {globals.COLS}x{globals.ROWS // 2})")
+    parser.add_argument("--hints", action = "store_true", help = "shade the enemy field by how likely each cell is to hold a ship")
+    parser.add_argument("--fps", type = int, default = globals.FRAME_RATE, \
+        help = f"frames drawn a second; the game itself always runs at {globals.TICK_RATE} ticks a second (default: {globals.FRAME_RATE})")
+    parser.add_argument("--idle", action = "store_true", help = "only redraw when something changed, sleeping between inputs")
+    parser.add_argument("--enemy", choices = ENEMIES, default = "random", help = "how the enemy aims its volleys (default: random)")
+    parser.add_argument("--connect", metavar = "HOST:PORT", type = parse_address, \
+        help = "play another person through the match server at HOST:PORT")
+    options = parser.parse_args(args)
 
-    # create the cursor itself
-    cursor = Actor()
-    cursor.set_text("+")
-    cursor.set_font_size(globals.FONT_SIZE)
-    cursor.set_color(globals.WHITE)
-    cursor.set_position(position)
-    cast.add_actor("cursors", cursor)
+    # read a saved game; it has its own board size, and its seed is not known, so it cannot be recorded
+    data = None
+    if options.load is not None:
+        if options.board is not None or options.record is not None:
+            parser.error("--load cannot be used with --board or --record")
+        try:
+            with open(options.load, "rb") as snapshot:
+                data = snapshot.read()
+            options.board = SaveService().get_board_size(data)
+        except (OSError, ValueError) as error:
+            parser.error(f"cannot load {options.load}: {error}")
 
-    # create the divider between the enemy field and defense
-    y = int(globals.MAX_Y / 2)
-    for n in range(0, globals.MAX_X, globals.CELL_SIZE):
-        divider = Actor()
-        divider.set_text("-")
-        divider.set_font_size(globals.FONT_SIZE)
-        divider.set_color(globals.YELLOW)
-        divider.set_position(Point(n, y))
-        cast.add_actor("dividers", divider)
+    # size the boards before anything is built on them
+    if options.board is not None:
+        set_board_size(*options.board)
 
-    # create both fleets 
-    ships = Fleet(cast)
-    enemies = ships.get_actors("enemy_ships")
-    defenders = ships.get_actors("defense_ships")
-    results = []
-    for enemy in enemies:
-        results.extend(enemy)
-    for i in range(len(results)):
-        cast.add_actor("enemy_ships", results[i])
-    results = []
-    for defender in defenders:
-        results.extend(defender)
-    for i in range(len(results)):
-        cast.add_actor("defense_ships", results[i])
-    
-    # start the game
+    # against another person, the server lays out the fleets and resolves the shots
+    if options.connect is not None:
+        play_online(options)
+        return
+
+    # seed the game's random number generator, and get ready to record it
+    seed = options.seed if options.seed is not None else random.SystemRandom().randrange(2 ** 64)
+    rng = random.Random(seed)
+    replay_service = ReplayService(seed, options.record, options.enemy)
+
+    # start the game; the window opens first and the cast is built once it has
+    keyboard_service = KeyboardService(globals.CELL_SIZE)
+    video_service = VideoService(globals.CAPTION, globals.MAX_X, \
+        globals.MAX_Y, globals.CELL_SIZE, max(1, options.fps), wait_for_events = options.idle)
+    profile_service = None
+    if options.profile or options.overlay:
+        profile_service = ProfileService(path = options.profile, overlay = options.overlay)
+    volley_service = create_volley_service(options.enemy, rng)
+    hint_service = HintService() if options.hints else None
+    save_service = SaveService(options.save) if options.save is not None else None
+    director = Director(keyboard_service, video_service, profile_service, rng, replay_service, \
+        volley_service, hint_service, options.idle, save_service)
+    if data is not None:
+        director.start_game(lambda: SaveService().load(data, director))
+    else:
+        director.start_game(lambda: create_cast(rng))
+
+# online game function
+def play_online(options):
+    """
+    parameters: options (Namespace) - the command line options, with connect set
+    return: nothing
+    purpose: This function connects to a match server and plays a game
+    against whoever it pairs the player with.
+    """
+    from game.casting.game_setup import create_online_cast
+    from game.directing.online_director import OnlineDirector
+    from game.services.keyboard_service import KeyboardService
+    from game.services.match_client import MatchClient
+    from game.services.profile_service import ProfileService
+    from game.services.video_service import VideoService
+    client = MatchClient(*options.connect)
+    try:
+        client.connect()
+    except OSError as error:
+        sys.exit(f"battleships: cannot reach {options.connect[0]}:{options.connect[1]}: {error}")
     keyboard_service = KeyboardService(globals.CELL_SIZE)
     video_service = VideoService(globals.CAPTION, globals.MAX_X, \
-        globals.MAX_Y, globals.CELL_SIZE, globals.FRAME_RATE)
-    director = Director(keyboard_service, video_service)
-    director.start_game(cast)
+        globals.MAX_Y, globals.CELL_SIZE, max(1, options.fps))
+    profile_service = None
+    if options.profile or options.overlay:
+        profile_service = ProfileService(path = options.profile, overlay = options.overlay)
+    director = OnlineDirector(keyboard_service, video_service, client, profile_service)
+    director.start_game(create_online_cast())
 
-# if this is the main module, run main function, otherwise don't run
+# if this is the main module, run main function, or the tournament, server or replay if asked,
+# otherwise don't run; only main opens a window and loads raylib
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "tournament":
+        from game.directing.tournament import main as tournament_main
+        tournament_main(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == "serve":
+        from game.services.match_server import main as serve_main
+        serve_main(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == "replay":
+        from game.services.replay_service import main as replay_main
+        sys.exit(replay_main(sys.argv[2:]))
+    else:
+        try:
+            main()
+        except ModuleNotFoundError as error:
+            if error.name != "pyray":
+                raise
+            sys.exit("battleships: raylib is needed to open the window; install it with python3 -m pip install raylib")
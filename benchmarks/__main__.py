@@ -0,0 +1,59 @@
+"""
+file: __main__.py
+author: Jerry Lane
+purpose: This file runs the benchmark suite, saves the timings as JSON,
+and fails if any case got slower than a saved baseline allows.
+"""
+# import modules
+import argparse
+import fnmatch
+import json
+import random
+import sys
+
+# the services load pyray when they first draw, so put the null backend in first
+from benchmarks import null_pyray
+null_pyray.install()
+from benchmarks.cases import get_cases
+from benchmarks.runner import Runner
+
+# benchmark entry point
+def main(args = None):
+    """
+    parameters: args[] (List) - command line arguments
+    return: (int) - 0 if no case got slower than allowed, 1 if otherwise
+    purpose: This function runs the cases, prints and saves their timings,
+    and compares them with a baseline.
+    """
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks", \
+        description = "Time fleet generation, hit resolution and rendering.")
+    parser.add_argument("-o", "--output", default = "bench_output.json", help = "file to save the timings to")
+    parser.add_argument("-b", "--baseline", help = "saved timings to compare against")
+    parser.add_argument("-t", "--threshold", type = float, default = 0.25, help = "allowed slowdown, e.g. 0.25 for 25%%")
+    parser.add_argument("-k", "--filter", default = "*", help = "only run cases matching this pattern")
+    parser.add_argument("--min-time", type = float, default = 0.5, help = "least seconds to spend on each case")
+    parser.add_argument("--commit", help = "label saved with the timings, such as a commit hash")
+    options = parser.parse_args(args)
+
+    # run the cases from a fixed seed so every run times the same boards
+    random.seed(0)
+    runner = Runner(min_time = options.min_time)
+    for name, case, setup in get_cases():
+        if fnmatch.fnmatch(name, options.filter):
+            timing = runner.run(name, case, setup)
+            print(f"{name:<24} {timing['median'] * 1e6:>12.1f} us  ({timing['iterations']} runs)")
+    runner.save(options.output, options.commit)
+
+    # compare with the baseline, if there is one
+    if options.baseline:
+        with open(options.baseline) as saved:
+            slower = runner.compare(json.load(saved), options.threshold)
+        for name, old, new in slower:
+            print(f"SLOWER {name}: {old * 1e6:.1f} us -> {new * 1e6:.1f} us")
+        if slower:
+            return 1
+    return 0
+
+# if this is the main module, run main function
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""
+file: cases.py
+author: Jerry Lane
+purpose: This file holds the benchmark cases for fleet generation, hit
+resolution and rendering. Each case is a (name, case, setup) triple for
+the Runner; the setup builds fresh state outside of the timing.
+"""
+# import modules
+import globals
+import random
+from game.casting.actor import Actor
+from game.casting.cast import Cast
+from game.casting.fleet import Fleet
+from game.casting.game_setup import create_cast
+from game.directing.batch_engine import BatchEngine
+from game.directing.director import Director
+from game.services.density_volley_service import DensityVolleyService
+from game.services.hint_service import HintService
+from game.shared.point import Point
+
+# function to build a director with the null video service
+def _create_director(rng):
+    """
+    parameters: rng (Random) - the game's random number generator
+    return: (Director) - a director drawing through the null pyray
+    purpose: This function builds the director the update and draw cases use.
+    """
+    from game.services.video_service import VideoService
+    video_service = VideoService(globals.CAPTION, globals.MAX_X, globals.MAX_Y, \
+        globals.CELL_SIZE, globals.FRAME_RATE)
+    video_service.open_window()
+    return Director(None, video_service, rng = rng)
+
+# function to build a game ready to play
+def _create_game():
+    """
+    parameters: none
+    return: (tuple) - a director and a freshly built cast
+    purpose: This function builds one game for the update cases, always
+    from the same seed so every run times the same boards.
+    """
+    rng = random.Random(0)
+    return (_create_director(rng), create_cast(rng))
+
+# function to build a game with a shot waiting
+def _create_game_with_shot():
+    """
+    parameters: none
+    return: (tuple) - a director with an Enter key press waiting, and its cast
+    purpose: This function builds one game whose next update fires a shot.
+    """
+    director, cast = _create_game()
+    director._shots = 1
+    return (director, cast)
+
+# function to build a game against the density enemy
+def _create_density_game():
+    """
+    parameters: none
+    return: (tuple) - a director aiming by density, and its cast after 5 turns of play
+    purpose: This function builds one game whose density counts are already
+    built, so the case times only bringing them up to date and aiming.
+    """
+    rng = random.Random(0)
+    director = Director(None, None, rng = rng, volley_service = DensityVolleyService(rng))
+    cast = create_cast(rng)
+    for n in range(5):
+        director._return_fire(cast)
+    return (director, cast)
+
+# function to build a fleet on a crowded board
+def _create_crowded_fleet():
+    """
+    parameters: none
+    return: (Fleet) - a fleet whose defense board is about 85% full
+    purpose: This function builds the board the crowded placement case uses.
+    """
+    rng = random.Random(0)
+    fleet = Fleet(Cast(), rng)
+    board = fleet.get_board("defense_ships")
+    first_row = board.get_row_offset()
+    for row in range(first_row, first_row + board.get_rows()):
+        for col in range(board.get_cols()):
+            if rng.random() < 0.85:
+                board.add_ship([Point(col, row).scale(globals.CELL_SIZE)])
+    return fleet
+
+# function to build a cast with a long game's artillery
+def _create_large_artillery():
+    """
+    parameters: none
+    return: (tuple) - a cast holding 20,000 artillery actors, and 1,000 more to add
+    purpose: This function builds the state the add_actor case uses.
+    """
+    cast = Cast()
+    for n in range(20000):
+        shot = Actor()
+        shot.set_position(Point(n % globals.COLS, n // globals.COLS).scale(globals.CELL_SIZE))
+        cast.add_actor("artillery", shot)
+    return (cast, [Actor() for n in range(1000)])
+
+# function to build a game part way through
+def _create_busy_game():
+    """
+    parameters: none
+    return: (tuple) - a director and a cast after 100 turns of play
+    purpose: This function builds a screen full of actors for the draw cases.
+    """
+    director, cast = _create_game()
+    for n in range(100):
+        director._fire_shot(cast, Point(n % globals.COLS, n // globals.COLS).scale(globals.CELL_SIZE))
+        director._return_fire(cast)
+    return (director, cast)
+
+# function to build a hinted game with a shot just fired
+def _create_hinted_game():
+    """
+    parameters: none
+    return: (tuple) - a director showing hints, and its cast after 21 turns of play
+    purpose: This function builds one game whose next frame has to bring
+    the hint layer up to date after a shot.
+    """
+    from game.services.video_service import VideoService
+    rng = random.Random(0)
+    video_service = VideoService(globals.CAPTION, globals.MAX_X, globals.MAX_Y, \
+        globals.CELL_SIZE, globals.FRAME_RATE)
+    video_service.open_window()
+    director = Director(None, video_service, rng = rng, hint_service = HintService())
+    cast = create_cast(rng)
+    for n in range(21):
+        director._do_outputs(cast)
+        director._fire_shot(cast, Point(3 * n % globals.COLS, n % (globals.ROWS // 2)).scale(globals.CELL_SIZE))
+        director._return_fire(cast)
+    return (director, cast)
+
+# function to build a game part way through that only redraws on change
+def _create_idle_game():
+    """
+    parameters: none
+    return: (tuple) - an idle director and a cast after 100 turns of play, drawn once
+    purpose: This function builds the state the unchanged frame case uses.
+    """
+    from game.services.video_service import VideoService
+    rng = random.Random(0)
+    video_service = VideoService(globals.CAPTION, globals.MAX_X, globals.MAX_Y, \
+        globals.CELL_SIZE, globals.FRAME_RATE)
+    video_service.open_window()
+    director = Director(None, video_service, rng = rng, idle = True)
+    cast = create_cast(rng)
+    for n in range(100):
+        director._fire_shot(cast, Point(n % globals.COLS, n // globals.COLS).scale(globals.CELL_SIZE))
+        director._return_fire(cast)
+    director._do_outputs(cast)
+    return (director, cast)
+
+# the fleets of the batch engine case, laid out on first use
+_batch_boards = []
+
+# function to build a batch of games with a turn of shots
+def _create_batch():
+    """
+    parameters: none
+    return: (tuple) - a batch engine of 1,000 fresh games, and a shot for each
+    purpose: This function builds the state the batch step case uses. The
+    fleets are laid out once; each run stacks them into a new engine.
+    """
+    rng = random.Random(0)
+    if not _batch_boards:
+        for n in range(1000):
+            fleet = Fleet(Cast(), rng)
+            _batch_boards.append((fleet.get_board("enemy_ships"), fleet.get_board("defense_ships")))
+    engine = BatchEngine(_batch_boards, rng)
+    cells = globals.COLS * (globals.ROWS // 2)
+    return (engine, [rng.randrange(cells) for n in range(engine.get_game_count())])
+
+# function to add many artillery actors
+def _add_artillery(state):
+    """
+    parameters: state (tuple) - a cast and the artillery actors to add
+    return: nothing
+    purpose: This function adds every actor to the cast's artillery group.
+    """
+    cast, shots = state
+    for shot in shots:
+        cast.add_actor("artillery", shot)
+
+# function to draw every actor without layers
+def _draw_all(state):
+    """
+    parameters: state (tuple) - a director and its cast
+    return: nothing
+    purpose: This function draws every actor of the cast in one call.
+    """
+    director, cast = state
+    director._video_service.draw_actors(cast.iter_all_actors())
+
+# function to draw one whole frame
+def _draw_frame(state):
+    """
+    parameters: state (tuple) - a director and its cast
+    return: nothing
+    purpose: This function draws one frame of the game as the director does.
+    """
+    director, cast = state
+    director._do_outputs(cast)
+
+# function to get every case
+def get_cases():
+    """
+    parameters: none
+    return: cases[] (List) - (name, case, setup) for every benchmark
+    purpose: This function lists the benchmark cases in the order they run.
+    """
+    return [
+        ("fleet_init", lambda rng: Fleet(Cast(), rng), lambda: random.Random(0)),
+        ("create_actor_crowded", lambda fleet: fleet._create_actor(2, "lower", globals.GREEN), _create_crowded_fleet),
+        ("do_updates_idle", lambda game: game[0]._do_updates(game[1]), _create_game),
+        ("do_updates_shot", lambda game: game[0]._do_updates(game[1]), _create_game_with_shot),
+        ("return_fire", lambda game: game[0]._return_fire(game[1]), _create_game),
+        ("return_fire_density", lambda game: game[0]._return_fire(game[1]), _create_density_game),
+        ("batch_step_1000", lambda batch: batch[0].step(batch[1]), _create_batch),
+        ("cast_add_actor_large", _add_artillery, _create_large_artillery),
+        ("draw_actors", _draw_all, _create_busy_game),
+        ("do_outputs", _draw_frame, _create_busy_game),
+        ("do_outputs_hint_shot", _draw_frame, _create_hinted_game),
+        ("do_outputs_idle", _draw_frame, _create_idle_game),
+    ]
@@ -0,0 +1,176 @@
+"""
+file: match_load.py
+author: Jerry Lane
+purpose: This file load tests a match server on loopback: thousands of
+simulated players join, play whole matches with random shots, and the
+time from each shot sent to its result arriving is reported.
+"""
+# import modules
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+from game.casting.fleet import Fleet
+from game.services.match_server import MatchServer
+
+# function to play matches as one simulated player
+async def _play(host, port, clock, think, rng, latencies, totals):
+    """
+    parameters: host (String) - the server's address
+                port (int) - the server's port
+                clock (dict) - the players still to join, and the loop times timing starts and
+                    stops at, set once every player has joined its first match
+                think (float) - the average seconds taken to choose each shot
+                rng (Random) - picks the player's shots
+                latencies[] (List) - each timed shot's seconds from sent to result, added to
+                totals (dict) - counts of matches won by sinking the fleet, matches won by the
+                    opponent leaving, errors and failed connections, added to
+    return: nothing
+    purpose: This function plays matches back to back, firing at the cells
+    of the board in a random order, and leaves mid-match once timing stops.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        totals["failed"] += 1
+        _count_player(clock, loop)
+        return
+    joined = False
+    try:
+        while loop.time() < clock["end"]:
+            writer.write(b"JOIN\n")
+            cells = []
+            sent = None
+            timed = False
+            sunk = 0
+            while True:
+                words = (await reader.readline()).split()
+                if not words:
+                    totals["failed"] += not joined
+                    return
+                if words[0] == b"START":
+                    cols, rows = int(words[2]), int(words[3])
+                    cells = [(col, row) for col in range(cols) for row in range(rows)]
+                    rng.shuffle(cells)
+                    if not joined:
+                        joined = True
+                        _count_player(clock, loop)
+                elif words[0] == b"TURN":
+                    if think > 0:
+                        await asyncio.sleep(rng.uniform(0, 2 * think))
+                    if loop.time() >= clock["end"]:
+                        return
+                    col, row = cells.pop()
+                    timed = loop.time() >= clock["start"]
+                    sent = time.perf_counter()
+                    writer.write(b"FIRE %d %d\n" % (col, row))
+                elif words[0] == b"RESULT":
+                    sunk += words[3] == b"SUNK"
+                    if timed:
+                        latencies.append(time.perf_counter() - sent)
+                elif words[0] == b"WIN":
+                    # a match is only finished when every ship was sunk; any other win is a forfeit
+                    totals["matches" if sunk == len(Fleet.SHIP_LENGTHS) else "forfeits"] += 1
+                    break
+                elif words[0] == b"LOSE":
+                    break
+                elif words[0] == b"ERROR":
+                    totals["errors"] += 1
+                    return
+    finally:
+        writer.write(b"QUIT\n")
+        writer.close()
+
+# function to start the clock once every player is in
+def _count_player(clock, loop):
+    """
+    parameters: clock (dict) - the players still to join, and when timing starts and stops
+                loop (AbstractEventLoop) - the running event loop
+    return: nothing
+    purpose: This function counts off one player as joined or failed, and
+    starts timing when none are left, so joining does not count.
+    """
+    clock["waiting"] -= 1
+    if clock["waiting"] == 0:
+        clock["start"] = loop.time()
+        clock["end"] = clock["start"] + clock["seconds"]
+
+# function to run the whole load test
+async def _run(options):
+    """
+    parameters: options (Namespace) - the command line options
+    return: (tuple) - each timed shot's latency, and the totals
+    purpose: This function starts an in-process server unless one was
+    given, then runs every simulated player at once.
+    """
+    server = None
+    host, port = options.host, options.port
+    if port is None:
+        server = MatchServer(host, 0, seed = options.seed)
+        port = await server.start()
+    latencies = []
+    totals = {"matches": 0, "forfeits": 0, "errors": 0, "failed": 0}
+    clock = {"waiting": options.clients, "seconds": options.seconds, "start": math.inf, "end": math.inf}
+    players = [_play(host, port, clock, options.think, random.Random(options.seed * 100003 + n), latencies, totals) \
+        for n in range(options.clients)]
+    await asyncio.gather(*players)
+    if server is not None:
+        await server.close()
+    return (latencies, totals)
+
+# function to make room for every connection
+def _raise_file_limit(count):
+    """
+    parameters: count (int) - the open files needed
+    return: nothing
+    purpose: This function raises the open file limit as far as allowed, if
+    it is below the count needed.
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < count:
+        limit = count if hard == resource.RLIM_INFINITY else min(count, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+
+# load test entry point
+def main(args = None):
+    """
+    parameters: args[] (List) - command line arguments
+    return: (int) - 0 if the 99th percentile latency is within the budget, 1 if otherwise
+    purpose: This function runs the load test and prints the shot latency
+    percentiles and the move rate.
+    """
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks.match_load", \
+        description = "Load test a match server with simulated players.")
+    parser.add_argument("--clients", type = int, default = 2000, help = "simulated players, paired into matches (default: 2000)")
+    parser.add_argument("--seconds", type = float, default = 10.0, help = "seconds of timed play, from when every player has joined (default: 10)")
+    parser.add_argument("--think", type = float, default = 1.0, \
+        help = "average seconds each player takes to choose a shot, 0 to fire at once (default: 1)")
+    parser.add_argument("--host", default = "127.0.0.1", help = "server address (default: 127.0.0.1)")
+    parser.add_argument("--port", type = int, help = "port of a running server (default: start one in this process)")
+    parser.add_argument("--seed", type = int, default = 0, help = "seed for the layouts and shots (default: 0)")
+    parser.add_argument("--budget", type = float, default = 50.0, help = "99th percentile latency allowed, in milliseconds (default: 50)")
+    options = parser.parse_args(args)
+
+    _raise_file_limit(2 * options.clients + 64)
+    latencies, totals = asyncio.run(_run(options))
+    if not latencies:
+        print(f"no shots were timed, {totals['failed']} failed connections")
+        return 1
+    latencies.sort()
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1e3
+    print(f"clients {options.clients}, {totals['matches']} matches finished, {totals['forfeits']} forfeited, {len(latencies)} moves timed in {options.seconds:g} s " \
+        f"({len(latencies) / options.seconds:.0f} moves/s), {totals['errors']} errors, {totals['failed']} failed connections")
+    print(f"shot latency: p50 {percentile(0.50):.2f} ms, p99 {percentile(0.99):.2f} ms, max {latencies[-1] * 1e3:.2f} ms")
+    return 0 if percentile(0.99) <= options.budget and not totals["errors"] and not totals["failed"] else 1
+
+# if this is the main module, run main function
+if __name__ == "__main__":
+    sys.exit(main())
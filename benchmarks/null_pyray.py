@@ -0,0 +1,82 @@
+"""
+file: null_pyray.py
+author: Jerry Lane
+purpose: This module stands in for pyray when benchmarking, so the
+cost of the game's own drawing code can be measured without a window
+or a graphics card. Every drawing call is accepted and does nothing.
+"""
+# import sys to install the module in place of pyray
+import sys
+
+# key codes and colors the services read
+KEY_LEFT = 263
+KEY_RIGHT = 262
+KEY_UP = 265
+KEY_DOWN = 264
+KEY_ENTER = 257
+KEY_F5 = 294
+BLACK = (0, 0, 0, 255)
+BLANK = (0, 0, 0, 0)
+GRAY = (130, 130, 130, 255)
+WHITE = (255, 255, 255, 255)
+
+# counter of calls that would have reached raylib
+calls = 0
+
+# class declaration
+class Texture:
+    """A texture with a size and nothing else."""
+
+    # default constructor
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+# class declaration
+class RenderTexture:
+    """A render texture holding a Texture."""
+
+    # default constructor
+    def __init__(self, width, height):
+        self.texture = Texture(width, height)
+
+# functions standing in for raylib structs and calls
+def Color(red, green, blue, alpha):
+    return (red, green, blue, alpha)
+
+def Rectangle(x, y, width, height):
+    return (x, y, width, height)
+
+def Vector2(x, y):
+    return (x, y)
+
+def load_render_texture(width, height):
+    return RenderTexture(width, height)
+
+def window_should_close():
+    return False
+
+def is_key_down(key):
+    return False
+
+def get_key_pressed():
+    return 0
+
+def _count(*args):
+    global calls
+    calls += 1
+
+init_window = set_target_fps = close_window = _count
+begin_drawing = end_drawing = clear_background = _count
+draw_text = draw_line = draw_rectangle = draw_texture_rec = _count
+begin_texture_mode = end_texture_mode = unload_render_texture = _count
+
+# function to put this module in place of pyray
+def install():
+    """
+    parameters: none
+    return: nothing
+    purpose: This function makes 'import pyray' load this module. It must
+    be called before the services first draw or read the keyboard.
+    """
+    sys.modules["pyray"] = sys.modules[__name__]
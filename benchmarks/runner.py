@@ -0,0 +1,118 @@
+"""
+file: runner.py
+author: Jerry Lane
+purpose: This class times benchmark cases and compares runs against a
+saved baseline.
+"""
+# import modules
+import json
+import platform
+import statistics
+import time
+
+# class declaration
+class Runner:
+    """Times benchmark cases.
+
+    The responsibility of a Runner is to time each case over many iterations, keeping any per
+    iteration setup out of the timing, and to save and compare the results as JSON.
+
+    Attributes:
+        _min_time (float): The least total time, in seconds, to spend timing each case.
+        _min_iterations (int): The least number of iterations to time for each case.
+        _results (dict): The timings of each case { key: name, value: dict of timings }
+    """
+
+    # default constructor
+    def __init__(self, min_time = 0.5, min_iterations = 5):
+        """Constructs a new Runner.
+        
+        Args:
+            min_time (float): The least total time, in seconds, to spend timing each case.
+            min_iterations (int): The least number of iterations to time for each case.
+        """
+        self._min_time = min_time
+        self._min_iterations = min_iterations
+        self._results = {}
+
+    # method to compare the results with a baseline
+    def compare(self, baseline, threshold):
+        """Finds the cases whose median time grew by more than the threshold.
+
+        Args:
+            baseline (dict): A saved run, as written by save.
+            threshold (float): The allowed growth, e.g. 0.25 for 25%.
+
+        Returns:
+            list: (name, baseline seconds, current seconds) for each slower case.
+        """
+        slower = []
+        for name, timing in self._results.items():
+            old = baseline.get("results", {}).get(name)
+            if old is not None and timing["median"] > old["median"] * (1 + threshold):
+                slower.append((name, old["median"], timing["median"]))
+        return slower
+
+    # method to return the results
+    def get_results(self):
+        """Gets the timings of every case run so far.
+
+        Returns:
+            dict: The timings of each case.
+        """
+        return self._results
+
+    # method to time one case
+    def run(self, name, case, setup = None):
+        """Times a case, calling it with the result of setup each iteration. Timing stops once both
+        the least time and least iterations are reached, or, when the setup is slow, once the whole
+        case has taken ten times the least time.
+
+        Args:
+            name (string): The name of the case.
+            case (function): The code to time; given the setup's result, if any.
+            setup (function): Optional untimed code run before each iteration.
+
+        Returns:
+            dict: The 'median', 'mean' and 'min' seconds per iteration, and 'iterations'.
+        """
+        times = []
+        total = 0.0
+        started = time.perf_counter()
+        while len(times) < self._min_iterations or \
+            (total < self._min_time and time.perf_counter() - started < 10 * self._min_time):
+            state = setup() if setup is not None else None
+            start = time.perf_counter()
+            case(state)
+            elapsed = time.perf_counter() - start
+            times.append(elapsed)
+            total += elapsed
+        timing = {
+            "median": statistics.median(times),
+            "mean": statistics.mean(times),
+            "min": min(times),
+            "iterations": len(times),
+        }
+        self._results[name] = timing
+        return timing
+
+    # method to write the results to a file
+    def save(self, path, commit = None):
+        """Writes the results to a JSON file.
+
+        Args:
+            path (string): The file to write.
+            commit (string): An optional label, such as the commit the run was made at.
+
+        Returns:
+            nothing
+        """
+        run = {
+            "commit": commit,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": self._results,
+        }
+        with open(path, "w") as output:
+            json.dump(run, output, indent = 2, sort_keys = True)
@@ -0,0 +1,132 @@
+"""
+file: startup.py
+author: Jerry Lane
+purpose: This file times how long the game takes to start, in fresh
+processes: to the first frame on screen, and to a headless game ready to
+play. It fails if either is over its budget, or if starting headless
+loaded raylib.
+"""
+# import modules
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# the project's root folder, which holds __main__.py
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# a process that runs the game and leaves once the first frame is drawn
+FIRST_FRAME = """
+import os, sys
+sys.path.insert(0, {root!r})
+if {null}:
+    from benchmarks import null_pyray
+    null_pyray.install()
+import pyray
+end_drawing = pyray.end_drawing
+def end_first_frame():
+    end_drawing()
+    print("ready", flush = True)
+    os._exit(0)
+pyray.end_drawing = end_first_frame
+sys.argv = ["battleships", "--seed", "0"]
+path = os.path.join({root!r}, "__main__.py")
+with open(path) as source:
+    exec(compile(source.read(), path, "exec"), {{"__name__": "__main__"}})
+"""
+
+# a process that loads the program as the command line does, then builds a headless game
+HEADLESS = """
+import os, sys
+sys.path.insert(0, {root!r})
+path = os.path.join({root!r}, "__main__.py")
+with open(path) as source:
+    exec(compile(source.read(), path, "exec"), {{"__name__": "battleships"}})
+import random
+from game.casting.game_setup import create_cast
+from game.directing.simulation import Simulation
+from game.services.random_shot_service import RandomShotService
+rng = random.Random(0)
+simulation = Simulation(RandomShotService(random.Random(1)), rng)
+cast = create_cast(rng)
+print("ready", "pyray" in sys.modules, flush = True)
+"""
+
+# function to time one fresh process
+def _time_process(script):
+    """
+    parameters: script (String) - the Python code to run
+    return: (tuple) - the seconds until the process said it was ready, and
+            the rest of its ready line
+    purpose: This function starts a new interpreter and times it from just
+    before it starts to the moment it prints its ready line.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", script], cwd = ROOT, \
+        stdout = subprocess.PIPE, text = True)
+    words = []
+    for line in process.stdout:
+        words = line.split()
+        if words and words[0] == "ready":
+            break
+    elapsed = time.perf_counter() - start
+    process.stdout.close()
+    process.wait()
+    if not words or words[0] != "ready":
+        raise RuntimeError(f"the process ended without getting ready (exit code {process.returncode})")
+    return (elapsed, words[1:])
+
+# startup benchmark entry point
+def main(args = None):
+    """
+    parameters: args[] (List) - command line arguments
+    return: (int) - 0 if both times are within their budgets and headless
+            did not load raylib, 1 if otherwise
+    purpose: This function times several fresh starts of each kind and
+    reports the median and slowest.
+    """
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks.startup", \
+        description = "Time the game's startup to the first frame and to a headless game.")
+    parser.add_argument("--runs", type = int, default = 5, help = "fresh processes to time of each kind (default: 5)")
+    parser.add_argument("--frame-budget", type = float, default = 1000.0, \
+        help = "median milliseconds allowed to the first frame (default: 1000)")
+    parser.add_argument("--headless-budget", type = float, default = 100.0, \
+        help = "median milliseconds allowed to a headless game ready to play (default: 100)")
+    parser.add_argument("--null", action = "store_true", \
+        help = "draw the first frame through the null raylib backend; the default when raylib is not installed")
+    options = parser.parse_args(args)
+
+    # without raylib, time the first frame through the null backend
+    null = options.null
+    if not null:
+        try:
+            import pyray
+        except ImportError:
+            null = True
+
+    # time each kind of start, after one untimed run so compiled files are written
+    failed = False
+    for name, script, budget in (("first frame", FIRST_FRAME, options.frame_budget), \
+            ("headless ready", HEADLESS, options.headless_budget)):
+        script = script.format(root = ROOT, null = null)
+        _time_process(script)
+        times = []
+        for n in range(max(1, options.runs)):
+            elapsed, words = _time_process(script)
+            times.append(elapsed * 1e3)
+        median = statistics.median(times)
+        label = name if name != "first frame" else f"{name} ({'null backend' if null else 'raylib'})"
+        print(f"{label:<28} median {median:8.1f} ms  max {max(times):8.1f} ms  budget {budget:.0f} ms")
+        if median > budget:
+            print(f"OVER BUDGET {name}")
+            failed = True
+        if words == ["True"]:
+            print("headless start loaded raylib")
+            failed = True
+    return 1 if failed else 0
+
+# if this is the main module, run main function
+if __name__ == "__main__":
+    sys.exit(main())
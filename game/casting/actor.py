@@ -20,7 +20,9 @@ class Actor:
         _color (Color): The color of the text.
         _position (Point): The screen coordinates.
         _velocity (Point): The speed and direction.
+        _observers (list): The (observer, group) pairs told when the actor moves or changes.
     """
+    __slots__ = ("_text", "_font_size", "_color", "_position", "_velocity", "_observers")
 
     # default constructor
     def __init__(self):
@@ -37,6 +39,20 @@ class Actor:
         self._color = globals.WHITE
         self._position = Point(0, 0)
         self._velocity = Point(0, 0)
+        self._observers = []
+
+    # method to register an observer of the actor's position
+    def add_observer(self, observer, group):
+        """Registers an observer to be told whenever the actor moves or changes how it looks.
+        
+        Args:
+            observer (Cast): The collection indexing this actor.
+            group (string): The name of the group the actor is indexed under.
+
+        Returns:
+            nothing
+        """
+        self._observers.append((observer, group))
 
     # method to return actor's color
     def get_color(self):
@@ -110,9 +126,26 @@ class Actor:
         Returns:
             nothing
         """
+        # a still actor keeps its position, saving the move and the notices
+        if self._velocity.get_x() == 0 and self._velocity.get_y() == 0:
+            return
         x = (self._position.get_x() + self._velocity.get_x()) % max_x
         y = (self._position.get_y() + self._velocity.get_y()) % max_y
-        self._position = Point(x, y)
+        self.set_position(Point(x, y))
+
+    # method to unregister an observer of the actor's position
+    def remove_observer(self, observer, group):
+        """Stops telling the given observer when the actor moves or changes.
+        
+        Args:
+            observer (Cast): The collection indexing this actor.
+            group (string): The name of the group the actor is indexed under.
+
+        Returns:
+            nothing
+        """
+        if (observer, group) in self._observers:
+            self._observers.remove((observer, group))
 
     # method to set actor's color
     def set_color(self, color):
@@ -125,6 +158,7 @@ class Actor:
             nothing
         """
         self._color = color
+        self._notify_changed()
 
     # method to set actor's position
     def set_position(self, position):
@@ -136,7 +170,11 @@ class Actor:
         Returns: 
             nothing
         """
+        # store the new position, then let any indexes know the actor moved
+        old_position = self._position
         self._position = position
+        for observer, group in self._observers:
+            observer.on_actor_moved(group, self, old_position)
     
     # method to set actor's font size
     def set_font_size(self, font_size):
@@ -149,6 +187,7 @@ class Actor:
             nothing
         """
         self._font_size = font_size
+        self._notify_changed()
     
     # method to set a char as text
     def set_text(self, text):
@@ -161,6 +200,7 @@ class Actor:
             nothing
         """
         self._text = text
+        self._notify_changed()
 
     # method to set the actor's velocity
     def set_velocity(self, velocity):
@@ -172,4 +212,17 @@ class Actor:
         Returns:
             nothing
         """
-        self._velocity = velocity
\ No newline at end of file
+        self._velocity = velocity
+
+    # method to tell observers the actor looks different
+    def _notify_changed(self):
+        """Lets any observers know the actor's text, color or size changed.
+        
+        Args:
+            none
+
+        Returns:
+            nothing
+        """
+        for observer, group in self._observers:
+            observer.on_actor_changed(group, self)
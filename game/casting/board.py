@@ -0,0 +1,637 @@
+"""
+file: board.py
+author: Jerry Lane
+purpose: This class holds one side's ships and shot history as bitboards.
+"""
+# import global values and Point
+import globals
+from game.shared.point import Point
+
+# class declaration
+class Board:
+    """One side of the battlefield, stored as bitboards.
+
+    The responsibility of a Board is to be the record of where one fleet's ships sit and where that
+    side has been shot at. Each grid is a single Python integer with one bit per cell (bit
+    row * cols + col), so hit tests, destroyed checks and tallies are single integer operations.
+    The ship actors are only a view of this record for drawing.
+
+    Attributes:
+        _row_offset (int): The screen row of the board's first row.
+        _cols (int): The number of columns.
+        _rows (int): The number of rows.
+        _occupancy (int): A bit set for every cell holding a ship.
+        _hits (int): A bit set for every cell holding a ship that has been hit.
+        _misses (int): A bit set for every empty cell that has been shot at.
+        _ship_of_cell (dict): The ship number of each ship cell { key: bit index, value: ship number }
+        _ship_sizes (list): The number of sections in each ship.
+        _damage (list): The number of sections hit on each ship.
+        _remaining (int): The number of ship sections not yet hit.
+        _ships_remaining (int): The number of ships with at least one section not yet hit.
+        _target_cells (dict): The cells in each rectangle targets are drawn from { key: bounds, value: list }
+    """
+
+    # default constructor
+    def __init__(self, row_offset, cols = None, rows = None):
+        """Constructs a new, empty Board.
+        
+        Args:
+            row_offset (int): The screen row of the board's first row.
+            cols (int): The number of columns, globals.COLS if not given.
+            rows (int): The number of rows, half of globals.ROWS if not given.
+        """
+        self._row_offset = row_offset
+        self._cols = cols if cols is not None else globals.COLS
+        self._rows = rows if rows is not None else globals.ROWS // 2
+        self._occupancy = 0
+        self._hits = 0
+        self._misses = 0
+        self._ship_of_cell = {}
+        self._ship_sizes = []
+        self._damage = []
+        self._remaining = 0
+        self._ships_remaining = 0
+        self._target_cells = {}
+
+    # method to add a ship to the board
+    def add_ship(self, positions):
+        """Marks the cells at the given positions as holding one ship.
+
+        Args:
+            positions (list): The screen coordinates (Point) of each of the ship's sections.
+
+        Returns:
+            integer: The ship's number on this board.
+        """
+        return self.add_ship_cells([self.get_index(position) for position in positions])
+
+    # method to add a ship to the board by its cells
+    def add_ship_cells(self, cells):
+        """Marks the given cells as holding one ship. Cells that are off the board (None) or
+        already hold a ship are left out.
+
+        Args:
+            cells (list): The bit index of each of the ship's sections.
+
+        Returns:
+            integer: The ship's number on this board.
+        """
+        ship = len(self._ship_sizes)
+        size = 0
+        for index in cells:
+            if index is not None and not self._occupancy >> index & 1:
+                self._occupancy |= 1 << index
+                self._ship_of_cell[index] = ship
+                size += 1
+        self._ship_sizes.append(size)
+        self._damage.append(0)
+        self._remaining += size
+        if size > 0:
+            self._ships_remaining += 1
+        return ship
+
+    # method to find where a ship can go
+    def get_anchors(self, length, vertical, first_col, last_col, first_row, last_row):
+        """Gets every cell a ship of the given length could start from without touching another
+        ship. A cell is a legal anchor when it and the next length - 1 cells (down or across) are
+        all free, which is found by AND-ing the free-cell bitboard with shifted copies of itself.
+
+        Args:
+            length (int): The number of sections in the ship.
+            vertical (bool): True for a north/south ship; False for east/west.
+            first_col (int): The leftmost screen column the ship may start in.
+            last_col (int): The rightmost screen column the ship may start in.
+            first_row (int): The top screen row the ship may start in.
+            last_row (int): The bottom screen row the ship may start in.
+
+        Returns:
+            integer: One bit per legal anchor cell.
+        """
+        # keep only the starts in range whose whole length is free
+        free = ((1 << (self._cols * self._rows)) - 1) & ~self._occupancy
+        step = self._cols if vertical else 1
+        anchors = self.get_starts(length, vertical, first_col, last_col, first_row, last_row) & free
+        for n in range(1, length):
+            anchors &= free >> (n * step)
+        return anchors
+
+    # method to count the ship sections still afloat
+    def count_remaining(self):
+        """Gets the number of ship sections that have not been hit.
+
+        Returns:
+            integer: The number of undamaged ship sections.
+        """
+        return self._remaining
+
+    # method to count the cells missed
+    def count_misses(self):
+        """Gets the number of empty cells that have been shot at.
+
+        Returns:
+            integer: The number of missed cells.
+        """
+        return bin(self._misses).count("1")
+
+    # method to fire at the board
+    def fire(self, position):
+        """Records a shot at the given position.
+
+        Args:
+            position (Point): The screen coordinates of the shot.
+
+        Returns:
+            bool: True if the shot landed on a ship; False if otherwise.
+        """
+        index = self.get_index(position)
+        if index is None:
+            return False
+        bit = 1 << index
+        if self._occupancy & bit:
+            if not self._hits & bit:
+                self._hits |= bit
+                self._record_hit(index)
+            return True
+        self._misses |= bit
+        return False
+
+    # method to list the cells in a rectangle
+    def get_cells(self, first_col, last_col, first_row, last_row):
+        """Gets the bit index of every cell in the given rectangle of screen columns and rows,
+        clipped to the board.
+
+        Args:
+            first_col (int): The leftmost screen column.
+            last_col (int): The rightmost screen column.
+            first_row (int): The top screen row.
+            last_row (int): The bottom screen row.
+
+        Returns:
+            list: The bit indexes, row by row.
+        """
+        cols = range(max(first_col, 0), min(last_col, self._cols - 1) + 1)
+        rows = range(max(first_row - self._row_offset, 0), min(last_row - self._row_offset, self._rows - 1) + 1)
+        return [row * self._cols + col for row in rows for col in cols]
+
+    # method to pick cells to shoot at
+    def draw_targets(self, count, first_col, last_col, first_row, last_row, rng):
+        """Draws the given number of random cells, with repeats, from a rectangle of screen columns
+        and rows. The cells of each rectangle are listed once, so every later volley is a single
+        draw.
+
+        Args:
+            count (int): The number of cells to draw.
+            first_col (int): The leftmost screen column.
+            last_col (int): The rightmost screen column.
+            first_row (int): The top screen row.
+            last_row (int): The bottom screen row.
+            rng (Random): The random number generator to draw with.
+
+        Returns:
+            list: The bit indexes of the cells drawn.
+        """
+        bounds = (first_col, last_col, first_row, last_row)
+        if bounds not in self._target_cells:
+            self._target_cells[bounds] = self.get_cells(*bounds)
+        return rng.choices(self._target_cells[bounds], k = count)
+
+    # method to return the number of columns
+    def get_cols(self):
+        """Gets the number of columns.
+
+        Returns:
+            integer: The number of columns.
+        """
+        return self._cols
+
+    # method to return the damage to one ship
+    def get_damage(self, ship):
+        """Gets the number of sections hit on the given ship.
+
+        Args:
+            ship (int): The ship's number on this board.
+
+        Returns:
+            integer: The number of sections hit.
+        """
+        return self._damage[ship]
+
+    # method to return the hit bitboard
+    def get_hits(self):
+        """Gets the bitboard of ship cells that have been hit.
+
+        Returns:
+            integer: One bit per hit cell.
+        """
+        return self._hits
+
+    # method to convert a position to a bit index
+    def get_index(self, position):
+        """Gets the bit index of the cell holding the given position.
+
+        Args:
+            position (Point): The screen coordinates.
+
+        Returns:
+            integer: The bit index, or None if the position is off this board.
+        """
+        col = int(position.get_x() // globals.CELL_SIZE)
+        row = int(position.get_y() // globals.CELL_SIZE) - self._row_offset
+        if 0 <= col < self._cols and 0 <= row < self._rows:
+            return row * self._cols + col
+        return None
+
+    # method to return the miss bitboard
+    def get_misses(self):
+        """Gets the bitboard of empty cells that have been shot at.
+
+        Returns:
+            integer: One bit per missed cell.
+        """
+        return self._misses
+
+    # method to return the occupancy bitboard
+    def get_occupancy(self):
+        """Gets the bitboard of cells holding a ship.
+
+        Returns:
+            integer: One bit per ship cell.
+        """
+        return self._occupancy
+
+    # method to list the set bits of a bitboard
+    def get_indexes(self, bits):
+        """Yields the index of every set bit, lowest first.
+
+        Args:
+            bits (int): A bitboard.
+
+        Returns:
+            generator: The bit indexes.
+        """
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    # method to find one set bit of a bitboard
+    def get_nth_index(self, bits, n):
+        """Gets the index of the nth set bit (counting from 0, lowest first) by binary searching
+        on the number of set bits below each position.
+
+        Args:
+            bits (int): A bitboard.
+            n (int): Which set bit to find.
+
+        Returns:
+            integer: The bit index.
+        """
+        low = 0
+        high = bits.bit_length()
+        while low < high:
+            middle = (low + high) // 2
+            if bin(bits & ((2 << middle) - 1)).count("1") > n:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    # method to convert a bit index to a position
+    def get_position(self, index):
+        """Gets the screen coordinates of the cell with the given bit index.
+
+        Args:
+            index (int): The bit index.
+
+        Returns:
+            Point: The screen coordinates of the cell.
+        """
+        row, col = divmod(index, self._cols)
+        return Point(col, row + self._row_offset).scale(globals.CELL_SIZE)
+
+    # method to return the screen row of the first row
+    def get_row_offset(self):
+        """Gets the screen row of the board's first row.
+
+        Returns:
+            integer: The row offset.
+        """
+        return self._row_offset
+
+    # method to return the cells of every ship
+    def get_ship_cells(self):
+        """Gets the cells of each ship, by ship number.
+
+        Returns:
+            list: A list of each ship's cell indexes, lowest first.
+        """
+        ships = [[] for size in self._ship_sizes]
+        for index in sorted(self._ship_of_cell):
+            ships[self._ship_of_cell[index]].append(index)
+        return ships
+
+    # method to return the number of ships afloat
+    def get_ships_remaining(self):
+        """Gets the number of ships with at least one section not yet hit.
+
+        Returns:
+            integer: The number of ships afloat.
+        """
+        return self._ships_remaining
+
+    # method to return the ship holding a cell
+    def get_ship(self, index):
+        """Gets the number of the ship holding the cell with the given bit index.
+
+        Args:
+            index (int): The bit index.
+
+        Returns:
+            integer: The ship's number, or None if the cell is empty.
+        """
+        return self._ship_of_cell.get(index)
+
+    # method to return the size of every ship
+    def get_ship_sizes(self):
+        """Gets the number of sections in each ship, by ship number.
+
+        Returns:
+            tuple: The ship sizes.
+        """
+        return tuple(self._ship_sizes)
+
+    # method to find where a ship may start
+    def get_starts(self, length, vertical, first_col, last_col, first_row, last_row):
+        """Gets every cell in the given rectangle a ship of the given length could start from, by
+        the board's edges alone, whatever ships are already on it.
+
+        Args:
+            length (int): The number of sections in the ship.
+            vertical (bool): True for a north/south ship; False for east/west.
+            first_col (int): The leftmost screen column the ship may start in.
+            last_col (int): The rightmost screen column the ship may start in.
+            first_row (int): The top screen row the ship may start in.
+            last_row (int): The bottom screen row the ship may start in.
+
+        Returns:
+            integer: One bit per start cell.
+        """
+        # clip the start range to the board, leaving room for the ship's length
+        first_row = max(first_row - self._row_offset, 0)
+        last_row = min(last_row - self._row_offset, self._rows - (length if vertical else 1))
+        first_col = max(first_col, 0)
+        last_col = min(last_col, self._cols - (1 if vertical else length))
+        if first_row > last_row or first_col > last_col:
+            return 0
+
+        # build the mask of cells the ship may start in
+        row_bits = ((1 << (last_col - first_col + 1)) - 1) << first_col
+        starts = 0
+        for row in range(first_row, last_row + 1):
+            starts |= row_bits << (row * self._cols)
+        return starts
+
+    # method to return the whole shot record
+    def get_state(self):
+        """Gets the occupancy, hit and miss bitboards together.
+
+        Returns:
+            Tuple(int, int, int): The occupancy, hits, and misses.
+        """
+        return (self._occupancy, self._hits, self._misses)
+
+    # method to return the number of rows
+    def get_rows(self):
+        """Gets the number of rows.
+
+        Returns:
+            integer: The number of rows.
+        """
+        return self._rows
+
+    # method to walk the misses in a rectangle
+    def iter_misses(self, first_col, last_col, first_row, last_row):
+        """Yields the bit index of every missed cell in a rectangle of screen columns and rows,
+        reading each row of the rectangle out of the miss bitboard with one shift.
+
+        Args:
+            first_col (int): The leftmost screen column.
+            last_col (int): The rightmost screen column.
+            first_row (int): The top screen row.
+            last_row (int): The bottom screen row.
+
+        Returns:
+            generator: The bit indexes of the missed cells, row by row.
+        """
+        first_col = max(first_col, 0)
+        last_col = min(last_col, self._cols - 1)
+        if first_col > last_col:
+            return
+        mask = (1 << (last_col - first_col + 1)) - 1
+        for row in range(max(first_row - self._row_offset, 0), min(last_row - self._row_offset, self._rows - 1) + 1):
+            start = row * self._cols + first_col
+            bits = self._misses >> start & mask
+            while bits:
+                low = bits & -bits
+                yield start + low.bit_length() - 1
+                bits ^= low
+
+    # method to choose where a ship goes
+    def pick_anchor(self, length, first_col, last_col, first_row, last_row, rng):
+        """Picks, uniformly at random, a free place for a ship of the given length starting in the
+        given rectangle, among every legal start cell in both orientations.
+
+        Args:
+            length (int): The number of sections in the ship.
+            first_col (int): The leftmost screen column the ship may start in.
+            last_col (int): The rightmost screen column the ship may start in.
+            first_row (int): The top screen row the ship may start in.
+            last_row (int): The bottom screen row the ship may start in.
+            rng (Random): The random number generator to pick with.
+
+        Returns:
+            Tuple(bool, int): True for a north/south ship, and the bit index of its first section.
+
+        Raises:
+            ValueError: If the ship cannot fit anywhere.
+        """
+        anchors = [self.get_anchors(length, vertical, first_col, last_col, first_row, last_row) for vertical in (True, False)]
+        counts = [bin(bits).count("1") for bits in anchors]
+        if counts[0] + counts[1] == 0:
+            raise ValueError(f"no room left on the board for a ship of length {length}")
+        choice = rng.randrange(counts[0] + counts[1])
+        if choice < counts[0]:
+            return (True, self.get_nth_index(anchors[0], choice))
+        return (False, self.get_nth_index(anchors[1], choice - counts[0]))
+
+    # method to restore the shot record
+    def set_shots(self, hits, misses):
+        """Replaces the hit and miss bitboards, as when loading a saved game, and recounts the live
+        counters from them. The ships must already have been added.
+
+        Args:
+            hits (int): One bit per ship cell that has been hit.
+            misses (int): One bit per empty cell that has been shot at.
+
+        Returns:
+            nothing
+        """
+        self._hits = hits & self._occupancy
+        self._misses = misses & ~self._occupancy
+        self._damage = [0] * len(self._ship_sizes)
+        self._remaining = sum(self._ship_sizes)
+        self._ships_remaining = sum(1 for size in self._ship_sizes if size > 0)
+        for index in self.get_indexes(self._hits):
+            self._record_hit(index)
+
+    # method to check whether a cell has been hit
+    def is_hit(self, index):
+        """Whether or not the ship section in the cell with the given bit index has been hit.
+
+        Args:
+            index (int): The bit index.
+
+        Returns:
+            bool: True if the cell holds a hit ship section; False if otherwise.
+        """
+        return bool(self._hits >> index & 1)
+
+    # method to check whether a cell has been missed
+    def is_missed(self, index):
+        """Whether or not the empty cell with the given bit index has been shot at.
+
+        Args:
+            index (int): The bit index.
+
+        Returns:
+            bool: True if the cell has been missed; False if otherwise.
+        """
+        return bool(self._misses >> index & 1)
+
+    # method to tell the storage kind
+    def is_sparse(self):
+        """Whether or not the board stores only the cells in use. A Board stores every cell.
+
+        Returns:
+            bool: False.
+        """
+        return False
+
+    # method to check if one ship is gone
+    def is_sunk(self, ship):
+        """Whether or not every section of the given ship has been hit.
+
+        Args:
+            ship (int): The ship's number on this board.
+
+        Returns:
+            bool: True if the ship is sunk; False if otherwise.
+        """
+        return self._damage[ship] == self._ship_sizes[ship]
+
+    # method to check if the fleet is gone
+    def is_destroyed(self):
+        """Whether or not every ship section on the board has been hit.
+
+        Returns:
+            bool: True if no ship section is left; False if otherwise.
+        """
+        return self._remaining == 0
+
+    # method to check a cell for a ship
+    def is_occupied(self, position):
+        """Whether or not a ship section sits at the given position.
+
+        Args:
+            position (Point): The screen coordinates.
+
+        Returns:
+            bool: True if a ship section is there; False if otherwise.
+        """
+        index = self.get_index(position)
+        return index is not None and bool(self._occupancy >> index & 1)
+
+    # method to fire many shots at the board
+    def volley(self, indexes):
+        """Records a batch of shots at once. The shots are gathered into one bitboard and resolved
+        against the occupancy bitboard with a single mask each for hits and misses.
+
+        Args:
+            indexes (list): The bit indexes of the cells shot at; repeats are allowed.
+
+        Returns:
+            Tuple(int, int): The bitboard of ship cells hit, and the bitboard of empty cells
+            missed for the first time.
+        """
+        shots = 0
+        for index in indexes:
+            shots |= 1 << index
+        hits = shots & self._occupancy
+        misses = shots & ~self._occupancy & ~self._misses
+        new_hits = hits & ~self._hits
+        self._hits |= hits
+        self._misses |= misses
+
+        # update the counters for the sections hit for the first time
+        for index in self.get_indexes(new_hits):
+            self._record_hit(index)
+        return (hits, misses)
+
+    # method to update the counters for a hit
+    def _record_hit(self, index):
+        """Updates the live counters for a ship section hit for the first time.
+
+        Args:
+            index (int): The bit index of the section.
+
+        Returns:
+            nothing
+        """
+        ship = self._ship_of_cell[index]
+        self._damage[ship] += 1
+        self._remaining -= 1
+        if self._damage[ship] == self._ship_sizes[ship]:
+            self._ships_remaining -= 1
+
+# board builder function
+def create_board(row_offset, cols = None, rows = None):
+    """
+    parameters: row_offset (int) - the screen row of the board's first row
+                cols (int) - the number of columns, globals.COLS if not given
+                rows (int) - the number of rows, half of globals.ROWS if not given
+    return: (Board or SparseBoard) - an empty board
+    purpose: This function picks the storage for a board by its size: a
+    bitboard Board up to globals.SPARSE_CELLS cells, a SparseBoard above.
+    """
+    from game.casting.sparse_board import SparseBoard
+    cols = cols if cols is not None else globals.COLS
+    rows = rows if rows is not None else globals.ROWS // 2
+    if cols * rows > globals.SPARSE_CELLS:
+        return SparseBoard(row_offset, cols, rows)
+    return Board(row_offset, cols, rows)
+
+# board size reader function
+def parse_board_size(text):
+    """
+    parameters: text (string) - a board size as COLSxROWS, such as 500x300
+    return: (Tuple(int, int)) - the columns and rows of each side's board
+    purpose: This function reads a board size from the command line, and
+    raises ValueError if it is not one the fleets fit on.
+    """
+    cols, separator, rows = text.lower().partition("x")
+    cols, rows = int(cols), int(rows)
+    if not separator or not (globals.VIEW_COLS <= cols <= globals.MAX_BOARD and globals.VIEW_ROWS + 1 <= rows <= globals.MAX_BOARD):
+        raise ValueError(f"board size must be COLSxROWS, from {globals.VIEW_COLS}x{globals.VIEW_ROWS + 1} to {globals.MAX_BOARD}x{globals.MAX_BOARD}")
+    return (cols, rows)
+
+# board size setter function
+def set_board_size(cols, rows):
+    """
+    parameters: cols (int) - the number of columns on each side's board
+                rows (int) - the number of rows on each side's board
+    return: nothing
+    purpose: This function sets the board size every later game is built
+    with. Boards larger than the screen are played through a Camera.
+    """
+    globals.COLS = cols
+    globals.ROWS = rows * 2
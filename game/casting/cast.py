@@ -3,16 +3,27 @@ file: cast.py
 author: authors of rfk and Jerry Lane
 purpose: This class will contain all of the actors in the game.
 """
+# import global values for the grid cell size and chain to walk every group
+import globals
+from itertools import chain
 
 # class declaration
 class Cast:
     """A collection of actors.
 
     The responsibility of a cast is to keep track of a collection of actors. It has methods for 
-    adding, removing and getting them by a group name.
+    adding, removing and getting them by a group name. Each group is a dictionary used as an
+    insertion-ordered set, so membership, adding and removing cost the same however large the
+    group grows, and actors are still drawn in the order they were added. A group can also be
+    given a function that builds its actors the first time the group is read, so a restored game
+    does not build actors before anything looks at them.
 
     Attributes:
-        _actors (dict): A dictionary of actors { key: group_name, value: a list of actors }
+        _actors (dict): A dictionary of actors { key: group_name, value: { key: actor, value: None } }
+        _index (dict): A spatial index { key: group_name, value: { key: grid cell, value: { key: actor, value: None } } }
+        _boards (dict): The bitboard record behind a group of ships { key: group_name, value: a Board }
+        _versions (dict): A counter bumped whenever a group changes { key: group_name, value: int }
+        _builders (dict): The functions building groups not yet read { key: group_name, value: function }
     """
 
     # default constructor
@@ -23,6 +34,10 @@ class Cast:
         returns: nothing
         """
         self._actors = {}
+        self._index = {}
+        self._boards = {}
+        self._versions = {}
+        self._builders = {}
     
     # method to add an actor to the cast
     def add_actor(self, group, actor):
@@ -34,13 +49,63 @@ class Cast:
         Returns:
             nothing
         """
-        # if actor not in actors keys, add it
+        # build the group if it is still to be built, and if actor not in actors keys, add it
+        if self._builders:
+            self._build_group(group)
         if not group in self._actors.keys():
-            self._actors[group] = []
+            self._actors[group] = {}
         
-        # if actor is not in the group, add it
+        # if actor is not in the group, add it and index its position
         if not actor in self._actors[group]:
-            self._actors[group].append(actor)
+            self._actors[group][actor] = None
+            self._index_actor(group, actor)
+            self._bump_version(group)
+
+    def get_actor_at(self, group, point):
+        """Gets the first actor in the given group sitting exactly at the given point.
+        
+        Args:
+            group (string): The name of the group.
+            point (Point): The screen coordinates to look at.
+
+        Returns:
+            Actor: The actor at the point, or None if the cell is empty.
+        """
+        # look up the cell bucket, then confirm the exact position
+        if self._builders:
+            self._build_group(group)
+        cells = self._index.get(group)
+        if cells is None:
+            return None
+        for actor in cells.get(self._get_cell(point), ()):
+            if actor.get_position().equals(point):
+                return actor
+        return None
+
+    def add_board(self, group, board):
+        """Attaches the bitboard record for a group of ships.
+        
+        Args:
+            group (string): The name of the group.
+            board (Board): The board holding the group's ships and shot history.
+        Returns:
+            nothing
+        """
+        self._boards[group] = board
+
+    def add_lazy_actors(self, group, build):
+        """Gives an empty group a function that builds its actors. The function is called the first
+        time the group's actors are read, and the group keeps its place in the drawing order.
+        
+        Args:
+            group (string): The name of the group.
+            build (function): A function returning the group's actors, in order.
+        Returns:
+            nothing
+        """
+        self._actors.setdefault(group, {})
+        self._builders[group] = build
+        self._bump_version(group)
 
     def get_actors(self, group):
         """Gets the actors in the given group.
@@ -55,8 +120,10 @@ class Cast:
         results = []
         
         # if group is in the actors keys, put into list and return
+        if self._builders:
+            self._build_group(group)
         if group in self._actors.keys():
-            results = self._actors[group].copy()
+            results = list(self._actors[group])
         return results
     
     def get_all_actors(self):
@@ -72,10 +139,23 @@ class Cast:
         results = []
 
         # put all actors in the results list
+        for group in list(self._builders):
+            self._build_group(group)
         for group in self._actors:
             results.extend(self._actors[group])
         return results
 
+    def get_board(self, group):
+        """Gets the bitboard record for a group of ships.
+        
+        Args:
+            group (string): The name of the group.
+
+        Returns:
+            Board: The group's board, or None if the group has none.
+        """
+        return self._boards.get(group)
+
     def get_first_actor(self, group):
         """Gets the first actor in the given group.
         
@@ -89,27 +169,107 @@ class Cast:
         result = None
 
         # put first element of group into the result variable and return
+        if self._builders:
+            self._build_group(group)
         if group in self._actors.keys():
-            result = self._actors[group][0]
+            result = next(iter(self._actors[group]), None)
         return result
 
+    def get_groups(self):
+        """Gets the names of the groups in the order they were first added.
+        
+        Returns:
+            List: The group names.
+        """
+        return list(self._actors.keys())
+
+    def get_version(self, group):
+        """Gets a counter that changes whenever the group's actors are added, removed, moved or
+        changed, so that drawings of the group can be cached until it does.
+        
+        Args:
+            group (string): The name of the group.
+            
+        Returns:
+            int: The group's version.
+        """
+        return self._versions.get(group, 0)
+
     def get_second_actor(self, group):
-        """Gets the first actor in the given group.
+        """Gets the second actor in the given group.
         
         Args:
             group (string): The name of the group.
             
         Returns:
-            List: The first actor in the group.
+            List: The second actor in the group.
         """
         # clear result
         result = None
 
         # put second element of group into result variable and return
+        if self._builders:
+            self._build_group(group)
         if group in self._actors.keys():
-            result = self._actors[group][1]
+            actors = iter(self._actors[group])
+            next(actors, None)
+            result = next(actors, None)
         return result
 
+    def iter_actors(self, group):
+        """Gets a live, read-only view of the actors in the given group, without copying them. The
+        view follows later changes to the group, so do not add or remove actors while walking it.
+        
+        Args:
+            group (string): The name of the group.
+
+        Returns:
+            view: The actors in the group, in the order they were added.
+        """
+        if self._builders:
+            self._build_group(group)
+        if group in self._actors:
+            return self._actors[group].keys()
+        return ()
+
+    def iter_all_actors(self):
+        """Gets an iterator over every actor in the cast, group by group, without copying them.
+        
+        Returns:
+            iterator: All of the actors in the cast.
+        """
+        for group in list(self._builders):
+            self._build_group(group)
+        return chain.from_iterable(self._actors.values())
+
+    def on_actor_changed(self, group, actor):
+        """Notes that an actor in the group changed how it looks.
+        
+        Args:
+            group (string): The name of the group the actor is in.
+            actor (Actor): The actor that changed.
+        Returns:
+            nothing
+        """
+        self._bump_version(group)
+
+    def on_actor_moved(self, group, actor, old_position):
+        """Moves an indexed actor from its old grid cell to its new one.
+        
+        Args:
+            group (string): The name of the group the actor is indexed under.
+            actor (Actor): The actor that moved.
+            old_position (Point): Where the actor was before it moved.
+        Returns:
+            nothing
+        """
+        self._bump_version(group)
+        old_cell = self._get_cell(old_position)
+        new_cell = self._get_cell(actor.get_position())
+        if old_cell != new_cell:
+            self._remove_from_cell(group, actor, old_cell)
+            self._index[group].setdefault(new_cell, {})[actor] = None
+
     def remove_actor(self, group, actor):
         """Removes an actor from the given group.
         
@@ -119,6 +279,90 @@ class Cast:
         Returns:
             nothing
         """
-        #if actor is in the group, remove it
-        if group in self._actors:
-            self._actors[group].remove(actor)
\ No newline at end of file
+        #if actor is in the group, remove it and drop it from the index
+        if self._builders:
+            self._build_group(group)
+        if group in self._actors and actor in self._actors[group]:
+            del self._actors[group][actor]
+            self._unindex_actor(group, actor)
+            self._bump_version(group)
+
+    def _build_group(self, group):
+        """Builds the group's actors if it was given a function to build them and has not been
+        read since. The group's version is left as it is, since what it holds has not changed.
+        
+        Args:
+            group (string): The name of the group.
+        Returns:
+            nothing
+        """
+        build = self._builders.pop(group, None)
+        if build is None:
+            return
+        actors = self._actors[group]
+        for actor in build():
+            if not actor in actors:
+                actors[actor] = None
+                self._index_actor(group, actor)
+
+    def _bump_version(self, group):
+        """Moves the group's version on after a change.
+        
+        Args:
+            group (string): The name of the group.
+        Returns:
+            nothing
+        """
+        self._versions[group] = self._versions.get(group, 0) + 1
+
+    def _get_cell(self, point):
+        """Gets the grid cell holding the given point.
+        
+        Args:
+            point (Point): The screen coordinates.
+
+        Returns:
+            tuple(int, int): The column and row of the cell.
+        """
+        return (int(point.get_x() // globals.CELL_SIZE), int(point.get_y() // globals.CELL_SIZE))
+
+    def _index_actor(self, group, actor):
+        """Puts an actor in the spatial index and watches it for moves.
+        
+        Args:
+            group (string): The name of the group.
+            actor (Actor): The actor to index.
+        Returns:
+            nothing
+        """
+        cells = self._index.setdefault(group, {})
+        cells.setdefault(self._get_cell(actor.get_position()), {})[actor] = None
+        actor.add_observer(self, group)
+
+    def _remove_from_cell(self, group, actor, cell):
+        """Takes an actor out of one cell bucket, dropping the bucket when it empties.
+        
+        Args:
+            group (string): The name of the group.
+            actor (Actor): The actor to remove.
+            cell (tuple): The column and row of the cell.
+        Returns:
+            nothing
+        """
+        bucket = self._index[group].get(cell)
+        if bucket is not None and actor in bucket:
+            del bucket[actor]
+            if not bucket:
+                del self._index[group][cell]
+
+    def _unindex_actor(self, group, actor):
+        """Takes an actor out of the spatial index and stops watching it.
+        
+        Args:
+            group (string): The name of the group.
+            actor (Actor): The actor to drop.
+        Returns:
+            nothing
+        """
+        self._remove_from_cell(group, actor, self._get_cell(actor.get_position()))
+        actor.remove_observer(self, group)
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""
+file: density_map.py
+author: Jerry Lane
+purpose: This class counts, for each cell of a board, how many ways the
+fleet's ships could lie across it, given the shots so far.
+"""
+# import the rules ships are laid out by
+from game.casting.fleet import get_ship_bounds
+
+# class declaration
+class DensityMap:
+    """A probability density map of one board, as seen by the side firing at it.
+
+    The responsibility of a DensityMap is to know where the ships on a board could still be, using
+    only what the firing side can see: its own hits and misses, and the sizes of the ships in a
+    fleet, which are the same every game. It never looks at where the ships are or which are sunk.
+    For every ship it keeps the bitboard of places the ship could still start from, and the number
+    of those places covering each cell. The places are found by the rules Fleet lays ships out by,
+    from get_ship_bounds, in either direction.
+
+    The counts are kept bit-sliced: plane n is a bitboard of the cells whose count has bit n set, so
+    adding or taking away a whole bitboard of places is a handful of integer operations. After each
+    shot only the places that a new miss ruled out are taken away.
+
+    Attributes:
+        _board (Board): The board being counted.
+        _cols (int): The number of columns on the board.
+        _hits (int): The hits the counts have taken in.
+        _misses (int): The misses the counts have taken in.
+        _ships (dict): The number of ships of each length { key: length, value: int }
+        _places (dict): The cells each ship could still start from { key: (length, step), value: bitboard }
+        _region (int): The cells any ship could lie on.
+        _planes (list): The bit-sliced count of places covering each cell, lowest bit first.
+        _target_planes (list): The same count over places through a hit, or None until asked for.
+    """
+
+    # default constructor
+    def __init__(self, board):
+        """Constructs a new DensityMap of a board with no shots on it, then takes in any shots
+        already there.
+        
+        Args:
+            board (Board): The board to count.
+        """
+        cols = board.get_cols()
+        self._board = board
+        self._cols = cols
+        self._hits = 0
+        self._misses = 0
+        self._ships = {}
+        self._places = {}
+        self._region = 0
+        self._planes = []
+        self._target_planes = None
+        for size in board.get_ship_sizes():
+            if size > 0:
+                self._ships[size] = self._ships.get(size, 0) + 1
+
+        # every ship starts where Fleet could have started it
+        for length, ships in self._ships.items():
+            bounds = get_ship_bounds(board, length)
+            for step in (1, cols):
+                starts = board.get_starts(length, step != 1, *bounds)
+                self._places[(length, step)] = starts
+                for n in range(length):
+                    self._region |= starts << (n * step)
+                for n in range(ships):
+                    self._add_places(self._planes, starts, length, step)
+        self.update()
+
+    # method to return the board
+    def get_board(self):
+        """Gets the board being counted.
+
+        Returns:
+            Board: The board.
+        """
+        return self._board
+
+    # method to read the counts out
+    def get_counts(self, planes):
+        """Gets the count of every cell from a set of bit-sliced counts.
+
+        Args:
+            planes (list): Counts from get_planes or get_target_planes.
+
+        Returns:
+            list: The count of each cell, by cell index.
+        """
+        counts = [0] * (self._cols * self._board.get_rows())
+        for bit, plane in enumerate(planes):
+            weight = 1 << bit
+            for index in self._board.get_indexes(plane):
+                counts[index] += weight
+        return counts
+
+    # method to return the cells worth firing at
+    def get_open_cells(self):
+        """Gets the cells a ship could lie on that have not been fired at.
+
+        Returns:
+            integer: A bitboard of the open cells.
+        """
+        return self._region & ~(self._hits | self._misses)
+
+    # method to return the counts
+    def get_planes(self):
+        """Gets the bit-sliced count of places covering each cell, over every ship. The list
+        is the map's own; do not change it.
+
+        Returns:
+            list: The bit planes, lowest bit first.
+        """
+        return self._planes
+
+    # method to return the counts around the hits
+    def get_target_planes(self):
+        """Gets the bit-sliced count of places covering each cell, over only the places that run
+        through a hit. It is built the first time it is asked for after a change, and is empty
+        before the first hit.
+
+        Returns:
+            list: The bit planes, lowest bit first.
+        """
+        if self._target_planes is None:
+            self._target_planes = []
+            if self._hits:
+                for (length, step), places in self._places.items():
+                    touching = 0
+                    for n in range(length):
+                        touching |= self._hits >> (n * step)
+                    for n in range(self._ships[length]):
+                        self._add_places(self._target_planes, places & touching, length, step)
+        return self._target_planes
+
+    # method to take in the shots since the last update
+    def update(self):
+        """Takes the new hits and misses on the board into the counts, ruling out only the places
+        through a new miss. Hits rule nothing out, since another ship may lie across the cells
+        around a sunk one.
+
+        Returns:
+            bool: True if there were new shots; False if otherwise.
+        """
+        board = self._board
+        hits = board.get_hits()
+        misses = board.get_misses()
+        new_hits = hits & ~self._hits
+        blocked = misses & ~self._misses
+        if not new_hits and not blocked:
+            return False
+        self._hits = hits
+        self._misses = misses
+        self._target_planes = None
+
+        # rule out every place running through a new miss
+        for (length, step), places in self._places.items():
+            ruled_out = 0
+            for n in range(length):
+                ruled_out |= blocked >> (n * step)
+            ruled_out &= places
+            if ruled_out:
+                self._places[(length, step)] = places & ~ruled_out
+                for n in range(self._ships[length]):
+                    self._subtract_places(self._planes, ruled_out, length, step)
+        return True
+
+    # method to count a bitboard of places
+    def _add_places(self, planes, places, length, step):
+        """Adds one to the count of every cell covered by each of the given places.
+
+        Args:
+            planes (list): The bit-sliced counts.
+            places (int): The cells the places start from.
+            length (int): The length of the ship.
+            step (int): 1 for east/west places, the number of columns for north/south ones.
+
+        Returns:
+            nothing
+        """
+        for n in range(length):
+            carry = places << (n * step)
+            for bit in range(len(planes)):
+                if not carry:
+                    break
+                planes[bit], carry = planes[bit] ^ carry, planes[bit] & carry
+            if carry:
+                planes.append(carry)
+
+    # method to take away a bitboard of places
+    def _subtract_places(self, planes, places, length, step):
+        """Takes one from the count of every cell covered by each of the given places.
+
+        Args:
+            planes (list): The bit-sliced counts.
+            places (int): The cells the places start from; each must have been counted.
+            length (int): The length of the ship.
+            step (int): 1 for east/west places, the number of columns for north/south ones.
+
+        Returns:
+            nothing
+        """
+        for n in range(length):
+            borrow = places << (n * step)
+            for bit in range(len(planes)):
+                if not borrow:
+                    break
+                planes[bit], borrow = planes[bit] ^ borrow, ~planes[bit] & borrow
@@ -7,30 +7,56 @@ the enemy and the defender.
 # import modules
 import globals
 import random
+from itertools import chain
+from game.casting.board import create_board
 from game.casting.cast import Cast
 from game.casting.ship import Ship
 from game.shared.point import Point
 
+# function to find where a fleet's ships may start
+def get_ship_bounds(board, length):
+    """
+    parameters: board (Board) - the board the ship goes on
+                length (int) - the number of sections in the ship
+    return: (tuple) - the first and last screen column, then the first and
+            last screen row, a ship may start in
+    purpose: This function holds the rules ships are laid out by, so
+    anything reasoning about where they could be uses the same ones. Ships
+    start from column 1; on the enemy board, at the top, from row 1, and
+    on the defender's board leaving its last row clear.
+    """
+    first_x = 1
+    last_x = board.get_cols() - length
+    top = board.get_row_offset()
+    if top == 0:
+        return (first_x, last_x, 1, board.get_rows() - 1 - length)
+    return (first_x, last_x, top, top + board.get_rows() - 2 - length)
+
 # class declaration
 class Fleet(Cast):
     """The Fleet class represents all the ships, on both sides.
     Attributes:
-        _fleet{} - holds the fleet (enemy or defender) 
+        _fleet{} - holds the fleet (enemy or defender) as an ordered set of ship tuples
         _built[] - holds the ship being built
         _group - whether enemy or defender
         _length - length of ships
         _text - holds ship text
         _location - determines where the ships is built
         _cast - holds all the actors in the game
-        _creating_ship - flag on whether or not the ship is being built
         _color - fleet base color
+        _boards{} - the board record of each fleet, kept in the parent's board table
+        _rng - the game's random number generator, used to place the ships
     """
 
+    # the length of each ship in a fleet, in the order they are built
+    SHIP_LENGTHS = (7, 6, 5, 4, 3, 2)
+
     # default constructor
-    def __init__(self, cast):
+    def __init__(self, cast, rng = None):
         """This constructs both of the fleets.
 
         parameters: cast (Cast) - holds the entirety of the actors in the game
+                    rng (Random) - the game's random number generator, a new one if not given
         returns: nothing
         """
         # load parent constructor
@@ -44,8 +70,10 @@ class Fleet(Cast):
         self._text = ""
         self._location = 0
         self._cast = cast
-        self._creating_ship = True
         self._color = globals.WHITE
+        self._rng = rng if rng is not None else random.Random()
+        self.add_board("enemy_ships", create_board(0))
+        self.add_board("defense_ships", create_board(globals.ROWS // 2 + 1))
         self._create_fleet("enemy_ships", "upper", globals.RED)
         self._create_fleet("defense_ships", "lower", globals.GREEN)
     
@@ -58,8 +86,8 @@ class Fleet(Cast):
         returns: nothing
         """
         # build six groups of ships of different amounts, store in cast
-        for i in range(7, 1, -1):
-            self._create_actor(i, location, color)
+        for length in self.SHIP_LENGTHS:
+            self._create_actor(length, location, color)
             self.add_actor(group, self._build.copy())  
     
     # create ship group
@@ -72,92 +100,57 @@ class Fleet(Cast):
         """
         # set location, group, length, build, and color
         if location == "upper":
-            self._location = 0
             self._group = "enemy_ships"
         else:
-            self._location = ((globals.MAX_Y - globals.CELL_SIZE) / 2) + globals.CELL_SIZE
             self._group = "defense_ships"
+        board = self.get_board(self._group)
+        self._location = board.get_row_offset()
         self._length = length
         self._build = []
         self._color = color
-        
-        # set absolute bottom of screen that can be used for ship construction
-        max_y = globals.MAX_Y - globals.CELL_SIZE
 
-        # turn on loop
-        self._creating_ship = True
-        
-        # select position of ship construction, if there is a conflict, do it again
-        while self._creating_ship:
-        
-            # assume one pass is all that is needed
-            self._creating_ship = False
-
-            # set limits for ship builds, top for enemy, bottom for defender
-            x = int(random.randint(globals.CELL_SIZE, globals.MAX_X - (self._length * globals.CELL_SIZE)) / globals.CELL_SIZE)
-            if self._location == 0:
-                y = int(random.randint(globals.CELL_SIZE, int(max_y / 2) - globals.CELL_SIZE - (self._length * globals.CELL_SIZE)) / globals.CELL_SIZE)
+        # ask the board for a free anchor within the limits, north/south (0) or east/west (1)
+        vertical, index = board.pick_anchor(self._length, *get_ship_bounds(board, self._length), self._rng)
+        orient = 0 if vertical else 1
+        position = board.get_position(index)
+        x = int(position.get_x() / globals.CELL_SIZE)
+        y = int(position.get_y() / globals.CELL_SIZE)
+        position = Point(x, y)
+
+        # build the ship
+        for n in range (self._length):
+            
+            # scale position according to cell size
+            self._position = position.scale(globals.CELL_SIZE)
+            
+            # declare new ship
+            ship = Ship(self._cast, color)
+
+            # build the fore, aft, and midship
+            ship.set_text("=")
+            if n == 0 and orient == 1:
+                ship.set_text("<")
+            elif n == self._length - 1 and orient == 1:
+                ship.set_text(">")
+            elif n == 0 and orient == 0:
+                ship.set_text("^")
+            elif n == self._length - 1 and orient == 0:
+                ship.set_text("=")
+            
+            # set the ship font size, color, and position 
+            ship.set_font_size(globals.FONT_SIZE)
+            ship.set_position(self._position)
+
+            # add section of ship to the whole
+            self._build.append(ship)
+            
+            # set up for next section build
+            if orient == 0:
+                y += 1
             else:
-                y = int(random.randint(int(max_y / 2) + globals.CELL_SIZE, max_y - globals.CELL_SIZE - (self._length * globals.CELL_SIZE)) / globals.CELL_SIZE)
+                x += 1
             position = Point(x, y)
 
-            # orient the ship north/south (0) or east/west (1)
-            orient = random.randint(0, 1)
-
-            # build the ship
-            for n in range (self._length):
-                
-                # scale position according to cell size
-                self._position = position.scale(globals.CELL_SIZE)
-                
-                # declare new ship
-                ship = Ship(self._cast, color)
-
-                # build the fore, aft, and midship
-                ship.set_text("=")
-                if n == 0 and orient == 1:
-                    ship.set_text("<")
-                elif n == self._length - 1 and orient == 1:
-                    ship.set_text(">")
-                elif n == 0 and orient == 0:
-                    ship.set_text("^")
-                elif n == self._length - 1 and orient == 0:
-                    ship.set_text("=")
-                
-                # set the ship font size, color, and position 
-                ship.set_font_size(globals.FONT_SIZE)
-                ship.set_position(self._position)
-
-                # add section of ship to the whole
-                self._build.append(ship)
-                
-                # set up for next section build
-                if orient == 0:
-                    y += 1
-                else:
-                    x += 1
-                position = Point(x, y)
-
-            # if this isn't the first ship created
-            if self._length != 7:
-                
-                # get appropriate cast members for enemy or defense fleet
-                if self._group == "enemy_ships":
-                    fleet = self.get_actors("enemy_ships")
-                else:
-                    fleet = self.get_actors("defense_ships")
-                
-                # check to see if any ships overlap, if so run this loop again
-                for section in self._build:
-                    for vessel in fleet:
-                        for segment in vessel:
-                            if segment.get_position().equals(section.get_position()):
-                                self._creating_ship = True
-                
-                # if two ships overlapped, erase current ship list, build anew
-                if self._creating_ship:
-                    self._build = []
-
     # add ship to fleet
     def add_actor(self, group, ship):
         """This method adds a ship formation to the group fleet.
@@ -168,11 +161,15 @@ class Fleet(Cast):
         """
         # if group is not in the fleet keys, add it
         if not group in self._fleet.keys():
-            self._fleet[group] = []
+            self._fleet[group] = {}
         
-        # if ship is not already in the fleet group, add it
+        # if ship is not already in the fleet group, add it and index its sections
+        ship = tuple(ship)
         if not ship in self._fleet[group]:
-            self._fleet[group].append(ship)
+            self._fleet[group][ship] = None
+            for section in ship:
+                self._index_actor(group, section)
+            self._boards[group].add_ship([section.get_position() for section in ship])
     
     # method to return the ship list
     def get_actors(self, group):
@@ -185,7 +182,7 @@ class Fleet(Cast):
 
         # if the group is in the fleet keys, put it in the list and return
         if group in self._fleet.keys():
-            results = self._fleet[group].copy()
+            results = list(self._fleet[group])
         return results
 
     # method to get all ships
@@ -204,6 +201,25 @@ class Fleet(Cast):
             results.extend(self._fleet[group])
         return results
 
+    # method to view the ship list
+    def iter_actors(self, group):
+        """This method gets a live, read-only view of the ships in the group fleet, without copying.
+        parameters: group (String) - denotes which fleet to view
+        returns: view - the ship tuples in the group, in the order they were built
+        """
+        if group in self._fleet:
+            return self._fleet[group].keys()
+        return ()
+
+    # method to walk all ships
+    def iter_all_actors(self):
+        """This method gets an iterator over all the ships in the fleets, without copying.
+        
+        parameters: none
+        returns: iterator - every ship tuple in the fleets
+        """
+        return chain.from_iterable(self._fleet.values())
+
     # method to return a ship
     def get_actor(self, group, id):
         """This method will return a specific ship based on group and id.
@@ -212,7 +228,7 @@ class Fleet(Cast):
                     id (int) - holds the element number of the ship
         returns: ship (Ship) - as noted in specified group and id
         """
-        return self._fleet[group][id]
+        return list(self._fleet[group])[id]
 
     # method to return the ship build list
     def get_build(self):
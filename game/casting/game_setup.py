@@ -0,0 +1,148 @@
+"""
+file: game_setup.py
+author: Jerry Lane
+purpose: This file builds the cast of actors for a new game so that the
+windowed game and the headless simulation start from the same setup.
+"""
+# import needed modules for game setup
+import globals
+from game.casting.actor import Actor
+from game.casting.board import create_board
+from game.casting.cast import Cast
+from game.casting.fleet import Fleet
+from game.services.density_volley_service import DensityVolleyService
+from game.services.random_volley_service import RandomVolleyService
+from game.shared.point import Point
+
+# the enemies a game can be played against, by name
+ENEMIES = ("random", "density")
+
+# cast builder function
+def create_cast(rng = None):
+    """
+    parameters: rng (Random) - the game's random number generator, a new one if not given
+    return: cast (Cast) - the banners, cursor, dividers, and both fleets
+    purpose: This function creates and loads the beginning objects
+    needed to run the game.
+    """
+    # create the cast, then the banners, cursor, and dividers
+    cast = Cast()
+    create_banners(cast)
+    create_cursor(cast)
+    create_dividers(cast)
+
+    # create both fleets 
+    ships = Fleet(cast, rng)
+    for enemy in ships.iter_actors("enemy_ships"):
+        for section in enemy:
+            cast.add_actor("enemy_ships", section)
+    for defender in ships.iter_actors("defense_ships"):
+        for section in defender:
+            cast.add_actor("defense_ships", section)
+
+    # hand the fleets' bitboards to the cast, the ship actors are their view
+    cast.add_board("enemy_ships", ships.get_board("enemy_ships"))
+    cast.add_board("defense_ships", ships.get_board("defense_ships"))
+    return cast
+
+# online cast builder function
+def create_online_cast():
+    """
+    parameters: none
+    return: cast (Cast) - the banners, cursor, dividers, and an empty board for each field
+    purpose: This function creates the beginning objects for a game against
+    another person, whose fleets the match server lays out.
+    """
+    cast = Cast()
+    create_banners(cast)
+    create_cursor(cast)
+    create_dividers(cast)
+    cast.add_board("enemy_ships", create_board(0))
+    cast.add_board("defense_ships", create_board(globals.ROWS // 2 + 1))
+    return cast
+
+# banner builder function
+def create_banners(cast):
+    """
+    parameters: cast (Cast) - the cast to add the banners to
+    return: nothing
+    purpose: This function creates the player's and the enemy's message areas.
+    """
+    # create the banners - first the player's message area
+    banner = Actor()
+    banner.set_text(" ")
+    banner.set_font_size(globals.FONT_SIZE)
+    banner.set_color(globals.GREEN)
+    banner.set_position(Point(globals.CELL_SIZE, globals.MAX_Y - globals.CELL_SIZE))
+    cast.add_actor("banners", banner)
+
+    # second - create the enemy banner area
+    banner = Actor()
+    banner.set_text(" ")
+    banner.set_font_size(globals.FONT_SIZE)
+    banner.set_color(globals.RED_BOLD)
+    banner.set_position(Point(globals.MAX_X - (globals.CELL_SIZE * 23), globals.MAX_Y - globals.CELL_SIZE))
+    cast.add_actor("banners", banner)
+
+# cursor builder function
+def create_cursor(cast):
+    """
+    parameters: cast (Cast) - the cast to add the cursor to
+    return: nothing
+    purpose: This function creates the player's targeting cursor.
+    """
+    # create the cursor position in top half of the screen
+    x = int(globals.MAX_X / 2)
+    y = int(globals.MAX_Y / 4)
+    position = Point(x, y)
+
+    # create the cursor itself
+    cursor = Actor()
+    cursor.set_text("+")
+    cursor.set_font_size(globals.FONT_SIZE)
+    cursor.set_color(globals.WHITE)
+    cursor.set_position(position)
+    cast.add_actor("cursors", cursor)
+
+# divider builder function
+def create_dividers(cast):
+    """
+    parameters: cast (Cast) - the cast to add the dividers to
+    return: nothing
+    purpose: This function creates the divider between the enemy field and
+    defense. The dividers are only built when the cast is first drawn.
+    """
+    cast.add_lazy_actors("dividers", build_dividers)
+
+# divider list builder function
+def build_dividers():
+    """
+    parameters: none
+    return: dividers (List) - a divider actor for each cell across the screen
+    purpose: This function builds the row of dividers between the fields.
+    """
+    dividers = []
+    y = int(globals.MAX_Y / 2)
+    for n in range(0, globals.MAX_X, globals.CELL_SIZE):
+        divider = Actor()
+        divider.set_text("-")
+        divider.set_font_size(globals.FONT_SIZE)
+        divider.set_color(globals.YELLOW)
+        divider.set_position(Point(n, y))
+        dividers.append(divider)
+    return dividers
+
+# enemy builder function
+def create_volley_service(enemy, rng):
+    """
+    parameters: enemy (String) - one of ENEMIES: random for scattershot, density
+                    for aiming at the cells most likely to hold a ship
+                rng (Random) - the game's random number generator
+    return: (RandomVolleyService or DensityVolleyService) - the enemy's aim
+    purpose: This function builds the service that aims the enemy's volleys.
+    """
+    if enemy == "density":
+        return DensityVolleyService(rng)
+    if enemy == "random":
+        return RandomVolleyService(rng)
+    raise ValueError(f"unknown enemy: {enemy}")
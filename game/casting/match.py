@@ -0,0 +1,153 @@
+"""
+file: match.py
+author: Jerry Lane
+purpose: This class holds the state of one game between two people:
+a fleet for each, their shots, and whose turn it is.
+"""
+# import global values, the board builder, the fleet layout rules, and Point
+import globals
+from game.casting.board import create_board
+from game.casting.fleet import Fleet, get_ship_bounds
+from game.shared.point import Point
+
+# class declaration
+class Match:
+    """A game between two players.
+
+    The responsibility of a Match is to hold both players' fleets and shot history, take turns, and
+    decide the winner. It keeps no actors: each player's fleet is only a board, laid out by the same
+    rules as the enemy fleet in Fleet, so a server can hold thousands of matches at once. Players
+    are numbered 0 and 1, and cells are given as board columns and rows.
+
+    Attributes:
+        _match_id (int): The match's number.
+        _boards (list): Each player's board, holding their own fleet and the shots at it.
+        _ships (list): Each player's ships as (col, row, length, vertical) tuples.
+        _turn (int): The player whose turn it is.
+        _winner (int): The player who won, or None while the match is on.
+    """
+
+    # default constructor
+    def __init__(self, match_id, rng):
+        """Constructs a new Match, laying out both fleets at random.
+        
+        Args:
+            match_id (int): The match's number.
+            rng (Random): The random number generator to lay out the fleets and pick who starts with.
+        """
+        self._match_id = match_id
+        self._boards = []
+        self._ships = []
+        for player in range(2):
+            board = create_board(0)
+            ships = []
+            for length in Fleet.SHIP_LENGTHS:
+                vertical, index = board.pick_anchor(length, *get_ship_bounds(board, length), rng)
+                step = board.get_cols() if vertical else 1
+                board.add_ship_cells(range(index, index + length * step, step))
+                row, col = divmod(index, board.get_cols())
+                ships.append((col, row, length, vertical))
+            self._boards.append(board)
+            self._ships.append(ships)
+        self._turn = rng.randrange(2)
+        self._winner = None
+
+    # method to fire at the other player's fleet
+    def fire(self, player, col, row):
+        """Fires the given player's shot at a cell of the other player's board, and passes the turn
+        on unless the match is over.
+
+        Args:
+            player (int): The player firing.
+            col (int): The column of the cell.
+            row (int): The row of the cell.
+
+        Returns:
+            string: "MISS", "HIT", or "SUNK" if the hit sank a ship.
+
+        Raises:
+            ValueError: If the match is over, it is not the player's turn, or the cell is off the
+                board or already fired at.
+        """
+        if self._winner is not None:
+            raise ValueError("the match is over")
+        if player != self._turn:
+            raise ValueError("not your turn")
+        board = self._boards[1 - player]
+        position = Point(col, row).scale(globals.CELL_SIZE)
+        index = board.get_index(position)
+        if index is None:
+            raise ValueError("off the board")
+        if board.is_hit(index) or board.is_missed(index):
+            raise ValueError("already fired there")
+
+        # resolve the shot, then see whether it sank a ship or the whole fleet
+        result = "MISS"
+        if board.fire(position):
+            result = "SUNK" if board.is_sunk(board.get_ship(index)) else "HIT"
+            if board.is_destroyed():
+                self._winner = player
+        if self._winner is None:
+            self._turn = 1 - player
+        return result
+
+    # method to end the match early
+    def forfeit(self, player):
+        """Ends the match with the other player as the winner, as when a player leaves.
+
+        Args:
+            player (int): The player giving up.
+
+        Returns:
+            nothing
+        """
+        if self._winner is None:
+            self._winner = 1 - player
+
+    # method to return the match's number
+    def get_id(self):
+        """Gets the match's number.
+
+        Returns:
+            integer: The match's number.
+        """
+        return self._match_id
+
+    # method to return a player's fleet
+    def get_ships(self, player):
+        """Gets the given player's own ships.
+
+        Args:
+            player (int): The player.
+
+        Returns:
+            list: Each ship's first column, first row, length, and whether it runs north/south.
+        """
+        return self._ships[player]
+
+    # method to return the board size
+    def get_size(self):
+        """Gets the size of each player's board.
+
+        Returns:
+            Tuple(int, int): The columns and rows.
+        """
+        return (self._boards[0].get_cols(), self._boards[0].get_rows())
+
+    # method to return whose turn it is
+    def get_turn(self):
+        """Gets the player whose turn it is.
+
+        Returns:
+            integer: 0 or 1.
+        """
+        return self._turn
+
+    # method to return the winner
+    def get_winner(self):
+        """Gets the player who sank the other's whole fleet.
+
+        Returns:
+            integer: 0 or 1, or None while the match is on.
+        """
+        return self._winner
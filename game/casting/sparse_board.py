@@ -0,0 +1,536 @@
+"""
+file: sparse_board.py
+author: Jerry Lane
+purpose: This class holds one side's ships and shot history for very
+large boards, storing only the cells in use.
+"""
+# import global values, re to find the set bytes of a bitboard, and Point
+import globals
+import re
+from game.shared.point import Point
+
+# a byte with at least one bit set
+SET_BYTE = re.compile(b"[^\x00]")
+
+# function to turn cells into a bitboard
+def _to_bitboard(cells):
+    """
+    parameters: cells (iterable) - cell indexes
+    return: (int) - a bitboard with one bit set per cell
+    purpose: This function sets each cell's bit in a byte array and turns
+    the array into an integer once, rather than growing an integer a bit
+    at a time, which costs as much as the integer is long for every cell.
+    """
+    cells = list(cells)
+    if not cells:
+        return 0
+    data = bytearray(max(cells) // 8 + 1)
+    for index in cells:
+        data[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(data, "little")
+
+# function to turn a bitboard into cells
+def _from_bitboard(bits):
+    """
+    parameters: bits (int) - a bitboard
+    return: (generator) - the index of each bit set, lowest first
+    purpose: This function turns the bitboard into bytes once and only
+    looks inside the bytes that have a bit set, so the cost is one pass
+    over the board plus the bits, not one pass over the board per bit.
+    """
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for match in SET_BYTE.finditer(data):
+        byte = data[match.start()]
+        first = match.start() * 8
+        for bit in range(8):
+            if byte >> bit & 1:
+                yield first + bit
+
+# class declaration
+class SparseBoard:
+    """One side of a very large battlefield, stored sparsely.
+
+    The responsibility of a SparseBoard is the same as a Board's, with the same methods, but it
+    keeps sets of the cells holding ships, hit and missed rather than one bit per cell, so its
+    memory and the cost of each shot stay the same however large the board is. Cells are still
+    numbered row * cols + col.
+
+    Attributes:
+        _row_offset (int): The screen row of the board's first row.
+        _cols (int): The number of columns.
+        _rows (int): The number of rows.
+        _ship_of_cell (dict): The ship number of each ship cell { key: cell index, value: ship number }
+        _hits (set): The ship cells that have been hit.
+        _misses (set): The empty cells that have been shot at.
+        _ship_sizes (list): The number of sections in each ship.
+        _damage (list): The number of sections hit on each ship.
+        _remaining (int): The number of ship sections not yet hit.
+        _ships_remaining (int): The number of ships with at least one section not yet hit.
+    """
+
+    # tries at a random place for a ship before giving up
+    PLACEMENT_TRIES = 10000
+
+    # default constructor
+    def __init__(self, row_offset, cols = None, rows = None):
+        """Constructs a new, empty SparseBoard.
+        
+        Args:
+            row_offset (int): The screen row of the board's first row.
+            cols (int): The number of columns, globals.COLS if not given.
+            rows (int): The number of rows, half of globals.ROWS if not given.
+        """
+        self._row_offset = row_offset
+        self._cols = cols if cols is not None else globals.COLS
+        self._rows = rows if rows is not None else globals.ROWS // 2
+        self._ship_of_cell = {}
+        self._hits = set()
+        self._misses = set()
+        self._ship_sizes = []
+        self._damage = []
+        self._remaining = 0
+        self._ships_remaining = 0
+
+    # method to add a ship to the board
+    def add_ship(self, positions):
+        """Marks the cells at the given positions as holding one ship.
+
+        Args:
+            positions (list): The screen coordinates (Point) of each of the ship's sections.
+
+        Returns:
+            integer: The ship's number on this board.
+        """
+        return self.add_ship_cells([self.get_index(position) for position in positions])
+
+    # method to add a ship to the board by its cells
+    def add_ship_cells(self, cells):
+        """Marks the given cells as holding one ship. Cells that are off the board (None) or
+        already hold a ship are left out.
+
+        Args:
+            cells (list): The cell index of each of the ship's sections.
+
+        Returns:
+            integer: The ship's number on this board.
+        """
+        ship = len(self._ship_sizes)
+        size = 0
+        for index in cells:
+            if index is not None and index not in self._ship_of_cell:
+                self._ship_of_cell[index] = ship
+                size += 1
+        self._ship_sizes.append(size)
+        self._damage.append(0)
+        self._remaining += size
+        if size > 0:
+            self._ships_remaining += 1
+        return ship
+
+    # method to count the ship sections still afloat
+    def count_remaining(self):
+        """Gets the number of ship sections that have not been hit.
+
+        Returns:
+            integer: The number of undamaged ship sections.
+        """
+        return self._remaining
+
+    # method to count the cells missed
+    def count_misses(self):
+        """Gets the number of empty cells that have been shot at.
+
+        Returns:
+            integer: The number of missed cells.
+        """
+        return len(self._misses)
+
+    # method to pick cells to shoot at
+    def draw_targets(self, count, first_col, last_col, first_row, last_row, rng):
+        """Draws the given number of random cells, with repeats, from a rectangle of screen columns
+        and rows, without ever listing the rectangle's cells.
+
+        Args:
+            count (int): The number of cells to draw.
+            first_col (int): The leftmost screen column.
+            last_col (int): The rightmost screen column.
+            first_row (int): The top screen row.
+            last_row (int): The bottom screen row.
+            rng (Random): The random number generator to draw with.
+
+        Returns:
+            list: The cell indexes drawn.
+        """
+        first_col = max(first_col, 0)
+        last_col = min(last_col, self._cols - 1)
+        first_row = max(first_row - self._row_offset, 0)
+        last_row = min(last_row - self._row_offset, self._rows - 1)
+        if first_col > last_col or first_row > last_row:
+            return []
+        return [rng.randint(first_row, last_row) * self._cols + rng.randint(first_col, last_col) for n in range(count)]
+
+    # method to fire at the board
+    def fire(self, position):
+        """Records a shot at the given position.
+
+        Args:
+            position (Point): The screen coordinates of the shot.
+
+        Returns:
+            bool: True if the shot landed on a ship; False if otherwise.
+        """
+        index = self.get_index(position)
+        if index is None:
+            return False
+        if index in self._ship_of_cell:
+            if index not in self._hits:
+                self._hits.add(index)
+                self._record_hit(index)
+            return True
+        self._misses.add(index)
+        return False
+
+    # method to return the number of columns
+    def get_cols(self):
+        """Gets the number of columns.
+
+        Returns:
+            integer: The number of columns.
+        """
+        return self._cols
+
+    # method to return the damage to one ship
+    def get_damage(self, ship):
+        """Gets the number of sections hit on the given ship.
+
+        Args:
+            ship (int): The ship's number on this board.
+
+        Returns:
+            integer: The number of sections hit.
+        """
+        return self._damage[ship]
+
+    # method to convert a position to a cell index
+    def get_index(self, position):
+        """Gets the index of the cell holding the given position.
+
+        Args:
+            position (Point): The screen coordinates.
+
+        Returns:
+            integer: The cell index, or None if the position is off this board.
+        """
+        col = int(position.get_x() // globals.CELL_SIZE)
+        row = int(position.get_y() // globals.CELL_SIZE) - self._row_offset
+        if 0 <= col < self._cols and 0 <= row < self._rows:
+            return row * self._cols + col
+        return None
+
+    # method to walk a set of cells
+    def get_indexes(self, cells):
+        """Yields the index of every cell in the given collection, lowest first.
+
+        Args:
+            cells (iterable): Cell indexes, as returned by volley.
+
+        Returns:
+            generator: The cell indexes.
+        """
+        yield from sorted(cells)
+
+    # method to convert a cell index to a position
+    def get_position(self, index):
+        """Gets the screen coordinates of the cell with the given index.
+
+        Args:
+            index (int): The cell index.
+
+        Returns:
+            Point: The screen coordinates of the cell.
+        """
+        row, col = divmod(index, self._cols)
+        return Point(col, row + self._row_offset).scale(globals.CELL_SIZE)
+
+    # method to return the screen row of the first row
+    def get_row_offset(self):
+        """Gets the screen row of the board's first row.
+
+        Returns:
+            integer: The row offset.
+        """
+        return self._row_offset
+
+    # method to return the number of rows
+    def get_rows(self):
+        """Gets the number of rows.
+
+        Returns:
+            integer: The number of rows.
+        """
+        return self._rows
+
+    # method to return the ship holding a cell
+    def get_ship(self, index):
+        """Gets the number of the ship holding the cell with the given index.
+
+        Args:
+            index (int): The cell index.
+
+        Returns:
+            integer: The ship's number, or None if the cell is empty.
+        """
+        return self._ship_of_cell.get(index)
+
+    # method to return the cells of every ship
+    def get_ship_cells(self):
+        """Gets the cells of each ship, by ship number.
+
+        Returns:
+            list: A list of each ship's cell indexes, lowest first.
+        """
+        ships = [[] for size in self._ship_sizes]
+        for index in sorted(self._ship_of_cell):
+            ships[self._ship_of_cell[index]].append(index)
+        return ships
+
+    # method to return the number of ships afloat
+    def get_ships_remaining(self):
+        """Gets the number of ships with at least one section not yet hit.
+
+        Returns:
+            integer: The number of ships afloat.
+        """
+        return self._ships_remaining
+
+    # method to return the size of every ship
+    def get_ship_sizes(self):
+        """Gets the number of sections in each ship, by ship number.
+
+        Returns:
+            tuple: The ship sizes.
+        """
+        return tuple(self._ship_sizes)
+
+    # method to return the shot record as cells
+    def get_shot_cells(self):
+        """Gets the cells hit and missed, lowest first, without building bitboards as large as
+        the board as get_state does.
+
+        Returns:
+            Tuple(list, list): The hit cells, and the missed cells.
+        """
+        return (sorted(self._hits), sorted(self._misses))
+
+    # method to return the whole shot record
+    def get_state(self):
+        """Gets the occupancy, hits and misses as bitboards, as a Board would. This builds integers
+        as large as the board, so it is for saving and checking games, not for play.
+
+        Returns:
+            Tuple(int, int, int): The occupancy, hits, and misses.
+        """
+        return tuple(_to_bitboard(cells) for cells in (self._ship_of_cell, self._hits, self._misses))
+
+    # method to check whether a cell has been hit
+    def is_hit(self, index):
+        """Whether or not the ship section in the cell with the given index has been hit.
+
+        Args:
+            index (int): The cell index.
+
+        Returns:
+            bool: True if the cell holds a hit ship section; False if otherwise.
+        """
+        return index in self._hits
+
+    # method to check whether a cell has been missed
+    def is_missed(self, index):
+        """Whether or not the empty cell with the given index has been shot at.
+
+        Args:
+            index (int): The cell index.
+
+        Returns:
+            bool: True if the cell has been missed; False if otherwise.
+        """
+        return index in self._misses
+
+    # method to tell the storage kind
+    def is_sparse(self):
+        """Whether or not the board stores only the cells in use.
+
+        Returns:
+            bool: True.
+        """
+        return True
+
+    # method to check if one ship is gone
+    def is_sunk(self, ship):
+        """Whether or not every section of the given ship has been hit.
+
+        Args:
+            ship (int): The ship's number on this board.
+
+        Returns:
+            bool: True if the ship is sunk; False if otherwise.
+        """
+        return self._damage[ship] == self._ship_sizes[ship]
+
+    # method to check if the fleet is gone
+    def is_destroyed(self):
+        """Whether or not every ship section on the board has been hit.
+
+        Returns:
+            bool: True if no ship section is left; False if otherwise.
+        """
+        return self._remaining == 0
+
+    # method to check a cell for a ship
+    def is_occupied(self, position):
+        """Whether or not a ship section sits at the given position.
+
+        Args:
+            position (Point): The screen coordinates.
+
+        Returns:
+            bool: True if a ship section is there; False if otherwise.
+        """
+        return self.get_index(position) in self._ship_of_cell
+
+    # method to walk the misses in a rectangle
+    def iter_misses(self, first_col, last_col, first_row, last_row):
+        """Yields the index of every missed cell in a rectangle of screen columns and rows, looking
+        up each cell of the rectangle, or each miss if there are fewer of them.
+
+        Args:
+            first_col (int): The leftmost screen column.
+            last_col (int): The rightmost screen column.
+            first_row (int): The top screen row.
+            last_row (int): The bottom screen row.
+
+        Returns:
+            generator: The indexes of the missed cells, row by row.
+        """
+        first_col = max(first_col, 0)
+        last_col = min(last_col, self._cols - 1)
+        first_row = max(first_row - self._row_offset, 0)
+        last_row = min(last_row - self._row_offset, self._rows - 1)
+        if first_col > last_col or first_row > last_row:
+            return
+        if len(self._misses) < (last_col - first_col + 1) * (last_row - first_row + 1):
+            for index in sorted(self._misses):
+                row, col = divmod(index, self._cols)
+                if first_row <= row <= last_row and first_col <= col <= last_col:
+                    yield index
+            return
+        for row in range(first_row, last_row + 1):
+            for index in range(row * self._cols + first_col, row * self._cols + last_col + 1):
+                if index in self._misses:
+                    yield index
+
+    # method to choose where a ship goes
+    def pick_anchor(self, length, first_col, last_col, first_row, last_row, rng):
+        """Picks a free place for a ship of the given length starting in the given rectangle, by
+        trying random places. On a board this large the fleet covers so little of it that the
+        first try almost always fits.
+
+        Args:
+            length (int): The number of sections in the ship.
+            first_col (int): The leftmost screen column the ship may start in.
+            last_col (int): The rightmost screen column the ship may start in.
+            first_row (int): The top screen row the ship may start in.
+            last_row (int): The bottom screen row the ship may start in.
+            rng (Random): The random number generator to pick with.
+
+        Returns:
+            Tuple(bool, int): True for a north/south ship, and the cell index of its first section.
+
+        Raises:
+            ValueError: If no free place was found.
+        """
+        for n in range(self.PLACEMENT_TRIES):
+            vertical = rng.randrange(2) == 0
+            first = max(first_row - self._row_offset, 0)
+            last = min(last_row - self._row_offset, self._rows - (length if vertical else 1))
+            right = min(last_col, self._cols - (1 if vertical else length))
+            if first > last or max(first_col, 0) > right:
+                continue
+            index = rng.randint(first, last) * self._cols + rng.randint(max(first_col, 0), right)
+            step = self._cols if vertical else 1
+            if all(index + n * step not in self._ship_of_cell for n in range(length)):
+                return (vertical, index)
+        raise ValueError(f"no room left on the board for a ship of length {length}")
+
+    # method to restore the shot record
+    def set_shots(self, hits, misses):
+        """Replaces the hits and misses, as when loading a saved game, and recounts the live
+        counters from them. The ships must already have been added.
+
+        Args:
+            hits (int): A bitboard with one bit per ship cell that has been hit.
+            misses (int): A bitboard with one bit per empty cell that has been shot at.
+
+        Returns:
+            nothing
+        """
+        self.set_shot_cells(_from_bitboard(hits), _from_bitboard(misses))
+
+    # method to restore the shot record from cells
+    def set_shot_cells(self, hits, misses):
+        """Replaces the hits and misses with the given cells, as set_shots does with bitboards.
+
+        Args:
+            hits (iterable): The index of each ship cell that has been hit.
+            misses (iterable): The index of each empty cell that has been shot at.
+
+        Returns:
+            nothing
+        """
+        self._hits = set()
+        self._misses = set()
+        self._damage = [0] * len(self._ship_sizes)
+        self._remaining = sum(self._ship_sizes)
+        self._ships_remaining = sum(1 for size in self._ship_sizes if size > 0)
+        for index in hits:
+            if index in self._ship_of_cell and index not in self._hits:
+                self._hits.add(index)
+                self._record_hit(index)
+        for index in misses:
+            if index not in self._ship_of_cell and 0 <= index < self._cols * self._rows:
+                self._misses.add(index)
+
+    # method to fire many shots at the board
+    def volley(self, indexes):
+        """Records a batch of shots at once.
+
+        Args:
+            indexes (list): The cell indexes shot at; repeats are allowed.
+
+        Returns:
+            Tuple(set, set): The ship cells hit, and the empty cells missed for the first time.
+        """
+        shots = set(indexes)
+        hits = {index for index in shots if index in self._ship_of_cell}
+        misses = shots - hits - self._misses
+        for index in hits - self._hits:
+            self._hits.add(index)
+            self._record_hit(index)
+        self._misses |= misses
+        return (hits, misses)
+
+    # method to update the counters for a hit
+    def _record_hit(self, index):
+        """Updates the live counters for a ship section hit for the first time.
+
+        Args:
+            index (int): The cell index of the section.
+
+        Returns:
+            nothing
+        """
+        ship = self._ship_of_cell[index]
+        self._damage[ship] += 1
+        self._remaining -= 1
+        if self._damage[ship] == self._ship_sizes[ship]:
+            self._ships_remaining -= 1
@@ -0,0 +1,198 @@
+"""
+file: batch_engine.py
+author: Jerry Lane
+purpose: This class plays thousands of games side by side, holding every
+game's boards stacked into a few integers and moving them all in one step.
+"""
+# import modules
+from array import array
+from collections import Counter
+from itertools import chain, repeat
+from operator import add, floordiv, mul, rshift
+
+# class declaration
+class BatchEngine:
+    """Many games played at once.
+
+    The responsibility of a BatchEngine is to play a whole batch of games a turn at a time, by the
+    Director's rules: the player fires one shot, then the enemy returns a volley of 75% of its
+    undamaged sections (all of them below 2), drawn at random with repeats from defender territory,
+    and a game ends when either side has no undamaged sections left.
+
+    No actors or boards are kept per game. The cells of every game are numbered in one run, game
+    after game (game * cells + board index), so each side's ship cells still afloat are one set. A
+    shot at a cell already fired at changes nothing, so no shot history is needed. A turn is then a
+    few bulk operations over the whole batch: every shot of every game is drawn from one block of
+    random bits and checked against the afloat set in a single intersection. Only the games a shot
+    hit are counted one by one.
+
+    Attributes:
+        _cells (int): The number of cells on each board.
+        _games (int): The number of games.
+        _rng (Random): The random number generator the volleys are drawn with.
+        _targets (list): The defense board cells volleys are drawn from.
+        _volley_sizes (list): The volley fired back for each number of undamaged enemy sections.
+        _enemy_afloat (set): The enemy fleets' cells not yet hit.
+        _defense_afloat (set): The player's fleets' cells not yet hit.
+        _enemy_remaining (list): Each game's undamaged enemy sections.
+        _defense_remaining (list): Each game's undamaged defense sections.
+        _turns (list): Each game's turns played.
+        _live (list): The games still on, in order.
+    """
+
+    # default constructor
+    def __init__(self, boards, rng):
+        """Constructs a new BatchEngine from each game's boards, which must be dense and all the same
+        size. The boards are only read, and may have shots on them already.
+
+        Args:
+            boards (list): Each game's enemy and defense Board, as a pair.
+            rng (Random): The random number generator to draw the volleys with.
+        """
+        enemy, defense = boards[0]
+        first_row = defense.get_row_offset()
+        self._cells = defense.get_cols() * defense.get_rows()
+        self._games = len(boards)
+        self._rng = rng
+        self._targets = defense.get_cells(1, defense.get_cols() - 1, first_row, first_row + defense.get_rows() - 2)
+        self._enemy_afloat = self._stack(board for board, other in boards)
+        self._defense_afloat = self._stack(board for other, board in boards)
+        self._enemy_remaining = [board.count_remaining() for board, other in boards]
+        self._defense_remaining = [board.count_remaining() for other, board in boards]
+        self._volley_sizes = [count if count < 2 else int(count * .75) for count in range(max(self._enemy_remaining) + 1)]
+        self._turns = [0] * self._games
+        self._live = [game for game in range(self._games) if self._enemy_remaining[game] and self._defense_remaining[game]]
+
+    # method to return the number of games
+    def get_game_count(self):
+        """Gets the number of games in the batch.
+
+        Returns:
+            integer: The number of games.
+        """
+        return self._games
+
+    # method to return one game's turns
+    def get_turns(self, game):
+        """Gets the number of turns one game has played.
+
+        Args:
+            game (int): The game's number.
+
+        Returns:
+            integer: The turns played.
+        """
+        return self._turns[game]
+
+    # method to return who won one game
+    def get_winner(self, game):
+        """Gets who won one game.
+
+        Args:
+            game (int): The game's number.
+
+        Returns:
+            string: "player" or "enemy", or None while the game is on.
+        """
+        if self._enemy_remaining[game] == 0:
+            return "player"
+        if self._defense_remaining[game] == 0:
+            return "enemy"
+        return None
+
+    # method to play one turn of every game
+    def step(self, shots):
+        """Plays one turn of every game still on: each player's shot, then each enemy volley.
+
+        Args:
+            shots (list): The enemy board cell index each game's player fires at this turn, by
+                game number; None for a game that does not move this turn.
+
+        Returns:
+            list: The games that ended this turn, in order.
+
+        Raises:
+            ValueError: If a shot is not a cell of the enemy board, before any game moves.
+        """
+        cells = self._cells
+        live = [game for game in self._live if shots[game] is not None]
+        aimed = list(map(shots.__getitem__, live))
+        if aimed and (min(aimed) < 0 or max(aimed) >= cells):
+            game = next(game for game in live if not 0 <= shots[game] < cells)
+            raise ValueError(f"game {game} fired at cell {shots[game]}, off its board of {cells} cells")
+        for game in live:
+            self._turns[game] += 1
+
+        # the players' shots
+        fired = list(map(add, map(mul, live, repeat(cells)), aimed))
+        ended = self._resolve(fired, self._enemy_afloat, self._enemy_remaining)
+
+        # the enemy volleys, sized by what the players' shots left afloat
+        sizes = list(map(self._volley_sizes.__getitem__, map(self._enemy_remaining.__getitem__, live)))
+        firsts = chain.from_iterable(map(repeat, map(mul, live, repeat(cells)), sizes))
+        fired = list(map(add, firsts, self._draw(sum(sizes))))
+        ended |= self._resolve(fired, self._defense_afloat, self._defense_remaining)
+
+        # take the ended games out
+        if ended:
+            self._live = [game for game in self._live if game not in ended]
+        return sorted(ended)
+
+    # method to draw volley targets
+    def _draw(self, count):
+        """Draws the given number of volley targets at random, with repeats, from one block of
+        random bits. Each target is a random machine word scaled to the number of target cells, so
+        no Python code runs per shot and the bias is far under one in a million.
+
+        Args:
+            count (int): The number of shots.
+
+        Returns:
+            iterator: The board index of each shot's cell.
+        """
+        words = array("L")
+        size = words.itemsize
+        if count > 0:
+            words.frombytes(self._rng.getrandbits(8 * size * count).to_bytes(size * count, "little"))
+        scaled = map(rshift, map(mul, words, repeat(len(self._targets))), repeat(8 * size))
+        return map(self._targets.__getitem__, scaled)
+
+    # method to resolve a batch of shots at one side
+    def _resolve(self, fired, afloat, remaining):
+        """Checks a batch of shots against one side's afloat set in one intersection and takes the
+        new hits off each game's count of undamaged sections. Only the games with a new hit are
+        looked at one by one.
+
+        Args:
+            fired (list): The cell of each shot, numbered across the batch; repeats are allowed.
+            afloat (set): The side's ship cells not yet hit, updated in place.
+            remaining (list): Each game's undamaged sections, updated in place.
+
+        Returns:
+            set: The games left with no undamaged sections.
+        """
+        hits = afloat.intersection(fired)
+        afloat -= hits
+        ended = set()
+        for game, count in Counter(map(floordiv, hits, repeat(self._cells))).items():
+            remaining[game] -= count
+            if remaining[game] == 0:
+                ended.add(game)
+        return ended
+
+    # method to stack one side of every game
+    def _stack(self, boards):
+        """Numbers the cells of one side of every game in one run and gathers its ship cells afloat.
+
+        Args:
+            boards (iterable): Each game's board for the side, in order.
+
+        Returns:
+            set: The ship cells not yet hit.
+        """
+        afloat = set()
+        for game, board in enumerate(boards):
+            first = game * self._cells
+            occupancy, hits, misses = board.get_state()
+            afloat.update(first + index for index in board.get_indexes(occupancy & ~hits))
+        return afloat
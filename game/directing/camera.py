@@ -0,0 +1,130 @@
+"""
+file: camera.py
+author: Jerry Lane
+purpose: This class scrolls a window over the enemy and defense fields
+when the board is too large to fit on the screen.
+"""
+# import global values and Point
+import globals
+from game.shared.point import Point
+
+# class declaration
+class Camera:
+    """A scrolling view of both fields.
+
+    The responsibility of a Camera is to choose which part of a large board is on screen, and to
+    turn board cells into screen positions. Both fields scroll together: the enemy field is drawn
+    in the top window and the defense field in the bottom one, each showing the same columns and
+    rows of its own board, so drawing costs the same however large the board is.
+
+    Attributes:
+        _view_cols (int): The number of columns in each window.
+        _view_rows (int): The number of rows in each window.
+        _margin (int): How close, in cells, the cursor may come to a window edge before it scrolls.
+        _col (int): The board column shown at the left of each window.
+        _row (int): The board row shown at the top of each window.
+    """
+
+    # default constructor
+    def __init__(self, view_cols = None, view_rows = None, margin = 3):
+        """Constructs a new Camera looking at the top left corner of both fields.
+        
+        Args:
+            view_cols (int): The number of columns in each window, globals.VIEW_COLS if not given.
+            view_rows (int): The number of rows in each window, globals.VIEW_ROWS if not given.
+            margin (int): How close the cursor may come to a window edge before it scrolls.
+        """
+        self._view_cols = view_cols if view_cols is not None else globals.VIEW_COLS
+        self._view_rows = view_rows if view_rows is not None else globals.VIEW_ROWS
+        self._margin = margin
+        self._col = 0
+        self._row = 0
+
+    # method to keep a cell in view
+    def follow(self, position, cols, rows):
+        """Scrolls as little as possible to keep the cell holding the given position inside the
+        windows, away from their edges, without scrolling past the edges of the board.
+
+        Args:
+            position (Point): The position to keep in view, in enemy board coordinates.
+            cols (int): The number of columns on the board.
+            rows (int): The number of rows on the board.
+
+        Returns:
+            nothing
+        """
+        col = int(position.get_x() // globals.CELL_SIZE)
+        row = int(position.get_y() // globals.CELL_SIZE)
+        self._col = self._scroll(self._col, col, self._view_cols, cols)
+        self._row = self._scroll(self._row, row, self._view_rows, rows)
+
+    # method to return the left column
+    def get_col(self):
+        """Gets the board column shown at the left of each window.
+
+        Returns:
+            integer: The column.
+        """
+        return self._col
+
+    # method to return the top row
+    def get_row(self):
+        """Gets the board row shown at the top of each window.
+
+        Returns:
+            integer: The row.
+        """
+        return self._row
+
+    # method to return the cells in view
+    def get_bounds(self, board):
+        """Gets the rectangle of the given board inside the window, in the screen columns and rows
+        the board's methods take.
+
+        Args:
+            board (Board or SparseBoard): The board being drawn.
+
+        Returns:
+            Tuple(int, int, int, int): The first and last column, and the first and last row.
+        """
+        first_row = board.get_row_offset() + self._row
+        return (self._col, self._col + self._view_cols - 1, first_row, first_row + self._view_rows - 1)
+
+    # method to place a board cell on screen
+    def to_screen(self, board, index, top):
+        """Gets the screen position of a board cell.
+
+        Args:
+            board (Board or SparseBoard): The board the cell is on.
+            index (int): The cell index.
+            top (int): The screen row of the top of the board's window.
+
+        Returns:
+            Point: The screen coordinates of the cell, or None if it is outside the window.
+        """
+        row, col = divmod(index, board.get_cols())
+        col -= self._col
+        row -= self._row
+        if 0 <= col < self._view_cols and 0 <= row < self._view_rows:
+            return Point(col, row + top).scale(globals.CELL_SIZE)
+        return None
+
+    # method to scroll along one axis
+    def _scroll(self, start, cell, view, size):
+        """Works out the new first cell shown along one axis.
+
+        Args:
+            start (int): The first cell shown now.
+            cell (int): The cell to keep in view.
+            view (int): The number of cells in the window.
+            size (int): The number of cells on the board.
+
+        Returns:
+            integer: The first cell to show.
+        """
+        margin = min(self._margin, (view - 1) // 2)
+        if cell < start + margin:
+            start = cell - margin
+        elif cell > start + view - 1 - margin:
+            start = cell - view + 1 + margin
+        return max(0, min(start, size - view))
@@ -3,10 +3,17 @@ file: director.py
 author: author of rfk and Jerry Lane
 purpose: This class directs the game action.
 """
-# import the global values, the Point class, and the Actor class
+# import the global values, random, time, deque, the Point class, the Actor class, the Camera class, and the GameResult class
 import globals
+import random
+import sys
+import time
+from collections import deque
 from game.shared.point import Point
 from game.casting.actor import Actor
+from game.directing.camera import Camera
+from game.services.random_volley_service import RandomVolleyService
+from game.shared.game_result import GameResult
 
 # class declaration
 class Director:
@@ -17,82 +24,243 @@ class Director:
     Attributes:
         _keyboard_service (KeyboardService): For getting directional input.
         _video_service (VideoService): For providing video output.
+        _profile_service (ProfileService): For timing each phase of a frame, or None.
+        _overlay (Actor): The on-screen profile summary, or None.
+        _rng (Random): The game's random number generator, for the enemy's return fire.
+        _replay_service (ReplayService): For recording the player's shots, or None.
+        _camera (Camera): The view of a board too large for the screen, or None.
+        _volley_service (RandomVolleyService or DensityVolleyService): For aiming the enemy's return fire.
+        _hint_service (HintService): For shading the enemy field for the player, or None.
+        _idle (bool): Whether the frame is only redrawn when something on it changed.
+        _save_service (SaveService): For saving the game on F5 and on exit, or None.
+        _steps (deque): The cursor steps read from the keyboard and not yet taken, one a tick.
+        _shots (int): The Enter key presses read from the keyboard and not yet fired, one a tick.
+        _lag (float): The seconds of game time not yet run as ticks.
+        _last_time (float): When the ticks were last run, or None before the first frame.
+        _is_resting (bool): Whether the last frame, when idle, had nothing to update.
     """
 
+    # groups drawn once into a retained layer and redrawn only when they change
+    LAYERED_GROUPS = ("dividers", "enemy_ships", "defense_ships", "artillery")
+
+    # groups placed on the fields, drawn through the camera when there is one
+    FIELD_GROUPS = ("cursors", "enemy_ships", "defense_ships", "artillery")
+
     # default constructor
-    def __init__(self, keyboard_service, video_service):
+    def __init__(self, keyboard_service, video_service, profile_service = None, rng = None, replay_service = None, volley_service = None, hint_service = None, idle = False, save_service = None):
         """Constructs a new Director using the specified keyboard and video services.
         
         Args:
             keyboard_service (KeyboardService): An instance of KeyboardService.
             video_service (VideoService): An instance of VideoService.
+            profile_service (ProfileService): An optional ProfileService to time each frame.
+            rng (Random): The game's random number generator, a new one if not given.
+            replay_service (ReplayService): An optional ReplayService to record the shots.
+            volley_service: An optional enemy, any object with a next_volley(board, count) method
+                returning cell indexes; a RandomVolleyService on the game's generator if not given.
+            hint_service (HintService): An optional HintService to shade the enemy field.
+            idle (bool): Whether to skip the update and redraw on frames where nothing changed,
+                showing the last frame again instead.
+            save_service (SaveService): An optional SaveService to save the game to when F5 is
+                pressed and when the window closes.
         """
         self._keyboard_service = keyboard_service
         self._video_service = video_service
+        self._profile_service = profile_service
+        self._overlay = None
+        self._rng = rng if rng is not None else random.Random()
+        self._replay_service = replay_service
+        self._volley_service = volley_service if volley_service is not None else RandomVolleyService(self._rng)
+        self._hint_service = hint_service
+        self._idle = idle
+        self._save_service = save_service
+        self._steps = deque()
+        self._shots = 0
+        self._lag = 0.0
+        self._last_time = None
+        self._is_resting = False
         self._is_game_over = False
-        self._enter_key_up = False
-        self._enter_key_down = False
         self._hit_scored = False
         self._enemy_hit_scored = False
         self._enemy_destroyed = False
         self._defender_destroyed = False
         self._ships_are_revealed = False
+        self._turns = 0
+        self._shots_fired = 0
+        self._hits_scored = 0
+        self._enemy_shots_fired = 0
+        self._enemy_hits_scored = 0
+        self._camera = None
+        if globals.COLS * globals.CELL_SIZE > globals.MAX_X or (globals.ROWS + 1) * globals.CELL_SIZE > globals.MAX_Y:
+            self._camera = Camera()
 
     # method holding game loop
     def start_game(self, cast):
         """Starts the game using the given cast. Runs the main game loop.
 
         Args:
-            cast (Cast): The cast of actors.
+            cast (Cast or function): The cast of actors, or a function returning it, such as one
+                loading a saved game. A function is only called once the window is open, so the
+                window shows without waiting for it.
         """
-        # open game window
+        # open game window, then build the cast if it is still to be built
         self._video_service.open_window()
+        if callable(cast):
+            cast = cast()
 
-        # align cursor with enemy grid
+        # align cursor with enemy grid, snapping it into the cell it sits in
         cursor = cast.get_first_actor("cursors")
-        x = int((globals.MAX_X / 2) / globals.CELL_SIZE) 
-        y = int(((globals.MAX_Y - globals.CELL_SIZE) / 4) / globals.CELL_SIZE) 
+        x = int(cursor.get_position().get_x() // globals.CELL_SIZE)
+        y = int(cursor.get_position().get_y() // globals.CELL_SIZE)
         cursor.set_position(Point(x, y).scale(globals.CELL_SIZE))
 
-        # main game loop
+        # set up the profile overlay in the top left corner if asked for
+        if self._profile_service is not None and self._profile_service.is_overlay_on():
+            self._overlay = Actor()
+            self._overlay.set_text(" ")
+            self._overlay.set_font_size(globals.FONT_SIZE)
+            self._overlay.set_color(globals.YELLOW)
+
+        # main game loop: sample input and draw once a frame, run the game logic on fixed ticks, then
+        # wait for the next frame; the frame time is only the work, the wait is timed on its own
         while self._video_service.is_window_open():
-            self._get_inputs(cast)
-            self._do_updates(cast)
-            self._do_outputs(cast)
+            if self._profile_service is None:
+                self._get_inputs(cast)
+                self._run_ticks(cast)
+                self._do_outputs(cast)
+                self._video_service.wait_for_frame()
+            else:
+                self._profile_service.start_frame()
+                self._run_phase("inputs", self._get_inputs, cast)
+                self._run_phase("updates", self._run_ticks, cast)
+                self._run_phase("outputs", self._do_outputs, cast)
+                self._profile_service.end_frame()
+                self._run_phase("wait", self._video_service.wait_for_frame)
         self._video_service.close_window()
 
+        # save the replay of the game, and the game itself
+        if self._replay_service is not None:
+            self._replay_service.save(cast, self.get_result())
+        if self._save_service is not None and not self._save_game(cast):
+            print(cast.get_first_actor("banners").get_text(), file = sys.stderr)
+
+        # write out the frame times
+        if self._profile_service is not None:
+            self._profile_service.dump()
+
+    # method to return the random number generator
+    def get_rng(self):
+        """Gets the game's random number generator.
+
+        Returns:
+            Random: The random number generator.
+        """
+        return self._rng
+
+    # method to summarize the game
+    def get_result(self):
+        """Gets the outcome of the game so far.
+
+        Returns:
+            GameResult: The outcome of the game.
+        """
+        winner = None
+        if self._enemy_destroyed:
+            winner = "player"
+        elif self._defender_destroyed:
+            winner = "enemy"
+        return GameResult(winner, self._turns, self._shots_fired, self._hits_scored, \
+            self._enemy_shots_fired, self._enemy_hits_scored)
+
+    # method to restore the game's progress
+    def load_state(self, state):
+        """Restores the turn and shot counters, game flags and random number generator state.
+
+        Args:
+            state (tuple): A state as returned by to_state.
+
+        Returns:
+            nothing
+        """
+        counters, flags, rng_state = state
+        self._turns, self._shots_fired, self._hits_scored, \
+            self._enemy_shots_fired, self._enemy_hits_scored = counters
+        self._is_game_over, self._ships_are_revealed, \
+            self._enemy_destroyed, self._defender_destroyed = flags
+        self._rng.setstate(rng_state)
+
+    # method to return the game's progress
+    def to_state(self):
+        """Gets the turn and shot counters, game flags and random number generator state.
+
+        Returns:
+            tuple: (counters, flags, random number generator state), for load_state.
+        """
+        counters = (self._turns, self._shots_fired, self._hits_scored, \
+            self._enemy_shots_fired, self._enemy_hits_scored)
+        flags = (self._is_game_over, self._ships_are_revealed, \
+            self._enemy_destroyed, self._defender_destroyed)
+        return (counters, flags, self._rng.getstate())
+
     # method getting inputs
     def _get_inputs(self, cast):
-        """Gets directional input from the keyboard and applies it to the cursor.
+        """Reads the keyboard once a frame, queueing its cursor steps and Enter presses for the
+        next ticks to take one at a time.
         
         Args:
             cast (Cast): The cast of actors.
         """
-        # get cursor from cast, get velocity from keys, move cursor
-        cursor = cast.get_first_actor("cursors")
-        velocity = self._keyboard_service.get_direction()
-        cursor.set_velocity(velocity)   
+        # queue the steps of the arrow keys pressed and repeated, the ticks move the cursor by them
+        snapshot = self._keyboard_service.capture()
+        self._steps.extend(snapshot.get_steps())
         
         # if game over, set enemy ships to show, return
         if self._is_game_over:
             if self._ships_are_revealed == False:
                 self._ships_are_revealed = True
-                ships = cast.get_actors("enemy_ships")
-                for i in range(len(ships)):
-                    ships[i].set_color(globals.RED_BOLD)
+                for ship in cast.iter_actors("enemy_ships"):
+                    ship.set_color(globals.RED_BOLD)
             return
 
-        # check if enter key is down
-        if self._keyboard_service.get_enter_key_state():
-            self._enter_key_down = True
+        # queue a shot for each press of the Enter key, even ones let go of before this frame
+        self._shots += snapshot.count_presses("enter")
+
+        # save the game if F5 was pressed
+        if self._save_service is not None and snapshot.is_pressed("save"):
+            self._save_game(cast)
+
+    # method running the game logic on fixed ticks
+    def _run_ticks(self, cast):
+        """Runs as many ticks of game logic as the time since the last frame calls for, at
+        globals.TICK_RATE ticks a second however fast frames are drawn. A long stall is cut to
+        globals.MAX_LAG so the game does not race to catch up. When idle, nothing runs while there
+        is no input, and the first input after a rest runs a tick at once.
+        
+        Args:
+            cast (Cast): The cast of actors.
 
-        # check if enter key is up
-        if self._keyboard_service.is_enter_key_up():
-            self._enter_key_up = True
+        Returns: 
+            nothing
+        """
+        now = time.perf_counter()
+        elapsed = 0.0 if self._last_time is None else min(now - self._last_time, globals.MAX_LAG)
+        self._last_time = now
+        if self._idle and not self._is_input_pending():
+            self._lag = 0.0
+            self._is_resting = True
+            return
+        tick = 1 / globals.TICK_RATE
+        self._lag += elapsed
+        if self._is_resting:
+            self._lag = max(self._lag, tick)
+            self._is_resting = False
+        while self._lag >= tick:
+            self._do_updates(cast)
+            self._lag -= tick
 
     # method updating game play
     def _do_updates(self, cast):
-        """Updates the cursor's position and resolves any collisions with ships.
+        """Runs one tick: steps the cursor and resolves any shot fired at a ship.
         
         Args:
             cast (Cast): The cast of actors.
@@ -104,71 +272,73 @@ class Director:
         self._hit_scored = False
         self._enemy_hit_scored = False
 
-        # get banners from cast for messages
-        banner = cast.get_first_actor("banners")
-
-        # get cursor from cast
+        # get cursor from cast, and the step it takes this tick
         cursor = cast.get_first_actor("cursors")
-
-        # get fleets from cast
-        ships = cast.get_actors("enemy_ships")
-        defenses = cast.get_actors("defense_ships")
+        cursor.set_velocity(self._get_step())
 
         # get screen width and height from video service, then move cursor
-        max_x = self._video_service.get_width()
-        max_y = self._video_service.get_height()
-        cursor.move_next(max_x, max_y)
+        if self._camera is None:
+            max_x = self._video_service.get_width()
+            max_y = self._video_service.get_height()
+            cursor.move_next(max_x, max_y)
+
+        # on a board too large for the screen, move over the whole enemy field and scroll to follow
+        else:
+            board = cast.get_board("enemy_ships")
+            cursor.move_next(board.get_cols() * globals.CELL_SIZE, board.get_rows() * globals.CELL_SIZE)
+            self._camera.follow(cursor.get_position(), board.get_cols(), board.get_rows())
         
-        # loop through enemy ships
-        for ship in ships:
-            
-            # check to see if the ship position equals the cursor position and the Enter key has been pressed.
-            if self._enter_key_down and self._enter_key_up and ship.get_position().equals(cursor.get_position()):
-                
-                # show Enter key used
-                self._enter_key_down = False
-                self._enter_key_up = False 
-                
-                # if so, set the color to visible, change the text to an X for destroyed, and let the ship's message go on the banner
-                ship.set_color(globals.RED_BOLD)
-                ship.set_text("X")
-                banner.set_text("Enemy ship hit!")
-                
-                # set hit scored flag                    
-                self._hit_scored = True
+        # once the game is over, presses still queued fire nothing
+        if self._is_game_over:
+            self._shots = 0
 
-                # enemy returns fire
-                self._return_fire(cast)
+        # if the Enter key has been pressed, fire at the cursor position
+        elif self._shots > 0:
 
-        # if the enter key been down and back up and player missed, do the following
-        if self._enter_key_down and self._enter_key_up and not self._hit_scored:
+            # show Enter key used
+            self._shots -= 1
 
-            # show Enter key as used
-            self._enter_key_down = False
-            self._enter_key_up = False  
-            
-            # create new shot actor and put in cast
-            shot = Actor()
-            shot.set_position(cursor.get_position())
-            shot.set_text("X")
-            shot.set_color(globals.WHITE)
-            cast.add_actor("artillery", shot)
-            banner.set_text(" ")
+            # take the player's turn, dropping the input still queued if it ended the game
+            self._take_turn(cast, cursor.get_position())
+            if self._is_game_over:
+                self._shots = 0
+                self._steps.clear()
+
+    # method to play one turn
+    def _take_turn(self, cast, position):
+        """Fires the player's shot at the given position, has the enemy return fire, and ends the
+        game if either fleet is gone.
+        
+        Args:
+            cast (Cast): The cast of actors.
+            position (Point): Where the player's shot lands.
 
-            # enemy returns fire
-            self._return_fire(cast)
+        Returns: 
+            nothing
+        """
+        # resolve the shot, set hit scored flag, enemy returns fire
+        self._hit_scored = self._fire_shot(cast, position)
+        self._return_fire(cast)
 
-        # check to see if enemy is destroyed, set flag appropriately
-        self._enemy_destroyed = True
-        for ship in ships:
-            if ship.get_text() != "X":
-                self._enemy_destroyed = False
+        # only a shot can sink a fleet, so only check after one
+        self._check_fleets(cast)
+
+    # method to check whether the game is over
+    def _check_fleets(self, cast):
+        """Sets the destroyed flags for both fleets and ends the game if either one is gone.
         
-        # check to see if defenders are destroyed, set flag appropriately
-        self._defender_destroyed = True
-        for defender in defenses:
-            if defender.get_text() != "X":
-                self._defender_destroyed = False
+        Args:
+            cast (Cast): The cast of actors.
+
+        Returns: 
+            nothing
+        """
+        # get banners from cast
+        banner = cast.get_first_actor("banners")
+
+        # read each fleet board's live counters to see if it is destroyed, set flags appropriately
+        self._enemy_destroyed = cast.get_board("enemy_ships").is_destroyed()
+        self._defender_destroyed = cast.get_board("defense_ships").is_destroyed()
 
         # if either the enemy or defender fleet is destroyed, end game
         if self._enemy_destroyed or self._defender_destroyed:
@@ -178,6 +348,49 @@ class Director:
                 win_message = "The enemy prevailed. You lose."
             banner.set_text(win_message)
             self._is_game_over = True
+
+    # method to resolve one of the player's shots
+    def _fire_shot(self, cast, position):
+        """Fires the player's shot at the given position and marks the hit or miss.
+        
+        Args:
+            cast (Cast): The cast of actors.
+            position (Point): Where the shot lands.
+
+        Returns: 
+            bool: True if an enemy ship was hit; False if otherwise.
+        """
+        # get banners from cast for messages, count and record the shot
+        banner = cast.get_first_actor("banners")
+        self._turns += 1
+        self._shots_fired += 1
+        if self._replay_service is not None:
+            self._replay_service.record(position)
+
+        # record the shot on the enemy board, on a hit update the ship sitting at the position
+        board = cast.get_board("enemy_ships")
+        index = board.get_index(position)
+        was_missed = index is not None and board.is_missed(index)
+        if board.fire(position):
+            ship = cast.get_actor_at("enemy_ships", position)
+                
+            # if so, set the color to visible, change the text to an X for destroyed, and let the ship's message go on the banner
+            ship.set_color(globals.RED_BOLD)
+            ship.set_text("X")
+            banner.set_text("Enemy ship hit!")
+            self._hits_scored += 1
+            return True
+
+        # if the player missed, create new shot actor and put in cast, unless the cell is already marked
+        # or the camera draws misses from the board
+        if self._camera is None and not was_missed:
+            shot = Actor()
+            shot.set_position(position)
+            shot.set_text("X")
+            shot.set_color(globals.WHITE)
+            cast.add_actor("artillery", shot)
+        banner.set_text(" ")
+        return False
     
     # enemy returns fire method
     def _return_fire(self, cast):
@@ -189,9 +402,7 @@ class Director:
         Returns:
             nothing        
         """
-        # get banners
         # get needed cast members
-        ships = cast.get_actors("enemy_ships")
         banner = cast.get_first_actor("banners")
         banner_2 = cast.get_second_actor("banners")
 
@@ -206,12 +417,13 @@ class Director:
         pre_volley = self._count_ships(cast, "defense_ships")
         
         # conduct enemy return fire
-        for i in range(return_fire):
-            ships[i].target()
+        self._fire_volley(cast, return_fire)
         
         # see how many defense ships are left and determine loss
         post_volley = self._count_ships(cast, "defense_ships")
         loss = pre_volley - post_volley
+        self._enemy_shots_fired += return_fire
+        self._enemy_hits_scored += loss
         
         # keep words used correct to numbers
         ship_word = use_word = " "
@@ -228,6 +440,42 @@ class Director:
         banner.set_text(f"Enemy ships left: {return_fire}")
         banner_2.set_text(f"Damage Report: {loss} {use_word} damaged, {post_volley} {ship_word} left.")
 
+    # method to fire a whole enemy volley at once
+    def _fire_volley(self, cast, count):
+        """Fires the given number of enemy shots at cells in defender territory chosen by the
+        volley service. All the target cells are chosen in one go and resolved against the defense
+        board in one masked operation; only the hit sections and newly missed cells are then
+        touched on screen.
+
+        Args:
+            cast (Cast): assembly of all actors
+            count (int): the number of shots in the volley
+
+        Returns:
+            nothing
+        """
+        # aim every shot at once, then resolve them on the board
+        if count <= 0:
+            return
+        board = cast.get_board("defense_ships")
+        hits, misses = board.volley(self._volley_service.next_volley(board, count))
+
+        # mark the damaged defenders
+        for index in board.get_indexes(hits):
+            defender = cast.get_actor_at("defense_ships", board.get_position(index))
+            defender.set_text("X")
+            defender.set_color(globals.RED_BOLD)
+
+        # mark the new misses with shot actors, unless the camera draws misses from the board
+        if self._camera is not None:
+            return
+        for index in board.get_indexes(misses):
+            shot = Actor()
+            shot.set_position(board.get_position(index))
+            shot.set_text("X")
+            shot.set_color(globals.WHITE)
+            cast.add_actor("artillery", shot)
+
     # method to count number of casualties
     def _count_ships(self, cast, group):
         """Gets the number of undamaged ships and returns it.
@@ -239,13 +487,8 @@ class Director:
         Returns:
             count (int): integer of how many defense ships remain
         """
-        # get functioning defense forces from cast, count them out, return count 
-        forces = cast.get_actors(group)
-        count = len(forces)
-        for force in forces:
-            if force.get_text() == "X":
-                count -= 1
-        return count
+        # read the undamaged section counter kept by the group's board
+        return cast.get_board(group).count_remaining()
         
     # method to perform all outputs
     def _do_outputs(self, cast):
@@ -257,7 +500,173 @@ class Director:
         Returns:
             nothing
         """
-        self._video_service.clear_buffer()
-        actors = cast.get_all_actors()
-        self._video_service.draw_actors(actors)
-        self._video_service.flush_buffer()
\ No newline at end of file
+        # when idle, the scene is only drawn when it changed, and the last one shown otherwise
+        if self._idle:
+            self._run_phase("layers", self._update_frame, cast)
+            self._run_phase("clear", self._video_service.clear_buffer)
+            self._run_phase("draw", self._video_service.draw_layer, "frame")
+            self._run_phase("flush", self._video_service.flush_buffer)
+            return
+        self._run_phase("layers", self._update_layers, cast)
+        self._run_phase("clear", self._video_service.clear_buffer)
+        self._run_phase("draw", self._draw_groups, cast)
+        self._run_phase("flush", self._video_service.flush_buffer)
+
+    # method to draw every group
+    def _draw_groups(self, cast):
+        """Draws the hint shading, then each group in cast order, blitting the layered ones, then
+        the profile overlay.
+        
+        Args:
+            cast (Cast): The cast of actors.
+
+        Returns:
+            nothing
+        """
+        if self._hint_service is not None and self._camera is None:
+            self._video_service.draw_layer("hints")
+        for group in cast.get_groups():
+            if self._camera is not None and group in self.FIELD_GROUPS:
+                continue
+            if group in self.LAYERED_GROUPS:
+                self._video_service.draw_layer(group)
+            else:
+                self._video_service.draw_actors(cast.iter_actors(group))
+        if self._camera is not None:
+            self._draw_fields(cast)
+        if self._overlay is not None:
+            self._overlay.set_text(self._profile_service.get_overlay_text())
+            self._video_service.draw_actor(self._overlay)
+
+    # method to draw the part of each field in view
+    def _draw_fields(self, cast):
+        """Draws the ship sections and misses inside the camera's windows, then the cursor. Only
+        the cells in view are looked at, so this costs the same however large the board is.
+        
+        Args:
+            cast (Cast): The cast of actors.
+
+        Returns:
+            nothing
+        """
+        for group, top in (("enemy_ships", 0), ("defense_ships", globals.VIEW_ROWS + 2)):
+            board = cast.get_board(group)
+
+            # the ship sections, a fixed number however large the board
+            for section in cast.iter_actors(group):
+                index = board.get_index(section.get_position())
+                position = self._camera.to_screen(board, index, top)
+                if position is not None:
+                    self._video_service.draw_text(section.get_text(), position, section.get_font_size(), section.get_color())
+
+            # the misses, read straight from the board and drawn a run at a time
+            misses = board.iter_misses(*self._camera.get_bounds(board))
+            positions = [self._camera.to_screen(board, index, top) for index in misses]
+            self._video_service.draw_glyphs("X", positions, globals.FONT_SIZE, globals.WHITE)
+
+        # the cursor, on top
+        board = cast.get_board("enemy_ships")
+        for cursor in cast.iter_actors("cursors"):
+            position = self._camera.to_screen(board, board.get_index(cursor.get_position()), 0)
+            if position is not None:
+                self._video_service.draw_text(cursor.get_text(), position, cursor.get_font_size(), cursor.get_color())
+
+    # method to work out the cursor's step with key repeat
+    def _get_step(self):
+        """Gets how far the cursor moves this tick: the oldest step queued from the keyboard. The
+        keyboard makes a step for each arrow key press and for each repeat of a held one.
+        
+        Returns:
+            Point: The step, or (0, 0) for none.
+        """
+        if self._steps:
+            return self._steps.popleft()
+        return Point(0, 0)
+
+    # method to check for anything to update
+    def _is_input_pending(self):
+        """Whether or not the input asks for a tick: a cursor step or an Enter key press is
+        waiting.
+
+        Returns:
+            bool: True if there is something to update; False if otherwise.
+        """
+        return len(self._steps) > 0 or self._shots > 0
+
+    # method to save the game
+    def _save_game(self, cast):
+        """Saves the game through the save service, saying on the banner whether it worked.
+        
+        Args:
+            cast (Cast): The cast of actors.
+
+        Returns:
+            bool: True if the game was saved; False if otherwise.
+        """
+        banner = cast.get_first_actor("banners")
+        try:
+            self._save_service.write(self, cast)
+        except (OSError, ValueError) as error:
+            banner.set_text(f"Could not save the game: {error}")
+            return False
+        banner.set_text("Game saved.")
+        return True
+
+    # method to time one phase of a frame
+    def _run_phase(self, phase, method, *args):
+        """Calls the given method, recording how long it took if profiling is on.
+        
+        Args:
+            phase (string): The name of the phase.
+            method (function): The method to call.
+            args: The arguments to pass it.
+
+        Returns:
+            nothing
+        """
+        if self._profile_service is None:
+            method(*args)
+            return
+        start = time.perf_counter()
+        method(*args)
+        self._profile_service.record(phase, time.perf_counter() - start)
+
+    # method to redraw the whole frame if it changed
+    def _update_frame(self, cast):
+        """Draws the scene into the retained frame, but only if a group, the hints or the turn
+        changed since it was last drawn. With the profile overlay on, it is drawn every frame.
+        
+        Args:
+            cast (Cast): The cast of actors.
+
+        Returns:
+            nothing
+        """
+        self._update_layers(cast)
+        version = (self._turns, tuple(cast.get_version(group) for group in cast.get_groups()), \
+            self._hint_service.get_version() if self._hint_service is not None else 0)
+        if self._overlay is None and self._video_service.is_layer_current("frame", version):
+            return
+        self._video_service.begin_layer("frame", opaque = True)
+        self._draw_groups(cast)
+        self._video_service.end_layer("frame", version)
+
+    # method to redraw changed layers
+    def _update_layers(self, cast):
+        """Brings the retained layers up to date before the frame starts.
+        
+        Args:
+            cast (Cast): The cast of actors.
+
+        Returns:
+            nothing
+        """
+        if self._hint_service is not None and self._camera is None:
+            self._hint_service.update(cast)
+            self._video_service.update_shade_layer("hints", self._hint_service.get_shades(), self._hint_service.get_version())
+        for group in self.LAYERED_GROUPS:
+            if self._camera is not None and group in self.FIELD_GROUPS:
+                continue
+            version = cast.get_version(group)
+            if not self._video_service.is_layer_current(group, version):
+                self._video_service.update_layer(group, cast.iter_actors(group), version)
\ No newline at end of file
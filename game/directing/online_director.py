@@ -0,0 +1,290 @@
+"""
+file: online_director.py
+author: Jerry Lane
+purpose: This class directs a game against another person through a
+match server, drawing and reading keys just as the Director does.
+"""
+# import needed modules
+import globals
+from game.casting.actor import Actor
+from game.casting.ship import Ship
+from game.directing.director import Director
+from game.shared.point import Point
+
+# class declaration
+class OnlineDirector(Director):
+    """A person who directs a game played against another person over the network.
+
+    The responsibility of an OnlineDirector is the Director's, except that the opponent's fleet and
+    shots are the server's: Enter sends the cursor's cell to the server instead of firing, and the
+    server's messages, read once a frame, place the player's own fleet and mark both players' shots.
+    The upper field is the opponent's board and the lower field the player's own.
+
+    Attributes:
+        _client (MatchClient): The connection to the match server.
+        _my_turn (bool): Whether or not the server is waiting for the player's shot.
+        _is_firing (bool): Whether or not a shot was sent and its result has not come back.
+    """
+
+    # what the banner says for each result of the player's shot
+    RESULTS = {"MISS": " ", "HIT": "Enemy ship hit!", "SUNK": "Enemy ship sunk!"}
+
+    # default constructor
+    def __init__(self, keyboard_service, video_service, client, profile_service = None):
+        """Constructs a new OnlineDirector using the specified services and server connection.
+        
+        Args:
+            keyboard_service (KeyboardService): An instance of KeyboardService.
+            video_service (VideoService): An instance of VideoService.
+            client (MatchClient): A connected MatchClient.
+            profile_service (ProfileService): An optional ProfileService to time each frame.
+        """
+        super().__init__(keyboard_service, video_service, profile_service)
+        self._client = client
+        self._my_turn = False
+        self._is_firing = False
+
+    # method holding game loop
+    def start_game(self, cast):
+        """Asks the server for an opponent, then runs the main game loop.
+
+        Args:
+            cast (Cast): The cast of actors, with empty boards for both fields.
+        """
+        cast.get_first_actor("banners").set_text("Joining...")
+        self._client.send("JOIN")
+        super().start_game(cast)
+        self._client.send("QUIT")
+        self._client.close()
+
+    # method getting inputs
+    def _get_inputs(self, cast):
+        """Samples the keyboard as the Director does, then carries out the server's messages.
+        
+        Args:
+            cast (Cast): The cast of actors.
+        """
+        super()._get_inputs(cast)
+
+        # a message the game cannot make sense of ends it, rather than being half carried out
+        try:
+            for words in self._client.poll():
+                if words:
+                    self._read_message(cast, words)
+        except ValueError as error:
+            cast.get_first_actor("banners").set_text(f"Bad message from the server: {error}")
+            self._client.close()
+            self._is_game_over = True
+        if not self._client.is_connected() and not self._is_game_over:
+            cast.get_first_actor("banners").set_text("Lost the connection to the server.")
+            self._is_game_over = True
+
+    # method to play one turn
+    def _take_turn(self, cast, position):
+        """Sends the player's shot to the server, if it is their turn. The result comes back as a
+        message.
+        
+        Args:
+            cast (Cast): The cast of actors.
+            position (Point): Where the player's shot lands.
+
+        Returns: 
+            nothing
+        """
+        if not self._my_turn or self._is_firing:
+            cast.get_first_actor("banners").set_text("Wait for your turn.")
+            return
+        self._is_firing = True
+        self._client.send("FIRE", int(position.get_x() // globals.CELL_SIZE), int(position.get_y() // globals.CELL_SIZE))
+
+    # method to mark a shot on a field
+    def _mark_shot(self, cast, group, col, row, result):
+        """Marks a shot on the given field: an X over the section hit, or a miss on the water.
+        Hits on the opponent's field are the only sections of their fleet ever shown.
+        
+        Args:
+            cast (Cast): The cast of actors.
+            group (string): "enemy_ships" for the player's shot, "defense_ships" for the opponent's.
+            col (int): The column of the cell on that board.
+            row (int): The row of the cell on that board.
+            result (string): "MISS", "HIT" or "SUNK".
+
+        Returns: 
+            nothing
+        """
+        board = cast.get_board(group)
+        position = Point(col, row + board.get_row_offset()).scale(globals.CELL_SIZE)
+        board.fire(position)
+        self._turns += 1
+        if result == "MISS":
+            shot = Actor()
+            shot.set_position(position)
+            shot.set_text("X")
+            shot.set_color(globals.WHITE)
+            cast.add_actor("artillery", shot)
+            return
+        section = cast.get_actor_at(group, position)
+        if section is None:
+            section = Ship(cast, globals.RED_BOLD)
+            section.set_font_size(globals.FONT_SIZE)
+            section.set_position(position)
+            cast.add_actor(group, section)
+        section.set_text("X")
+        section.set_color(globals.RED_BOLD)
+
+    # method to place one of the player's ships
+    def _place_ship(self, cast, col, row, length, vertical):
+        """Adds one of the player's ships to their field, as Fleet builds them.
+        
+        Args:
+            cast (Cast): The cast of actors.
+            col (int): The first column of the ship on the player's board.
+            row (int): The first row of the ship on the player's board.
+            length (int): The number of sections.
+            vertical (bool): Whether the ship runs north/south.
+
+        Returns: 
+            nothing
+        """
+        board = cast.get_board("defense_ships")
+        row += board.get_row_offset()
+        positions = []
+        for n in range(length):
+            section = Ship(cast, globals.GREEN)
+            section.set_text("=")
+            if n == 0:
+                section.set_text("^" if vertical else "<")
+            elif n == length - 1 and not vertical:
+                section.set_text(">")
+            section.set_font_size(globals.FONT_SIZE)
+            section.set_position(Point(col + n * (not vertical), row + n * vertical).scale(globals.CELL_SIZE))
+            cast.add_actor("defense_ships", section)
+            positions.append(section.get_position())
+        board.add_ship(positions)
+
+    # method to carry out one message from the server
+    def _read_message(self, cast, words):
+        """Carries out one message from the server. Every word is checked before anything is
+        changed, so a bad message changes nothing.
+        
+        Args:
+            cast (Cast): The cast of actors.
+            words (list): The words of the message.
+
+        Returns: 
+            nothing
+
+        Raises:
+            ValueError: If the message is missing words, or has a word that is not allowed there.
+        """
+        banner = cast.get_first_actor("banners")
+        banner_2 = cast.get_second_actor("banners")
+        command, values = words[0], words[1:]
+        if command == "WAIT":
+            banner.set_text("Waiting for an opponent...")
+        elif command == "START":
+            match, cols, rows = self._read_numbers(values, 3)
+            board = cast.get_board("enemy_ships")
+            if (cols, rows) != (board.get_cols(), board.get_rows()):
+                banner.set_text(f"The server plays on a {cols}x{rows} board.")
+                self._is_game_over = True
+                return
+            banner.set_text(f"Match {match} has started.")
+        elif command == "SHIP":
+            col, row, length = self._read_numbers(values, 3)
+            if len(values) < 4 or values[3] not in ("V", "H"):
+                raise ValueError(f"ship direction {' '.join(values[3:4]) or '(missing)'} is not V or H")
+            if length < 1:
+                raise ValueError("ship has no sections")
+            vertical = values[3] == "V"
+            self._check_cell(cast, "defense_ships", col, row)
+            self._check_cell(cast, "defense_ships", col + (length - 1) * (not vertical), row + (length - 1) * vertical)
+            self._place_ship(cast, col, row, length, vertical)
+        elif command == "TURN":
+            self._my_turn = True
+            banner_2.set_text("Your turn.")
+        elif command == "RESULT":
+            col, row, result = self._read_shot(cast, "enemy_ships", values)
+            self._my_turn = self._is_firing = False
+            self._mark_shot(cast, "enemy_ships", col, row, result)
+            self._shots_fired += 1
+            self._hits_scored += result != "MISS"
+            banner.set_text(self.RESULTS[result])
+            banner_2.set_text("Their turn.")
+        elif command == "INCOMING":
+            col, row, result = self._read_shot(cast, "defense_ships", values)
+            self._mark_shot(cast, "defense_ships", col, row, result)
+            self._enemy_shots_fired += 1
+            self._enemy_hits_scored += result != "MISS"
+            banner_2.set_text(f"Damage Report: {cast.get_board('defense_ships').count_remaining()} ships left.")
+        elif command in ("WIN", "LOSE"):
+            banner.set_text("You Win! Game over." if command == "WIN" else "The enemy prevailed. You lose.")
+            banner_2.set_text(" ")
+            self._enemy_destroyed = command == "WIN"
+            self._defender_destroyed = command == "LOSE"
+            self._is_game_over = True
+        elif command == "ERROR":
+            banner.set_text(" ".join(values))
+            self._is_firing = False
+
+    # method to check that a cell is on a field
+    def _check_cell(self, cast, group, col, row):
+        """Checks that a cell given by the server is on the given field's board.
+        
+        Args:
+            cast (Cast): The cast of actors.
+            group (string): "enemy_ships" or "defense_ships".
+            col (int): The column of the cell on that board.
+            row (int): The row of the cell on that board.
+
+        Returns: 
+            nothing
+
+        Raises:
+            ValueError: If the cell is off the board.
+        """
+        board = cast.get_board(group)
+        if not (0 <= col < board.get_cols() and 0 <= row < board.get_rows()):
+            raise ValueError(f"cell {col} {row} is off the board")
+
+    # method to read numbers from a message
+    def _read_numbers(self, values, count):
+        """Gets the first words of a message as whole numbers.
+        
+        Args:
+            values (list): The words of the message after the command.
+            count (int): The number of words to read.
+
+        Returns: 
+            list: The numbers.
+
+        Raises:
+            ValueError: If there are too few words, or one is not a whole number of zero or more.
+        """
+        if len(values) < count:
+            raise ValueError(f"{count} numbers expected, got {len(values)}")
+        numbers = [int(value) for value in values[:count]]
+        if min(numbers) < 0:
+            raise ValueError(f"{min(numbers)} is below zero")
+        return numbers
+
+    # method to read a shot from a message
+    def _read_shot(self, cast, group, values):
+        """Gets the cell and result of a RESULT or INCOMING message.
+        
+        Args:
+            cast (Cast): The cast of actors.
+            group (string): The field the shot landed on, "enemy_ships" or "defense_ships".
+            values (list): The words of the message after the command.
+
+        Returns: 
+            Tuple(int, int, string): The column and row of the cell, and "MISS", "HIT" or "SUNK".
+
+        Raises:
+            ValueError: If the cell is not one on the field, or the result is not a known one.
+        """
+        col, row = self._read_numbers(values, 2)
+        if len(values) < 3 or values[2] not in self.RESULTS:
+            raise ValueError(f"shot result {' '.join(values[2:3]) or '(missing)'} is not MISS, HIT or SUNK")
+        self._check_cell(cast, group, col, row)
+        return (col, row, values[2])
@@ -0,0 +1,50 @@
+"""
+file: simulation.py
+author: Jerry Lane
+purpose: This class runs a whole game without a window, as fast as it can.
+"""
+# import the Director class
+from game.directing.director import Director
+
+# class declaration
+class Simulation(Director):
+    """A director that plays a game headless.
+
+    The responsibility of a Simulation is to play the same game as the Director, without opening a
+    window or polling the keyboard, taking the player's shots from a shot service instead.
+
+    Attributes:
+        _shot_service (RandomShotService or ScriptedShotService): For choosing the player's shots.
+    """
+
+    # default constructor
+    def __init__(self, shot_service, rng = None, replay_service = None, volley_service = None):
+        """Constructs a new Simulation using the specified shot service.
+        
+        Args:
+            shot_service: Any object with a next_shot(cast) method returning a Point or None.
+            rng (Random): The game's random number generator, a new one if not given.
+            replay_service (ReplayService): An optional ReplayService to record the shots.
+            volley_service: An optional enemy with a next_volley(board, count) method.
+        """
+        super().__init__(None, None, rng = rng, replay_service = replay_service, volley_service = volley_service)
+        self._shot_service = shot_service
+
+    # method holding game loop
+    def run(self, cast, max_turns = 10000):
+        """Plays the game to completion using the given cast.
+
+        Args:
+            cast (Cast): The cast of actors.
+            max_turns (int): The most turns to play before giving up.
+
+        Returns:
+            GameResult: The outcome of the game.
+        """
+        # take turns until a fleet is destroyed, the shots run out, or the turn limit is hit
+        while not self._is_game_over and self._turns < max_turns:
+            position = self._shot_service.next_shot(cast)
+            if position is None:
+                break
+            self._take_turn(cast, position)
+        return self.get_result()
@@ -0,0 +1,158 @@
+"""
+file: tournament.py
+author: Jerry Lane
+purpose: This class plays many seeded headless games across several
+processes and adds up the results.
+"""
+# import modules
+import argparse
+import os
+import random
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from game.casting.game_setup import ENEMIES, create_cast, create_volley_service
+from game.directing.simulation import Simulation
+from game.services.random_shot_service import RandomShotService
+from game.shared.tournament_stats import TournamentStats
+
+# function to play one seeded game
+def play_game(seed, enemy = "random"):
+    """
+    parameters: seed (int) - the seed the whole game is played from
+                enemy (String) - how the enemy aims, one of ENEMIES
+    return: (tuple) - the GameResult as a tuple
+    purpose: This function plays one headless game from start to finish.
+    """
+    rng = random.Random(seed)
+    shot_service = RandomShotService(random.Random(f"shots-{seed}"))
+    simulation = Simulation(shot_service, rng, volley_service = create_volley_service(enemy, rng))
+    return simulation.run(create_cast(rng)).to_tuple()
+
+# function to play a block of games in a worker process
+def play_games(first_seed, count, enemy = "random"):
+    """
+    parameters: first_seed (int) - the seed of the first game in the block
+                count (int) - the number of games in the block
+                enemy (String) - how the enemy aims, one of ENEMIES
+    return: results[] (List) - the GameResult tuples, in seed order
+    purpose: This function plays a contiguous block of seeded games so each
+    trip to a worker process carries many games.
+    """
+    return [play_game(seed, enemy) for seed in range(first_seed, first_seed + count)]
+
+# class declaration
+class Tournament:
+    """A tournament of headless games.
+
+    The responsibility of a Tournament is to shard a range of seeded games over a pool of worker
+    processes, stream the results back as blocks finish, and fold them into TournamentStats.
+
+    Attributes:
+        _games (int): The number of games to play.
+        _seed (int): The seed of the first game; game n uses seed + n.
+        _workers (int): The number of worker processes.
+        _chunk_size (int): The number of games sent to a worker at a time.
+        _enemy (string): How the enemy aims, one of ENEMIES.
+    """
+
+    # default constructor
+    def __init__(self, games, seed = 0, workers = None, chunk_size = None, enemy = "random"):
+        """Constructs a new Tournament.
+        
+        Args:
+            games (int): The number of games to play.
+            seed (int): The seed of the first game.
+            workers (int): The number of worker processes, or None for one per core.
+            chunk_size (int): The number of games sent to a worker at a time, or None for enough
+                blocks to give every worker four.
+            enemy (string): How the enemy aims, one of ENEMIES.
+        """
+        self._games = games
+        self._seed = seed
+        self._workers = workers or os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = games // (self._workers * 4)
+        self._chunk_size = max(1, chunk_size)
+        self._enemy = enemy
+
+    # method to play every game
+    def run(self, on_result = None):
+        """Plays all the games and returns the totals.
+
+        Args:
+            on_result (function): Optional callback given each result tuple as it arrives.
+
+        Returns:
+            TournamentStats: The totals over every game.
+        """
+        stats = TournamentStats()
+        blocks = self._get_blocks()
+
+        # with a single worker, skip the process pool entirely
+        if self._workers == 1:
+            for first_seed, count in blocks:
+                self._collect(stats, play_games(first_seed, count, self._enemy), on_result)
+            return stats
+
+        # keep a few blocks in flight per worker so no process waits and memory stays flat
+        with ProcessPoolExecutor(max_workers = self._workers) as executor:
+            pending = set()
+            for first_seed, count in blocks:
+                pending.add(executor.submit(play_games, first_seed, count, self._enemy))
+                if len(pending) >= self._workers * 4:
+                    done, pending = wait(pending, return_when = FIRST_COMPLETED)
+                    for future in done:
+                        self._collect(stats, future.result(), on_result)
+            for future in pending:
+                self._collect(stats, future.result(), on_result)
+        return stats
+
+    # method to fold a block of results into the totals
+    def _collect(self, stats, results, on_result):
+        """Adds a block of results to the totals.
+
+        Args:
+            stats (TournamentStats): The running totals.
+            results (list): The GameResult tuples from one block.
+            on_result (function): Optional callback given each result tuple.
+
+        Returns:
+            nothing
+        """
+        for result in results:
+            stats.add_result(result)
+            if on_result is not None:
+                on_result(result)
+
+    # method to split the games into blocks
+    def _get_blocks(self):
+        """Yields the (first seed, count) of each block of games.
+
+        Returns:
+            generator: The blocks in seed order.
+        """
+        for start in range(0, self._games, self._chunk_size):
+            yield (self._seed + start, min(self._chunk_size, self._games - start))
+
+# tournament entry point
+def main(args = None):
+    """
+    parameters: args[] (List) - command line arguments, after the word tournament
+    return: nothing
+    purpose: This function reads the tournament options, plays the games,
+    and prints the totals.
+    """
+    parser = argparse.ArgumentParser(prog = "battleships tournament", \
+        description = "Play many seeded headless games and report the player's win rate.")
+    parser.add_argument("-n", "--games", type = int, default = 1000, help = "number of games to play")
+    parser.add_argument("-s", "--seed", type = int, default = 0, help = "seed of the first game")
+    parser.add_argument("-w", "--workers", type = int, default = None, help = "worker processes (default: one per core)")
+    parser.add_argument("-c", "--chunk-size", type = int, default = None, \
+        help = "games sent to a worker at a time (default: enough blocks to give every worker four)")
+    parser.add_argument("-e", "--enemy", choices = ENEMIES, default = "random", help = "how the enemy aims its volleys")
+    options = parser.parse_args(args)
+
+    tournament = Tournament(options.games, options.seed, options.workers, options.chunk_size, options.enemy)
+    stats = tournament.run()
+    print(stats.to_report())
+    sys.stdout.flush()
@@ -0,0 +1,109 @@
+"""
+file: density_volley_service.py
+author: Jerry Lane
+purpose: This class aims the enemy's volleys at the defender cells most
+likely to hold a ship.
+"""
+# import random, the density map, and the scattershot service to fall back on
+import random
+from game.casting.density_map import DensityMap
+from game.services.random_volley_service import RandomVolleyService
+
+# class declaration
+class DensityVolleyService:
+    """Aims the enemy's return fire by probability density.
+
+    The responsibility of a DensityVolleyService is to choose the cells each enemy volley lands on,
+    never firing at a cell twice. It keeps a DensityMap of the defense board, brought up to date
+    before each volley. While a hit ship is still afloat it hunts around it, firing at the cells
+    covered most often by places through its hits; otherwise it fires at the cells covered most
+    often by any place.
+
+    Boards too large to hold as bitboards are fired at by scattershot instead.
+
+    Attributes:
+        _rng (Random): The random number generator ties are broken with.
+        _fallback (RandomVolleyService): The scattershot used on sparse boards.
+        _map (DensityMap): The density map of the board being fired at, or None.
+    """
+
+    # default constructor
+    def __init__(self, rng = None):
+        """Constructs a new DensityVolleyService.
+        
+        Args:
+            rng (Random): The game's random number generator, a new one if not given.
+
+        Returns:
+            nothing
+        """
+        self._rng = rng if rng is not None else random.Random()
+        self._fallback = RandomVolleyService(self._rng)
+        self._map = None
+
+    # method to aim a volley
+    def next_volley(self, board, count):
+        """Gets the cells the next volley lands on, bringing the density map up to date first.
+
+        Args:
+            board (Board or SparseBoard): The defense board being fired at.
+            count (int): The number of shots in the volley.
+
+        Returns:
+            list: The cell index of each shot.
+        """
+        if board.is_sparse():
+            return self._fallback.next_volley(board, count)
+        if self._map is None or self._map.get_board() is not board:
+            self._map = DensityMap(board)
+        else:
+            self._map.update()
+
+        # hunt around hit ships still afloat first, then fire at the densest cells
+        targets = []
+        open_cells = self._map.get_open_cells()
+        planes = self._map.get_target_planes()
+        if planes:
+            covered = 0
+            for plane in planes:
+                covered |= plane
+            open_cells &= ~self._pick(board, planes, open_cells & covered, count, targets)
+        self._pick(board, self._map.get_planes(), open_cells, count, targets)
+        return targets
+
+    # method to pick the best cells
+    def _pick(self, board, planes, cells, count, targets):
+        """Adds the highest counted of the given cells to the targets until there are count of them,
+        breaking ties at random.
+
+        Args:
+            board (Board): The board being fired at.
+            planes (list): The bit-sliced counts.
+            cells (int): The cells that may be picked.
+            count (int): The number of targets wanted.
+            targets (list): The targets picked so far, added to.
+
+        Returns:
+            integer: The cells picked.
+        """
+        picked = 0
+        while cells and len(targets) < count:
+
+            # narrow down to the cells with the highest count, from the top bit down
+            best = cells
+            for plane in reversed(planes):
+                if best & plane:
+                    best &= plane
+
+            # take them all, or as many as are wanted, at random
+            wanted = count - len(targets)
+            ties = bin(best).count("1")
+            if ties > wanted:
+                chosen = 0
+                for n in range(wanted):
+                    chosen |= 1 << board.get_nth_index(best & ~chosen, self._rng.randrange(ties - n))
+                best = chosen
+            targets.extend(board.get_indexes(best))
+            cells &= ~best
+            picked |= best
+        return picked
@@ -0,0 +1,150 @@
+"""
+file: glyph_atlas.py
+author: Jerry Lane
+purpose: This class draws the game's one-character glyphs from a texture
+they were drawn into once, a whole row of neighbouring cells at a time.
+"""
+# import the stand-in for pyray, which only loads raylib when the window opens
+from game.shared.lazy_module import LazyModule
+pyray = LazyModule("pyray")
+
+# class declaration
+class GlyphAtlas:
+    """A texture holding every glyph the board is drawn with.
+
+    The responsibility of a GlyphAtlas is to draw many copies of a glyph in one color with as few
+    calls into raylib as it can. Each glyph is drawn in white once, across a whole row of the atlas,
+    when the atlas is loaded. Drawing then sorts the cells asked for into runs of neighbours along
+    a screen row and copies each run from the atlas in one call, tinted to the color, so a row of
+    misses or a ship lying east/west is a single quad. The tints and source rectangles are built once
+    and kept, so no colors or rectangles are converted per call.
+
+    Attributes:
+        _cell_size (int): The width and height of a cell.
+        _font_size (int): The font size the glyphs are drawn at.
+        _length (int): The most cells in a run, the width of the atlas in cells.
+        _rows (dict): The atlas row of each glyph { key: glyph, value: row }
+        _texture (RenderTexture): The atlas, or None until loaded.
+        _sources (dict): The atlas rectangle of each run { key: (row, length), value: Rectangle }
+        _tints (dict): The raylib color of each color used { key: Color, value: raylib Color }
+    """
+
+    # the glyphs the board is drawn with: ship sections, hits and misses, dividers and the cursor
+    GLYPHS = "<=>^X-+"
+
+    # default constructor
+    def __init__(self, cell_size, font_size, length):
+        """Constructs a new GlyphAtlas, without loading its texture.
+
+        Args:
+            cell_size (int): The width and height of a cell.
+            font_size (int): The font size to draw the glyphs at; other sizes are not held.
+            length (int): The most cells in a run, usually the screen's width in cells.
+        """
+        self._cell_size = cell_size
+        self._font_size = font_size
+        self._length = max(1, length)
+        self._rows = {glyph: row for row, glyph in enumerate(self.GLYPHS)}
+        self._texture = None
+        self._sources = {}
+        self._tints = {}
+
+    # method to draw a glyph in many cells
+    def draw(self, text, color, cells):
+        """Draws the glyph at the top left of each given cell, a run of neighbouring cells along a
+        row at a time. Cells asked for twice are drawn once.
+
+        Args:
+            text (string): The glyph, one that has_glyph accepts.
+            color (Color): The color to draw it in.
+            cells (iterable): The (y, x) screen coordinates of each cell's top left.
+
+        Returns:
+            nothing
+        """
+        row = self._rows[text]
+        tint = self._tints.get(color)
+        if tint is None:
+            tint = self._tints[color] = pyray.Color(*color.to_tuple())
+        run_x = run_y = None
+        length = 0
+        step = self._cell_size
+        for y, x in sorted(cells):
+            if y == run_y and x < run_x + length * step:
+                continue
+            if y == run_y and x == run_x + length * step and length < self._length:
+                length += 1
+                continue
+            if length:
+                self._draw_run(row, length, run_x, run_y, tint)
+            run_x, run_y, length = x, y, 1
+        if length:
+            self._draw_run(row, length, run_x, run_y, tint)
+
+    # method to check for a glyph
+    def has_glyph(self, text, font_size):
+        """Whether or not the atlas is loaded and holds the given text at the given size.
+
+        Args:
+            text (string): The text.
+            font_size (int): The font size.
+
+        Returns:
+            bool: True if the atlas can draw it; False if otherwise.
+        """
+        return self._texture is not None and font_size == self._font_size and text in self._rows
+
+    # method to draw the glyphs into the atlas
+    def load(self):
+        """Draws every glyph, in white, across its row of a new atlas texture. This must be called
+        once the window is open, outside of the frame's drawing.
+
+        Returns:
+            nothing
+        """
+        if self._texture is not None:
+            return
+        step = self._cell_size
+        self._texture = pyray.load_render_texture(self._length * step, len(self.GLYPHS) * step)
+        pyray.begin_texture_mode(self._texture)
+        pyray.clear_background(pyray.BLANK)
+        for glyph, row in self._rows.items():
+            for n in range(self._length):
+                pyray.draw_text(glyph, n * step, row * step, self._font_size, pyray.WHITE)
+        pyray.end_texture_mode()
+
+    # method to release the atlas
+    def unload(self):
+        """Releases the atlas texture.
+
+        Returns:
+            nothing
+        """
+        if self._texture is not None:
+            pyray.unload_render_texture(self._texture)
+            self._texture = None
+            self._sources = {}
+            self._tints = {}
+
+    # method to copy one run out of the atlas
+    def _draw_run(self, row, length, x, y, tint):
+        """Copies a run of one glyph from the atlas onto the screen.
+
+        Args:
+            row (int): The glyph's atlas row.
+            length (int): The number of cells in the run.
+            x (int): The screen x of the run's first cell.
+            y (int): The screen y of the run's first cell.
+            tint: The raylib color to draw in.
+
+        Returns:
+            nothing
+        """
+        source = self._sources.get((row, length))
+        if source is None:
+            # render textures are stored upside down, so read the row from the bottom with a
+            # negative height
+            step = self._cell_size
+            top = self._texture.texture.height - (row + 1) * step
+            source = self._sources[(row, length)] = pyray.Rectangle(0, top, length * step, -step)
+        pyray.draw_texture_rec(self._texture.texture, source, pyray.Vector2(x, y), tint)
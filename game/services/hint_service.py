@@ -0,0 +1,94 @@
+"""
+file: hint_service.py
+author: Jerry Lane
+purpose: This class shades the enemy field by how likely each cell is to
+hold a ship, as a hint for the player.
+"""
+# import the density map and Color
+from game.casting.density_map import DensityMap
+from game.shared.color import Color
+
+# class declaration
+class HintService:
+    """Works out the player's heat map.
+
+    The responsibility of a HintService is to keep a DensityMap of the enemy board from the
+    player's side, brought up to date only when the player has fired, and to turn it into a shade
+    for each open cell: the more ways the enemy ships could lie across a cell, the brighter it is.
+    While a hit ship is still afloat, only the cells on places through its hits are shaded. The
+    Director draws the shades into one retained layer, redrawn only when the version changes.
+
+    Boards too large to hold as bitboards get no hints.
+
+    Attributes:
+        _group (string): The group whose board is hinted at.
+        _map (DensityMap): The density map of the board, or None until the first update.
+        _version (int): A counter bumped whenever the shades change.
+    """
+
+    # the number of brightness steps, and the shade of each
+    LEVELS = 8
+    SHADES = [Color(255, 160, 0, 20 * level) for level in range(LEVELS + 1)]
+
+    # default constructor
+    def __init__(self, group = "enemy_ships"):
+        """Constructs a new HintService.
+        
+        Args:
+            group (string): The group whose board is hinted at.
+
+        Returns:
+            nothing
+        """
+        self._group = group
+        self._map = None
+        self._version = 0
+
+    # method to list the shaded cells
+    def get_shades(self):
+        """Gets the shade of every open cell that could hold a ship.
+
+        Returns:
+            generator: The (Point, Color) of each shaded cell, the point at its top left.
+        """
+        if self._map is None:
+            return
+        planes = self._map.get_target_planes() or self._map.get_planes()
+        counts = self._map.get_counts(planes)
+        board = self._map.get_board()
+        cells = list(board.get_indexes(self._map.get_open_cells()))
+        most = max((counts[index] for index in cells), default = 0)
+        if most == 0:
+            return
+        for index in cells:
+            if counts[index] > 0:
+                level = -(-counts[index] * self.LEVELS // most)
+                yield (board.get_position(index), self.SHADES[level])
+
+    # method to return the version
+    def get_version(self):
+        """Gets a counter that changes whenever the shades do.
+
+        Returns:
+            integer: The version.
+        """
+        return self._version
+
+    # method to take in the player's shots
+    def update(self, cast):
+        """Brings the density map up to date with the board, bumping the version if it changed.
+
+        Args:
+            cast (Cast): The cast of actors.
+
+        Returns:
+            nothing
+        """
+        board = cast.get_board(self._group)
+        if board is None or board.is_sparse():
+            return
+        if self._map is None or self._map.get_board() is not board:
+            self._map = DensityMap(board)
+            self._version += 1
+        elif self._map.update():
+            self._version += 1
@@ -3,44 +3,138 @@ file: keyboard_service.py
 author: authors of rfk and Jerry Lane
 purpose: This class represents the keyboard input functions in the game.
 """
-# import pyray for input function and Point to track changes
-import pyray
+# import the global values, time to pace key repeat, the stand-in for pyray for input functions,
+# which only loads raylib on first use, Point to track changes, and the snapshot each frame is read into
+import globals
+import time
+from game.shared.input_snapshot import InputSnapshot
+from game.shared.lazy_module import LazyModule
 from game.shared.point import Point
+pyray = LazyModule("pyray")
 
 # class declaration
 class KeyboardService:
-    """Detects player input. 
-    
-    The responsibility of a KeyboardService is to detect player key presses and translate them into 
-    a point representing a direction.
+    """Detects player input.
+
+    The responsibility of a KeyboardService is to read the keyboard once a frame into an
+    InputSnapshot: the keys down, and every press, release and repeat since the frame before.
+    Presses are taken from raylib's queue of keys pressed since the last frame, so a key pressed
+    and released between two frames still counts. Only keys that were down or were just pressed
+    are then asked about, so a frame with no keys touched costs one call into raylib. A held arrow
+    key repeats after the repeat delay, then at the repeat rate, by the clock rather than by frames,
+    so the cursor moves as fast at a low frame rate as at a high one.
 
     Attributes:
-        cell_size (int): For scaling directional input to a grid.
-        enter_key_up (bool): For checking Enter key up
-        enter_key_down (bool): For checking Enter key down
+        _cell_size (int): For scaling directional input to a grid.
+        _repeat_delay (float): The seconds an arrow key is held before it repeats.
+        _repeat_rate (float): The repeats a second after that.
+        _codes (dict): The raylib code of each key { key: code, value: name }, read on first use.
+        _down (set): The keys down at the last snapshot.
+        _repeat_at (dict): When each held arrow key next repeats { key: name, value: seconds }
+        _snapshot (InputSnapshot): The last snapshot taken.
     """
 
+    # the keys the game reads, by name, and the raylib constant for each
+    KEYS = {"left": "KEY_LEFT", "right": "KEY_RIGHT", "up": "KEY_UP", "down": "KEY_DOWN", "enter": "KEY_ENTER", "save": "KEY_F5"}
+
+    # the arrow keys and the cursor step each one makes
+    ARROWS = {"left": (-1, 0), "right": (1, 0), "up": (0, -1), "down": (0, 1)}
+
     # default constructor
-    def __init__(self, cell_size = 1):
+    def __init__(self, cell_size = 1, repeat_delay = globals.REPEAT_DELAY, repeat_rate = globals.REPEAT_RATE):
         """Constructs a new KeyboardService using the specified cell size.
-        
+
         Args:
             cell_size (int): The size of a cell in the display grid.
+            repeat_delay (float): The seconds an arrow key is held before it repeats.
+            repeat_rate (float): The repeats a second after that.
 
         Returns:
             nothing
         """
         self._cell_size = cell_size
-        self._enter_key_up = False
-        self._enter_key_down = False
+        self._repeat_delay = repeat_delay
+        self._repeat_rate = repeat_rate
+        self._codes = None
+        self._down = set()
+        self._repeat_at = {}
+        self._snapshot = InputSnapshot((), (), (), Point(0, 0))
+
+    # method to read the keyboard for a frame
+    def capture(self):
+        """Reads the keyboard into a new snapshot, which is kept until the next one. This should be
+        called once a frame, at the start of the game's input phase.
+
+        Args:
+            none
 
-    # method to return the direction based on cursor key pressed
-    def get_direction(self):
-        """Gets the selected direction based on the currently pressed keys.
+        Returns:
+            InputSnapshot: The keys down, and every key event since the last snapshot.
+        """
+        if self._codes is None:
+            self._codes = {getattr(pyray, constant): key for key, constant in self.KEYS.items()}
+        now = time.perf_counter()
+
+        # the presses raylib queued since the last frame, in order
+        pressed = []
+        code = pyray.get_key_pressed()
+        while code:
+            if code in self._codes:
+                pressed.append(self._codes[code])
+            code = pyray.get_key_pressed()
+
+        # the keys down now, asking only about those held or just pressed
+        down = set()
+        for code, key in self._codes.items():
+            if (key in self._down or key in pressed) and pyray.is_key_down(code):
+                down.add(key)
+
+        # releases of keys that were held, then each press, released again if it was not the key's last or
+        # the key is up now
+        events = []
+        for key in self.KEYS:
+            if key in self._down and (key in pressed or key not in down):
+                events.append((key, "released"))
+        for n, key in enumerate(pressed):
+            events.append((key, "pressed"))
+            if key in pressed[n + 1:] or key not in down:
+                events.append((key, "released"))
+
+        # repeats of arrow keys held since before this frame
+        for key in self.ARROWS:
+            if key not in down:
+                self._repeat_at.pop(key, None)
+            elif key in pressed or key not in self._repeat_at:
+                self._repeat_at[key] = now + self._repeat_delay
+            else:
+                events.extend(self._repeat(key, now))
+
+        # the cursor step of each arrow press and repeat, and the direction of the arrows held
+        steps = [Point(*self.ARROWS[key]).scale(self._cell_size) for key, kind in events \
+            if key in self.ARROWS and kind != "released"]
+        self._down = down
+        self._snapshot = InputSnapshot(down, events, steps, self._get_direction(down))
+        return self._snapshot
+
+    # method to return the last snapshot
+    def get_snapshot(self):
+        """Gets the snapshot taken by the last call to capture, without reading the keyboard.
 
         Args:
             none
 
+        Returns:
+            InputSnapshot: The last snapshot, or an empty one before the first.
+        """
+        return self._snapshot
+
+    # method to return the direction of the arrow keys held
+    def _get_direction(self, down):
+        """Gets the direction of the given arrow keys held. Right wins over left and down over up.
+
+        Args:
+            down (set): The keys down.
+
         Returns:
             Point: The selected direction.
         """
@@ -49,16 +143,16 @@ class KeyboardService:
         dy = 0
 
         # change x and y values depending on keys pressed
-        if pyray.is_key_down(pyray.KEY_LEFT):
+        if "left" in down:
             dx = -1
-        
-        if pyray.is_key_down(pyray.KEY_RIGHT):
+
+        if "right" in down:
             dx = 1
-        
-        if pyray.is_key_down(pyray.KEY_UP):
+
+        if "up" in down:
             dy = -1
-        
-        if pyray.is_key_down(pyray.KEY_DOWN):
+
+        if "down" in down:
             dy = 1
 
         # set direction change, if any, in a Point, scale it to the grid, and return
@@ -66,41 +160,26 @@ class KeyboardService:
         direction = direction.scale(self._cell_size)
         return direction
 
-    # method to read the Enter key
-    def get_enter_key_state(self):
-        """Gets the state of the Enter key and returns it.
+    # method to work out a held key's repeats
+    def _repeat(self, key, now):
+        """Gets the repeats of a held arrow key that fell due by the given time. After a stall, no
+        more than globals.MAX_LAG seconds of repeats are made, so the cursor does not race to catch up.
 
         Args:
-            none
-
-        Return:
-            (bool) True if Enter key is pressed
-            (bool) False if Enter key is up
-        """
-        # set initial state of Enter key
-        self._enter_key_down = False
+            key (string): The arrow key's name.
+            now (float): The time of this frame, in seconds.
 
-        # if Enter key is pressed, set flag and return
-        if pyray.is_key_down(pyray.KEY_ENTER):
-            self._enter_key_down = True
-        return self._enter_key_down
-
-    # method to check if the Enter key is up
-    def is_enter_key_up(self):
-        """Gets the state of the Enter key and returns it.
-
-        Args:
-            none
-
-        Return:
-            (bool) True if Enter key is up
-            (bool) False if Enter key is pressed
+        Returns:
+            list: A (key, "repeat") event for each repeat due.
         """
-        # set initial state of Enter key
-        self._enter_key_up = False
-
-        # if Enter key is up, set flag and return
-        if pyray.is_key_up(pyray.KEY_ENTER):
-            self._enter_key_up = True
-        return self._enter_key_up
-        
\ No newline at end of file
+        interval = 1 / self._repeat_rate
+        if now < self._repeat_at[key]:
+            return []
+        count = int((now - self._repeat_at[key]) / interval) + 1
+        limit = max(1, round(globals.MAX_LAG / interval))
+        if count > limit:
+            count = limit
+            self._repeat_at[key] = now + interval
+        else:
+            self._repeat_at[key] += count * interval
+        return [(key, "repeat")] * count
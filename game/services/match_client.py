@@ -0,0 +1,128 @@
+"""
+file: match_client.py
+author: Jerry Lane
+purpose: This class is the player's end of a connection to a match
+server, read once a frame without ever waiting on the network.
+"""
+# import modules
+import socket
+
+# class declaration
+class MatchClient:
+    """Talks to a MatchServer.
+
+    The responsibility of a MatchClient is to send the player's messages to the server and hand back
+    whole lines as they arrive. The socket never blocks after connecting, so polling it once a
+    frame costs next to nothing when there is nothing to read.
+
+    Attributes:
+        _host (string): The server's address.
+        _port (int): The server's port.
+        _socket (socket): The connection, or None until connected or once closed.
+        _buffer (bytes): Received bytes not yet ending in a newline.
+    """
+
+    # the most bytes read from the socket a poll
+    READ_SIZE = 65536
+
+    # default constructor
+    def __init__(self, host, port):
+        """Constructs a new MatchClient for the given server.
+        
+        Args:
+            host (string): The server's address.
+            port (int): The server's port.
+        """
+        self._host = host
+        self._port = port
+        self._socket = None
+        self._buffer = b""
+
+    # method to hang up
+    def close(self):
+        """Closes the connection.
+
+        Returns:
+            nothing
+        """
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    # method to dial the server
+    def connect(self, timeout = 5.0):
+        """Connects to the server, waiting at most the given time.
+
+        Args:
+            timeout (float): The seconds to wait for the server to answer.
+
+        Returns:
+            nothing
+
+        Raises:
+            OSError: If the server cannot be reached.
+        """
+        self._socket = socket.create_connection((self._host, self._port), timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket.setblocking(False)
+
+    # method to check the connection
+    def is_connected(self):
+        """Whether or not the connection is still open.
+
+        Returns:
+            bool: True if connected; False if otherwise.
+        """
+        return self._socket is not None
+
+    # method to read whatever has arrived
+    def poll(self):
+        """Reads whatever the server has sent since the last poll, without waiting.
+
+        Returns:
+            list: The whole lines received, split into words. The connection is closed if the server
+                hung up.
+        """
+        if self._socket is None:
+            return []
+        try:
+            data = self._socket.recv(self.READ_SIZE)
+            if not data:
+                self.close()
+        except (BlockingIOError, InterruptedError):
+            data = b""
+        except OSError:
+            self.close()
+            data = b""
+        *lines, self._buffer = (self._buffer + data).split(b"\n")
+        return [line.decode("ascii", "replace").split() for line in lines]
+
+    # method to send a message
+    def send(self, *words):
+        """Sends one message to the server.
+
+        Args:
+            words: The words of the message.
+
+        Returns:
+            nothing
+        """
+        if self._socket is None:
+            return
+        try:
+            self._socket.sendall((" ".join(str(word) for word in words) + "\n").encode("ascii"))
+        except OSError:
+            self.close()
+
+# address parser function
+def parse_address(text):
+    """
+    parameters: text (String) - a server address as HOST:PORT
+    return: (tuple) - the host and port
+    purpose: This function reads a --connect option, raising ValueError
+    if it is not a host and port.
+    """
+    host, colon, port = text.rpartition(":")
+    if not colon or not host or not port.isdigit() or not 0 < int(port) < 65536:
+        raise ValueError(f"not a HOST:PORT address: {text}")
+    return (host, int(port))
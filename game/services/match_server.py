@@ -0,0 +1,298 @@
+"""
+file: match_server.py
+author: Jerry Lane
+purpose: This class hosts games between people over TCP, many matches
+at once on one asyncio event loop.
+"""
+# import modules
+import asyncio
+import random
+from game.casting.match import Match
+
+# class declaration
+class MatchServer:
+    """Hosts matches between people.
+
+    The responsibility of a MatchServer is to accept players, pair them up two at a time into a
+    Match, and pass shots and results between them. Everything runs on one asyncio event loop: each
+    shot is a few bitboard operations and a write, so no player ever holds up the rest.
+
+    The protocol is one line of ASCII words per message. A player sends:
+        JOIN                    ask for an opponent
+        FIRE <col> <row>        fire at a cell of the opponent's board, on your turn
+        QUIT                    leave
+    and is sent:
+        WAIT                    waiting for an opponent
+        START <match> <cols> <rows>, then SHIP <col> <row> <length> <V|H> for each of your ships
+        TURN                    it is your turn
+        RESULT <col> <row> <MISS|HIT|SUNK>      what your shot did
+        INCOMING <col> <row> <MISS|HIT|SUNK>    what your opponent's shot did
+        WIN or LOSE             the match is over
+        ERROR <message>         the last message was refused; nothing changed
+
+    Attributes:
+        _host (string): The address to listen on.
+        _port (int): The port to listen on, 0 for any free one.
+        _seed (int): The seed matches are laid out from, or None for a random layout.
+        _server (Server): The asyncio server, or None until started.
+        _waiting (StreamWriter): The player waiting for an opponent, or None.
+        _seats (dict): The match and player number of each player in a match { key: writer, value: (match, player) }
+        _opponents (dict): Each player's opponent { key: writer, value: writer }
+        _next_id (int): The number of the next match.
+    """
+
+    # the write buffer size, in bytes, above which a player's handler waits for it to drain
+    HIGH_WATER = 65536
+
+    # default constructor
+    def __init__(self, host = "127.0.0.1", port = 8765, seed = None):
+        """Constructs a new MatchServer.
+        
+        Args:
+            host (string): The address to listen on.
+            port (int): The port to listen on, 0 for any free one.
+            seed (int): The seed matches are laid out from, or None for a random layout.
+        """
+        self._host = host
+        self._port = port
+        self._seed = seed
+        self._server = None
+        self._waiting = None
+        self._seats = {}
+        self._opponents = {}
+        self._next_id = 1
+
+    # method to stop listening
+    async def close(self):
+        """Stops accepting players and waits for the server to close.
+
+        Returns:
+            nothing
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    # method to return the number of matches on
+    def get_match_count(self):
+        """Gets the number of matches being played.
+
+        Returns:
+            integer: The number of matches.
+        """
+        return len(self._seats) // 2
+
+    # method to return the port
+    def get_port(self):
+        """Gets the port the server is listening on, once started.
+
+        Returns:
+            integer: The port.
+        """
+        return self._server.sockets[0].getsockname()[1]
+
+    # method to run until cancelled
+    async def serve_forever(self):
+        """Starts the server if need be, then serves players until cancelled.
+
+        Returns:
+            nothing
+        """
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    # method to start listening
+    async def start(self):
+        """Starts accepting players.
+
+        Returns:
+            integer: The port the server is listening on.
+        """
+        self._server = await asyncio.start_server(self._serve, self._host, self._port)
+        return self.get_port()
+
+    # method to handle one message
+    def _handle(self, writer, words):
+        """Carries out one message from a player.
+
+        Args:
+            writer (StreamWriter): The player's connection.
+            words (list): The words of the message.
+
+        Returns:
+            bool: False if the player is leaving; True if otherwise.
+        """
+        command = words[0].upper() if words else ""
+        if command == "JOIN":
+            self._join(writer)
+        elif command == "FIRE":
+            self._fire(writer, words[1:])
+        elif command == "QUIT":
+            return False
+        else:
+            self._send(writer, f"ERROR unknown command {command or '(blank)'}")
+        return True
+
+    # method to fire a player's shot
+    def _fire(self, writer, words):
+        """Resolves a FIRE message, telling both players what happened.
+
+        Args:
+            writer (StreamWriter): The player's connection.
+            words (list): The column and row.
+
+        Returns:
+            nothing
+        """
+        if writer not in self._seats:
+            self._send(writer, "ERROR not in a match")
+            return
+        match, player = self._seats[writer]
+        try:
+            col, row = (int(word) for word in words)
+            result = match.fire(player, col, row)
+        except ValueError as error:
+            self._send(writer, f"ERROR {error}")
+            return
+
+        # tell both players, then either end the match or pass the turn
+        opponent = self._opponents[writer]
+        if match.get_winner() is None:
+            self._send(writer, f"RESULT {col} {row} {result}")
+            self._send(opponent, f"INCOMING {col} {row} {result}", "TURN")
+            return
+        self._send(writer, f"RESULT {col} {row} {result}", "WIN")
+        self._send(opponent, f"INCOMING {col} {row} {result}", "LOSE")
+        self._end(writer)
+
+    # method to take a player out of their match
+    def _end(self, writer):
+        """Forgets a match, given either of its players.
+
+        Args:
+            writer (StreamWriter): One player's connection.
+
+        Returns:
+            nothing
+        """
+        opponent = self._opponents.pop(writer, None)
+        self._seats.pop(writer, None)
+        if opponent is not None:
+            self._opponents.pop(opponent, None)
+            self._seats.pop(opponent, None)
+
+    # method to pair players up
+    def _join(self, writer):
+        """Handles a JOIN message: waits for an opponent, or starts a match with the one waiting.
+
+        Args:
+            writer (StreamWriter): The player's connection.
+
+        Returns:
+            nothing
+        """
+        if writer in self._seats or writer is self._waiting:
+            self._send(writer, "ERROR already joined")
+            return
+        if self._waiting is None or self._waiting.is_closing():
+            self._waiting = writer
+            self._send(writer, "WAIT")
+            return
+
+        # lay out a new match for the waiting player and this one
+        players = (self._waiting, writer)
+        self._waiting = None
+        rng = random.Random() if self._seed is None else random.Random(f"match-{self._seed}-{self._next_id}")
+        match = Match(self._next_id, rng)
+        self._next_id += 1
+        cols, rows = match.get_size()
+        for player, connection in enumerate(players):
+            self._seats[connection] = (match, player)
+            self._opponents[connection] = players[1 - player]
+            board_lines = [f"START {match.get_id()} {cols} {rows}"]
+            for col, row, length, vertical in match.get_ships(player):
+                board_lines.append(f"SHIP {col} {row} {length} {'V' if vertical else 'H'}")
+            if match.get_turn() == player:
+                board_lines.append("TURN")
+            self._send(connection, *board_lines)
+
+    # method to drop a player
+    def _leave(self, writer):
+        """Takes a player who left out of the queue or their match, which the opponent wins.
+
+        Args:
+            writer (StreamWriter): The player's connection.
+
+        Returns:
+            nothing
+        """
+        if writer is self._waiting:
+            self._waiting = None
+        if writer in self._seats:
+            match, player = self._seats[writer]
+            match.forfeit(player)
+            self._send(self._opponents[writer], "WIN")
+            self._end(writer)
+
+    # method to write lines to a player
+    def _send(self, writer, *lines):
+        """Queues lines to a player in one write. It never waits; the player's own handler waits
+        for the buffer to drain if it grows past HIGH_WATER.
+
+        Args:
+            writer (StreamWriter): The player's connection.
+            lines (string): The lines to send.
+
+        Returns:
+            nothing
+        """
+        if not writer.is_closing():
+            writer.write(("\n".join(lines) + "\n").encode("ascii"))
+
+    # method to serve one player
+    async def _serve(self, reader, writer):
+        """Reads and carries out one player's messages until they quit or the connection drops.
+
+        Args:
+            reader (StreamReader): The player's incoming messages.
+            writer (StreamWriter): The player's connection.
+
+        Returns:
+            nothing
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line or not self._handle(writer, line.decode("ascii", "replace").split()):
+                    break
+                if writer.transport.get_write_buffer_size() > self.HIGH_WATER:
+                    await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self._leave(writer)
+            writer.close()
+
+# server entry point
+def main(args = None):
+    """
+    parameters: args[] (List) - command line arguments, after the word serve
+    return: nothing
+    purpose: This function reads the server options and hosts matches
+    until interrupted.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(prog = "battleships serve", \
+        description = "Host games between people over TCP.")
+    parser.add_argument("--host", default = "127.0.0.1", help = "address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type = int, default = 8765, help = "port to listen on (default: 8765)")
+    parser.add_argument("--seed", type = int, default = None, help = "seed the matches are laid out from (default: random)")
+    options = parser.parse_args(args)
+
+    server = MatchServer(options.host, options.port, options.seed)
+    print(f"serving matches on {options.host}:{options.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
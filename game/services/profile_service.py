@@ -0,0 +1,153 @@
+"""
+file: profile_service.py
+author: Jerry Lane
+purpose: This class records how long each phase of a frame takes.
+"""
+# import array for the ring buffers and time for the clock
+import time
+from array import array
+
+# class declaration
+class ProfileService:
+    """Times the phases of each frame.
+
+    The responsibility of a ProfileService is to keep the most recent wall times of each phase of
+    the game loop in fixed-size ring buffers, so it can run for hours without growing, and to
+    report the percentiles of those times on screen or to a file. The frame time is the work of a
+    frame alone; the sleep holding the frame rate is recorded as its own phase, wait, so a frame
+    that grows slower shows up however much of the frame is spent waiting.
+
+    Attributes:
+        _capacity (int): The number of frames kept per phase.
+        _path (string): The file the report is written to on exit, or None.
+        _overlay (bool): Whether or not to show the overlay on screen.
+        _samples (dict): The ring buffer of each phase { key: phase, value: array of seconds }
+        _counts (dict): The number of samples ever recorded for each phase { key: phase, value: int }
+        _frame_start (float): When the current frame started.
+    """
+
+    # the phases in the order they are reported
+    PHASES = ("frame", "inputs", "updates", "outputs", "layers", "clear", "draw", "flush", "wait")
+
+    # default constructor
+    def __init__(self, capacity = 1024, path = None, overlay = False):
+        """Constructs a new ProfileService.
+        
+        Args:
+            capacity (int): The number of frames kept per phase.
+            path (string): The file to write the report to on exit, or None.
+            overlay (bool): Whether or not to show the overlay on screen.
+
+        Returns:
+            nothing
+        """
+        self._capacity = capacity
+        self._path = path
+        self._overlay = overlay
+        self._samples = {phase: array("d", bytes(8 * capacity)) for phase in self.PHASES}
+        self._counts = {phase: 0 for phase in self.PHASES}
+        self._frame_start = 0.0
+
+    # method to write the report to its file
+    def dump(self):
+        """Writes the report to the file given at construction, if any.
+
+        Returns:
+            nothing
+        """
+        if self._path is not None:
+            with open(self._path, "w") as report:
+                report.write(self.to_report() + "\n")
+
+    # method to mark the end of a frame
+    def end_frame(self):
+        """Records the wall time since start_frame as the frame time. This should be called before
+        waiting for the next frame, so the wait is left out.
+
+        Returns:
+            nothing
+        """
+        self.record("frame", time.perf_counter() - self._frame_start)
+
+    # method to return the overlay text
+    def get_overlay_text(self):
+        """Gets a one-line summary of the frame times for the on-screen overlay.
+
+        Returns:
+            string: The summary.
+        """
+        stats = self.get_stats("frame")
+        if stats is None:
+            return "frame: no samples"
+        return f"frame ms p50 {stats['p50'] * 1000:.2f} p95 {stats['p95'] * 1000:.2f} " \
+            f"p99 {stats['p99'] * 1000:.2f} max {stats['max'] * 1000:.2f}"
+
+    # method to return the percentiles of one phase
+    def get_stats(self, phase):
+        """Gets the percentiles of the recorded times for one phase.
+
+        Args:
+            phase (string): The name of the phase.
+
+        Returns:
+            dict: The 'p50', 'p95', 'p99' and 'max' times in seconds, and the 'samples' counted,
+            or None if the phase has no samples.
+        """
+        count = min(self._counts[phase], self._capacity)
+        if count == 0:
+            return None
+        times = sorted(self._samples[phase][:count])
+        return {
+            "samples": count,
+            "p50": times[int(0.50 * (count - 1))],
+            "p95": times[int(0.95 * (count - 1))],
+            "p99": times[int(0.99 * (count - 1))],
+            "max": times[-1],
+        }
+
+    # method to check whether the overlay is on
+    def is_overlay_on(self):
+        """Whether or not the overlay should be shown.
+
+        Returns:
+            bool: True if the overlay is on; false if otherwise.
+        """
+        return self._overlay
+
+    # method to store one time
+    def record(self, phase, seconds):
+        """Stores a wall time for a phase, overwriting the oldest once the buffer is full.
+
+        Args:
+            phase (string): The name of the phase.
+            seconds (float): The time the phase took.
+
+        Returns:
+            nothing
+        """
+        self._samples[phase][self._counts[phase] % self._capacity] = seconds
+        self._counts[phase] += 1
+
+    # method to mark the start of a frame
+    def start_frame(self):
+        """Notes the time the current frame started.
+
+        Returns:
+            nothing
+        """
+        self._frame_start = time.perf_counter()
+
+    # method to describe every phase
+    def to_report(self):
+        """Gets the percentiles of every phase as a table for printing.
+
+        Returns:
+            string: The report, times in milliseconds.
+        """
+        lines = [f"{'phase':<8} {'samples':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"]
+        for phase in self.PHASES:
+            stats = self.get_stats(phase)
+            if stats is not None:
+                lines.append(f"{phase:<8} {stats['samples']:>8} {stats['p50'] * 1000:>8.3f} " \
+                    f"{stats['p95'] * 1000:>8.3f} {stats['p99'] * 1000:>8.3f} {stats['max'] * 1000:>8.3f}")
+        return "\n".join(lines)
@@ -0,0 +1,72 @@
+"""
+file: random_shot_service.py
+author: Jerry Lane
+purpose: This class picks the player's shots at random for headless games.
+"""
+# import global values, random, and Point
+import globals
+import random
+from game.shared.point import Point
+
+# class declaration
+class RandomShotService:
+    """Picks shots for a player who is not at the keyboard.
+
+    The responsibility of a RandomShotService is to choose the next cell in the enemy field to fire
+    at, never firing at the same cell twice. A field larger than globals.SPARSE_CELLS is not listed
+    out; random cells are drawn instead, skipping any already fired at.
+
+    Attributes:
+        _rng (Random): The random number generator used to order the shots.
+        _cells (list): The enemy field cells not yet fired at, or None on a large field.
+        _fired (set): The cells already fired at on a large field, or None.
+        _cols (int): The number of columns in the enemy field.
+        _rows (int): The number of rows in the enemy field.
+    """
+
+    # default constructor
+    def __init__(self, rng = None):
+        """Constructs a new RandomShotService covering the whole enemy field.
+        
+        Args:
+            rng (Random): An optional random number generator.
+
+        Returns:
+            nothing
+        """
+        self._rng = rng if rng is not None else random.Random()
+        self._cols = globals.COLS
+        self._rows = globals.ROWS // 2
+        self._cells = None
+        self._fired = None
+        if self._cols * self._rows > globals.SPARSE_CELLS:
+            self._fired = set()
+        else:
+            self._cells = [(col, row) for row in range(self._rows) for col in range(self._cols)]
+            self._rng.shuffle(self._cells)
+
+    # method to choose the next shot
+    def next_shot(self, cast):
+        """Gets the position of the next shot.
+
+        Args:
+            cast (Cast): The cast of actors.
+
+        Returns:
+            Point: Where to fire, or None if every cell has been fired at.
+        """
+        # on a large field, draw until a new cell comes up
+        if self._fired is not None:
+            if len(self._fired) >= self._cols * self._rows:
+                return None
+            cell = (self._rng.randrange(self._cols), self._rng.randrange(self._rows))
+            while cell in self._fired:
+                cell = (self._rng.randrange(self._cols), self._rng.randrange(self._rows))
+            self._fired.add(cell)
+            col, row = cell
+            return Point(col, row).scale(globals.CELL_SIZE)
+
+        if not self._cells:
+            return None
+        col, row = self._cells.pop()
+        return Point(col, row).scale(globals.CELL_SIZE)
@@ -0,0 +1,47 @@
+"""
+file: random_volley_service.py
+author: Jerry Lane
+purpose: This class aims the enemy's volleys at random cells in defender
+territory.
+"""
+# import random
+import random
+
+# class declaration
+class RandomVolleyService:
+    """Aims the enemy's return fire by scattershot.
+
+    The responsibility of a RandomVolleyService is to choose the cells each enemy volley lands on,
+    drawing them at random, with repeats, from the whole of defender territory. This is the enemy
+    the game has always had.
+
+    Attributes:
+        _rng (Random): The random number generator the targets are drawn with.
+    """
+
+    # default constructor
+    def __init__(self, rng = None):
+        """Constructs a new RandomVolleyService.
+        
+        Args:
+            rng (Random): The game's random number generator, a new one if not given.
+
+        Returns:
+            nothing
+        """
+        self._rng = rng if rng is not None else random.Random()
+
+    # method to aim a volley
+    def next_volley(self, board, count):
+        """Gets the cells the next volley lands on.
+
+        Args:
+            board (Board or SparseBoard): The defense board being fired at.
+            count (int): The number of shots in the volley.
+
+        Returns:
+            list: The cell index of each shot.
+        """
+        first_row = board.get_row_offset()
+        last_row = first_row + board.get_rows() - 2
+        return board.draw_targets(count, 1, board.get_cols() - 1, first_row, last_row, self._rng)
@@ -0,0 +1,269 @@
+"""
+file: replay_service.py
+author: Jerry Lane
+purpose: This class records a game's seed and shots to a compact binary
+log and plays logs back headless to check they end the same way.
+"""
+# import modules
+import globals
+import hashlib
+import random
+import struct
+import sys
+from array import array
+from game.shared.point import Point
+
+# class declaration
+class ReplayService:
+    """Records and plays back games.
+
+    The responsibility of a ReplayService is to keep the seed of a game and the cells the player
+    fired at, and to write them as a replay log. Since every other random choice in the game comes
+    from the seeded generator, the seed and the shots are enough to play the game again exactly.
+
+    The log is little-endian: a header (magic b"BSRP", format version, seed, the columns and rows
+    of each side's board, the enemy's name, shot count), two unsigned 32-bit values (column, row)
+    per shot, and a footer with the winner, the number of turns, and a SHA-256 digest of both fleet
+    boards at the end of the game. The log holds everything needed to play the game again.
+
+    Attributes:
+        _seed (int): The seed the game was played from.
+        _path (string): The file the log is written to, or None.
+        _enemy (string): How the enemy aimed, one of game_setup.ENEMIES.
+        _board_size (tuple): The columns and rows of each side's board, or None until the game is logged or loaded.
+        _shots (array): The column and row of each shot, in order.
+    """
+
+    # file layout
+    MAGIC = b"BSRP"
+    VERSION = 2
+    HEADER = struct.Struct("<4sHQII16sI")
+    FOOTER = struct.Struct("<BI32s")
+    WINNERS = (None, "player", "enemy")
+
+    # default constructor
+    def __init__(self, seed, path = None, enemy = "random"):
+        """Constructs a new ReplayService for a game played from the given seed.
+        
+        Args:
+            seed (int): The seed the game is played from, 0 to 2 ** 64 - 1.
+            path (string): The file to write the log to when the game ends, or None.
+            enemy (string): How the enemy aims in the game, one of game_setup.ENEMIES.
+
+        Returns:
+            nothing
+        """
+        self._seed = seed
+        self._path = path
+        self._enemy = enemy
+        self._board_size = None
+        self._shots = array("I")
+
+    # method to return the board size
+    def get_board_size(self):
+        """Gets the size of each side's board the game was played on.
+
+        Returns:
+            Tuple(int, int): The columns and rows, or None before the game is logged or loaded.
+        """
+        return self._board_size
+
+    # method to fingerprint the end of a game
+    def get_digest(self, cast):
+        """Gets a SHA-256 digest of both fleet boards' ships, hits and misses.
+
+        Args:
+            cast (Cast): The cast of actors.
+
+        Returns:
+            bytes: The 32 byte digest.
+        """
+        digest = hashlib.sha256()
+        for group in ("enemy_ships", "defense_ships"):
+            for bits in cast.get_board(group).get_state():
+                digest.update(bits.to_bytes((bits.bit_length() + 7) // 8 + 1, "little"))
+        return digest.digest()
+
+    # method to return the enemy
+    def get_enemy(self):
+        """Gets how the enemy aimed in the game.
+
+        Returns:
+            string: One of game_setup.ENEMIES.
+        """
+        return self._enemy
+
+    # method to return the recorded shots
+    def get_shots(self):
+        """Gets the positions of the recorded shots, in order.
+
+        Returns:
+            list: The screen coordinates (Point) of each shot.
+        """
+        return [Point(self._shots[n], self._shots[n + 1]).scale(globals.CELL_SIZE) \
+            for n in range(0, len(self._shots), 2)]
+
+    # method to return the seed
+    def get_seed(self):
+        """Gets the seed the game is played from.
+
+        Returns:
+            integer: The seed.
+        """
+        return self._seed
+
+    # method to record one shot
+    def record(self, position):
+        """Adds the player's shot at the given position to the log.
+
+        Args:
+            position (Point): The screen coordinates of the shot.
+
+        Returns:
+            nothing
+        """
+        self._shots.append(int(position.get_x() // globals.CELL_SIZE))
+        self._shots.append(int(position.get_y() // globals.CELL_SIZE))
+
+    # method to write the log
+    def save(self, cast, result):
+        """Writes the log to the file given at construction, if any.
+
+        Args:
+            cast (Cast): The cast of actors at the end of the game.
+            result (GameResult): The outcome of the game.
+
+        Returns:
+            nothing
+        """
+        if self._path is None:
+            return
+        with open(self._path, "wb") as log:
+            log.write(self.to_bytes(cast, result))
+
+    # method to build the log
+    def to_bytes(self, cast, result):
+        """Gets the log as bytes.
+
+        Args:
+            cast (Cast): The cast of actors at the end of the game.
+            result (GameResult): The outcome of the game.
+
+        Returns:
+            bytes: The whole log.
+        """
+        board = cast.get_board("enemy_ships")
+        self._board_size = (board.get_cols(), board.get_rows())
+        shots = array("I", self._shots)
+        if sys.byteorder == "big":
+            shots.byteswap()
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, self._seed, *self._board_size, \
+            self._enemy.encode("ascii"), len(shots) // 2)
+        footer = self.FOOTER.pack(self.WINNERS.index(result.get_winner()), result.get_turns(), self.get_digest(cast))
+        return header + shots.tobytes() + footer
+
+    # method to read a log
+    @classmethod
+    def load(cls, data):
+        """Reads a log back.
+
+        Args:
+            data (bytes): The whole log.
+
+        Returns:
+            Tuple(ReplayService, string, int, bytes): The replay, holding the seed, board size,
+            enemy and shots, and the winner, turns and digest the game ended with.
+
+        Raises:
+            ValueError: If the data is not a replay log this version can read.
+        """
+        if len(data) < cls.HEADER.size + cls.FOOTER.size:
+            raise ValueError("replay log is too short")
+        magic, version, seed, cols, rows, enemy, count = cls.HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"not a version {cls.VERSION} replay log")
+        end = cls.HEADER.size + 8 * count
+        if len(data) != end + cls.FOOTER.size:
+            raise ValueError("replay log has the wrong length")
+        replay = cls(seed, enemy = enemy.rstrip(b"\0").decode("ascii", "replace"))
+        replay._board_size = (cols, rows)
+        replay._shots.frombytes(data[cls.HEADER.size:end])
+        if sys.byteorder == "big":
+            replay._shots.byteswap()
+        winner, turns, digest = cls.FOOTER.unpack_from(data, end)
+        return (replay, cls.WINNERS[winner], turns, digest)
+
+    # method to replay a log headless
+    @classmethod
+    def verify(cls, data):
+        """Plays a logged game again headless, at full speed, on the board size and against the
+        enemy the log names, and checks it ends the same way.
+
+        Args:
+            data (bytes): The whole log.
+
+        Returns:
+            bool: True if the winner, turns and final boards all match the log; False if otherwise.
+
+        Raises:
+            ValueError: If the data is not a replay log this version can read, or names a board
+                size or enemy this version cannot play.
+        """
+        # imported here, since the simulation itself imports this module's neighbours
+        from game.casting.board import set_board_size
+        from game.casting.game_setup import ENEMIES, create_cast, create_volley_service
+        from game.directing.simulation import Simulation
+        from game.services.scripted_shot_service import ScriptedShotService
+
+        replay, winner, turns, digest = cls.load(data)
+        cols, rows = replay.get_board_size()
+        if replay.get_enemy() not in ENEMIES:
+            raise ValueError(f"replay log names an unknown enemy: {replay.get_enemy()}")
+        if not (0 < cols <= globals.MAX_BOARD and 0 < rows <= globals.MAX_BOARD):
+            raise ValueError(f"replay log names a board size this version cannot play: {cols}x{rows}")
+
+        # play on the logged board size, putting the size back afterward
+        size = (globals.COLS, globals.ROWS // 2)
+        set_board_size(cols, rows)
+        try:
+            rng = random.Random(replay.get_seed())
+            cast = create_cast(rng)
+            simulation = Simulation(ScriptedShotService(replay.get_shots()), rng, \
+                volley_service = create_volley_service(replay.get_enemy(), rng))
+            result = simulation.run(cast, max_turns = turns)
+        finally:
+            set_board_size(*size)
+        return result.get_winner() == winner and result.get_turns() == turns and replay.get_digest(cast) == digest
+
+# replay entry point
+def main(args = None):
+    """
+    parameters: args[] (List) - command line arguments, after the word replay
+    return: (int) - 0 if every log replayed the same, 1 if otherwise
+    purpose: This function replays each given log headless, on the board
+    size and against the enemy it names, and reports whether it ended in
+    the same state.
+    """
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(prog = "battleships replay", \
+        description = "Play replay logs again headless and check they end the same way.")
+    parser.add_argument("logs", nargs = "+", help = "replay log files")
+    options = parser.parse_args(args)
+
+    failures = 0
+    start = time.perf_counter()
+    for path in options.logs:
+        with open(path, "rb") as log:
+            data = log.read()
+        try:
+            matched = ReplayService.verify(data)
+        except ValueError as error:
+            print(f"{path}: {error}")
+            matched = False
+        if not matched:
+            failures += 1
+            print(f"{path}: MISMATCH")
+    elapsed = time.perf_counter() - start
+    print(f"{len(options.logs) - failures} of {len(options.logs)} replays matched in {elapsed:.2f} s")
+    return 1 if failures else 0
@@ -0,0 +1,431 @@
+"""
+file: save_service.py
+author: Jerry Lane
+purpose: This class snapshots a game to a fixed-layout binary format and
+restores it again.
+"""
+# import modules
+import globals
+import struct
+import sys
+from array import array
+from functools import partial
+from game.casting.actor import Actor
+from game.casting.board import create_board
+from game.casting.cast import Cast
+from game.casting.game_setup import create_banners, create_cursor, create_dividers
+from game.casting.ship import Ship
+from game.shared.point import Point
+
+# class declaration
+class SaveService:
+    """Saves and loads whole games.
+
+    The responsibility of a SaveService is to turn a game's Director and Cast into bytes and back.
+    Only what cannot be rebuilt is stored: the turn counters and flags, the random number generator
+    state, the cursor and banner text, and each fleet board's ships and hit and miss bitboards. The
+    ship sections and shot marks on screen are only a view of the boards, so they are not stored,
+    and a loaded cast builds them from the boards the first time they are drawn. Everything is
+    little-endian and laid out in a fixed order:
+
+        header      magic b"BSSV", format version
+        counters    turns, shots, hits, enemy shots, enemy hits (uint32), flags (uint8)
+        generator   version (uint32), 625 words (uint32), gauss flag (uint8), gauss (double)
+        cursor      column, row (uint32)
+        banners     count (uint8), then length (uint16) and UTF-8 text for each
+        boards      for each fleet: row offset, columns, rows, ship count (uint16), storage (uint8),
+                    then first cell (uint32), length and direction (uint8) for each ship, then the
+                    hits and misses: for a bitboard Board, two bitboards (columns * rows bits each,
+                    rounded up to whole bytes); for a SparseBoard, hit count (uint32) and cells
+                    (uint32), then miss count and cells, so its saves stay small however large it is
+        strays      count (uint32), then column, row (uint16) for each shot marked off the boards
+
+    Attributes:
+        _path (string): The file games are saved to, or None.
+    """
+
+    # file layout
+    MAGIC = b"BSSV"
+    VERSION = 4
+    HEADER = struct.Struct("<4sH")
+    COUNTERS = struct.Struct("<IIIIIB")
+    GAUSS = struct.Struct("<Bd")
+    CURSOR = struct.Struct("<II")
+    BOARD = struct.Struct("<HHHHB")
+    SHIP = struct.Struct("<IBB")
+    COUNT = struct.Struct("<I")
+    SHORT = struct.Struct("<H")
+
+    # the fleets in the order they are stored, and the color each fleet's sections start out
+    GROUPS = ("enemy_ships", "defense_ships")
+    COLORS = (globals.RED, globals.GREEN)
+
+    # the flag set when misses are marked with artillery actors rather than drawn from the boards
+    ARTILLERY_FLAG = 1 << 4
+
+    # default constructor
+    def __init__(self, path = None):
+        """Constructs a new SaveService.
+
+        Args:
+            path (string): The file write saves games to, or None.
+
+        Returns:
+            nothing
+        """
+        self._path = path
+
+    # method to read the board size from a snapshot
+    def get_board_size(self, data):
+        """Gets the size of each side's board in a snapshot, so the game can be set up for it
+        before the snapshot is loaded.
+
+        Args:
+            data (bytes): The snapshot.
+
+        Returns:
+            Tuple(int, int): The columns and rows of each side's board.
+
+        Raises:
+            ValueError: If the data is not a snapshot this version can read.
+        """
+        try:
+            magic, version = self.HEADER.unpack_from(data, 0)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(f"not a version {self.VERSION} save")
+
+            # skip the fixed-size counters, generator and cursor, then the banners
+            offset = self.HEADER.size + self.COUNTERS.size + self.COUNT.size + 625 * 4 + self.GAUSS.size + self.CURSOR.size
+            count = data[offset]
+            offset += 1
+            for n in range(count):
+                offset += self.SHORT.size + self.SHORT.unpack_from(data, offset)[0]
+            row_offset, cols, rows, ships, sparse = self.BOARD.unpack_from(data, offset)
+            return (cols, rows)
+        except (struct.error, IndexError) as error:
+            raise ValueError(f"save data is damaged: {error}")
+
+    # method to save a game
+    def save(self, director, cast):
+        """Snapshots a game.
+
+        Args:
+            director (Director): The director playing the game.
+            cast (Cast): The cast of actors.
+
+        Returns:
+            bytes: The snapshot.
+
+        Raises:
+            ValueError: If a value in the game does not fit its field.
+        """
+        try:
+            return self._save(director, cast)
+        except (struct.error, OverflowError) as error:
+            raise ValueError(f"game does not fit the save format: {error}")
+
+    # method doing the work of save
+    def _save(self, director, cast):
+        """Snapshots a game; see save.
+
+        Args:
+            director (Director): The director playing the game.
+            cast (Cast): The cast of actors.
+
+        Returns:
+            bytes: The snapshot.
+        """
+        # the counters and flags, noting whether misses are marked with actors
+        counters, flags, rng_state = director.to_state()
+        artillery = cast.iter_actors("artillery")
+        flag_bits = sum(1 << n for n, flag in enumerate(flags) if flag)
+        if len(artillery) > 0:
+            flag_bits |= self.ARTILLERY_FLAG
+        parts = [self.HEADER.pack(self.MAGIC, self.VERSION), self.COUNTERS.pack(*counters, flag_bits)]
+
+        # the random number generator
+        version, words, gauss = rng_state
+        parts.append(self.COUNT.pack(version))
+        parts.append(self._pack_array("I", words))
+        parts.append(self.GAUSS.pack(gauss is not None, gauss or 0.0))
+
+        # the cursor and banners
+        cursor = cast.get_first_actor("cursors").get_position()
+        parts.append(self.CURSOR.pack(int(cursor.get_x() // globals.CELL_SIZE), int(cursor.get_y() // globals.CELL_SIZE)))
+        banners = [banner.get_text().encode("utf-8") for banner in cast.iter_actors("banners")]
+        parts.append(bytes([len(banners)]))
+        for text in banners:
+            parts.append(self.SHORT.pack(len(text)))
+            parts.append(text)
+
+        # the fleets, each ship as its first cell, length and direction
+        boards = [cast.get_board(group) for group in self.GROUPS]
+        for board in boards:
+            ships = board.get_ship_cells()
+            parts.append(self.BOARD.pack(board.get_row_offset(), board.get_cols(), board.get_rows(), \
+                len(ships), board.is_sparse()))
+            for cells in ships:
+                vertical = len(cells) > 1 and cells[1] - cells[0] != 1
+                parts.append(self.SHIP.pack(cells[0] if cells else 0, len(cells), vertical))
+            if board.is_sparse():
+                for cells in board.get_shot_cells():
+                    parts.append(self.COUNT.pack(len(cells)))
+                    parts.append(self._pack_array("I", cells))
+            else:
+                size = (board.get_cols() * board.get_rows() + 7) // 8
+                occupancy, hits, misses = board.get_state()
+                parts.append(hits.to_bytes(size, "little"))
+                parts.append(misses.to_bytes(size, "little"))
+
+        # the shots marked off the boards, only looked for when there are more marks than misses
+        cells = array("H")
+        if len(artillery) > sum(board.count_misses() for board in boards):
+            for shot in artillery:
+                position = shot.get_position()
+                if not any(self._is_miss(board, position) for board in boards):
+                    cells.append(int(position.get_x() // globals.CELL_SIZE))
+                    cells.append(int(position.get_y() // globals.CELL_SIZE))
+        parts.append(self.COUNT.pack(len(cells) // 2))
+        parts.append(self._pack_array("H", cells))
+        return b"".join(parts)
+
+    # method to load a game
+    def load(self, data, director):
+        """Restores a snapshot, loading the progress into the given director.
+
+        Args:
+            data (bytes): The snapshot.
+            director (Director): A new director to continue the game with.
+
+        Returns:
+            Cast: The restored cast of actors.
+
+        Raises:
+            ValueError: If the data is not a snapshot this version can read.
+        """
+        try:
+            return self._load(memoryview(data), director)
+        except (struct.error, IndexError) as error:
+            raise ValueError(f"save data is damaged: {error}")
+
+    # method doing the work of load
+    def _load(self, data, director):
+        """Restores a snapshot; see load.
+
+        Args:
+            data (memoryview): The snapshot.
+            director (Director): A new director to continue the game with.
+
+        Returns:
+            Cast: The restored cast of actors.
+        """
+        magic, version = self.HEADER.unpack_from(data, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"not a version {self.VERSION} save")
+        offset = self.HEADER.size
+
+        # the counters, flags and random number generator
+        *counters, flag_bits = self.COUNTERS.unpack_from(data, offset)
+        offset += self.COUNTERS.size
+        flags = tuple(bool(flag_bits >> n & 1) for n in range(4))
+        rng_version = self.COUNT.unpack_from(data, offset)[0]
+        offset += self.COUNT.size
+        words, offset = self._unpack_array("I", data, offset, 625)
+        has_gauss, gauss = self.GAUSS.unpack_from(data, offset)
+        offset += self.GAUSS.size
+        director.load_state((tuple(counters), flags, (rng_version, tuple(words), gauss if has_gauss else None)))
+
+        # the fixed scenery, cursor and banners
+        cast = Cast()
+        create_banners(cast)
+        create_cursor(cast)
+        create_dividers(cast)
+        x, y = self.CURSOR.unpack_from(data, offset)
+        offset += self.CURSOR.size
+        cast.get_first_actor("cursors").set_position(Point(x, y).scale(globals.CELL_SIZE))
+        banners = cast.get_actors("banners")
+        for n in range(data[offset]):
+            length = self.SHORT.unpack_from(data, offset + 1)[0]
+            text = bytes(data[offset + 3:offset + 3 + length]).decode("utf-8")
+            offset += 2 + length
+            if n < len(banners):
+                banners[n].set_text(text)
+        offset += 1
+
+        # the fleets, whose sections are built from the boards when first drawn
+        boards = []
+        for group, color in zip(self.GROUPS, self.COLORS):
+            row_offset, cols, rows, count, sparse = self.BOARD.unpack_from(data, offset)
+            offset += self.BOARD.size
+            board = create_board(row_offset, cols, rows)
+            if bool(sparse) != board.is_sparse():
+                raise ValueError("save data has a board stored the wrong way for its size")
+            for n in range(count):
+                first, length, vertical = self.SHIP.unpack_from(data, offset)
+                offset += self.SHIP.size
+                step = cols if vertical else 1
+                if length > 0 and first + (length - 1) * step >= cols * rows:
+                    raise ValueError("save data has a ship off the board")
+                board.add_ship_cells(range(first, first + length * step, step))
+            if sparse:
+                shots = []
+                for n in range(2):
+                    cells, offset = self._unpack_array("I", data, offset + self.COUNT.size, \
+                        self.COUNT.unpack_from(data, offset)[0])
+                    shots.append(cells)
+                board.set_shot_cells(*shots)
+            else:
+                size = (cols * rows + 7) // 8
+                if offset + 2 * size > len(data):
+                    raise ValueError("save data is too short")
+                hits = int.from_bytes(data[offset:offset + size], "little")
+                misses = int.from_bytes(data[offset + size:offset + 2 * size], "little")
+                offset += 2 * size
+                board.set_shots(hits, misses)
+            if group == "enemy_ships" and flags[1]:
+                color = globals.RED_BOLD
+            cast.add_board(group, board)
+            cast.add_lazy_actors(group, partial(self._build_sections, cast, board, color))
+            boards.append(board)
+
+        # the shots marked off the boards, then the misses, marked when first drawn if they were
+        count = self.COUNT.unpack_from(data, offset)[0]
+        offset += self.COUNT.size
+        strays, offset = self._unpack_array("H", data, offset, 2 * count)
+        if offset != len(data):
+            raise ValueError("save data has the wrong length")
+        if flag_bits & self.ARTILLERY_FLAG:
+            cast.add_lazy_actors("artillery", partial(self._build_artillery, boards, strays))
+        return cast
+
+    # method to save a game to the file
+    def write(self, director, cast):
+        """Snapshots a game to the file given at construction, if any.
+
+        Args:
+            director (Director): The director playing the game.
+            cast (Cast): The cast of actors.
+
+        Returns:
+            nothing
+
+        Raises:
+            ValueError: If a value in the game does not fit its field.
+            OSError: If the file cannot be written.
+        """
+        if self._path is None:
+            return
+        data = self.save(director, cast)
+        with open(self._path, "wb") as snapshot:
+            snapshot.write(data)
+
+    # method to build a fleet's sections from its board
+    def _build_sections(self, cast, board, color):
+        """Builds the ship section actors of a board, each ship drawn as the fleet draws it, with
+        its hit sections marked.
+
+        Args:
+            cast (Cast): The cast the sections belong to.
+            board (Board): The fleet's board.
+            color (Color): The color of the sections not hit.
+
+        Returns:
+            list: The sections, ship by ship.
+        """
+        sections = []
+        for cells in board.get_ship_cells():
+            vertical = len(cells) > 1 and cells[1] - cells[0] != 1
+            for n, index in enumerate(cells):
+                section = Ship(cast, color)
+                if board.is_hit(index):
+                    section.set_text("X")
+                    section.set_color(globals.RED_BOLD)
+                elif n == 0:
+                    section.set_text("^" if vertical else "<")
+                elif n == len(cells) - 1 and not vertical:
+                    section.set_text(">")
+                else:
+                    section.set_text("=")
+                section.set_font_size(globals.FONT_SIZE)
+                section.set_position(board.get_position(index))
+                sections.append(section)
+        return sections
+
+    # method to build the shot marks from the boards
+    def _build_artillery(self, boards, strays):
+        """Builds an artillery actor for every miss on the boards and every shot marked off them.
+
+        Args:
+            boards (list): The fleet boards.
+            strays (array): The column and row of each shot marked off the boards, in turn.
+
+        Returns:
+            list: The artillery actors.
+        """
+        positions = []
+        for board in boards:
+            top = board.get_row_offset()
+            for index in board.iter_misses(0, board.get_cols() - 1, top, top + board.get_rows() - 1):
+                positions.append(board.get_position(index))
+        for n in range(0, len(strays), 2):
+            positions.append(Point(strays[n], strays[n + 1]).scale(globals.CELL_SIZE))
+        artillery = []
+        for position in positions:
+            shot = Actor()
+            shot.set_position(position)
+            shot.set_text("X")
+            shot.set_color(globals.WHITE)
+            artillery.append(shot)
+        return artillery
+
+    # method to check a position for a miss
+    def _is_miss(self, board, position):
+        """Whether or not the given position is a missed cell of the board.
+
+        Args:
+            board (Board): A fleet board.
+            position (Point): The screen coordinates.
+
+        Returns:
+            bool: True if the cell is on the board and was missed; False if otherwise.
+        """
+        index = board.get_index(position)
+        return index is not None and board.is_missed(index)
+
+    # method to turn values into little-endian bytes
+    def _pack_array(self, typecode, values):
+        """Packs values into little-endian bytes with an array.
+
+        Args:
+            typecode (string): The array type code.
+            values (iterable): The values.
+
+        Returns:
+            bytes: The packed values.
+        """
+        values = array(typecode, values)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tobytes()
+
+    # method to read little-endian values
+    def _unpack_array(self, typecode, data, offset, count):
+        """Reads little-endian values into an array.
+
+        Args:
+            typecode (string): The array type code.
+            data (memoryview): The snapshot.
+            offset (int): Where the values start.
+            count (int): The number of values.
+
+        Returns:
+            Tuple(array, int): The values, and the offset just past them.
+        """
+        values = array(typecode)
+        end = offset + count * values.itemsize
+        if end > len(data):
+            raise ValueError("save data is too short")
+        values.frombytes(data[offset:end])
+        if sys.byteorder == "big":
+            values.byteswap()
+        return (values, end)
@@ -0,0 +1,40 @@
+"""
+file: scripted_shot_service.py
+author: Jerry Lane
+purpose: This class plays back a fixed list of shots for headless games.
+"""
+
+# class declaration
+class ScriptedShotService:
+    """Plays back the player's shots from a script.
+
+    The responsibility of a ScriptedShotService is to hand out a given sequence of shot positions
+    in order, one per turn.
+
+    Attributes:
+        _shots (iterator): The shot positions still to be fired.
+    """
+
+    # default constructor
+    def __init__(self, shots):
+        """Constructs a new ScriptedShotService using the given shots.
+        
+        Args:
+            shots (iterable): The Points to fire at, in order.
+
+        Returns:
+            nothing
+        """
+        self._shots = iter(shots)
+
+    # method to choose the next shot
+    def next_shot(self, cast):
+        """Gets the position of the next shot.
+
+        Args:
+            cast (Cast): The cast of actors.
+
+        Returns:
+            Point: Where to fire, or None if the script has run out.
+        """
+        return next(self._shots, None)
@@ -3,8 +3,13 @@ file: video_service.py
 author: authors of rfk
 purpose: This class handles the video output of Battleships.
 """
-# import module used to create and display on game screen
-import pyray
+# import the stand-in for the module used to create and display on game screen, which only loads
+# raylib when the window opens, time to pace the frames, and the glyph atlas the board is drawn from
+import globals
+import time
+from game.services.glyph_atlas import GlyphAtlas
+from game.shared.lazy_module import LazyModule
+pyray = LazyModule("pyray")
 
 # class declaration
 class VideoService:
@@ -18,14 +23,20 @@ class VideoService:
         _cell_size - a division used to align text
         _frame_rate - how fast the screen will redraw all elements
         _debug - used when debugging
+        _layers - retained drawings of groups that rarely change { key: name, value: [render texture, version] }
+        _wait_for_events - whether the window sleeps until there is input instead of polling for it
+        _atlas - the glyph atlas one-character actors are drawn from, a run of cells at a time
+        _next_frame - when the next frame is due to start, or None before the first
     """
 
     # default constructor
-    def __init__(self, caption, width, height, cell_size, frame_rate, debug = False):
+    def __init__(self, caption, width, height, cell_size, frame_rate, debug = False, wait_for_events = False):
         """Constructs a new VideoService using the specified debug mode.
         
         Args:
             debug (bool): whether or not to draw in debug mode.
+            wait_for_events (bool): whether or not the window sleeps between inputs, where the
+                installed raylib supports it. Only for games that change only on input.
 
         Returns:
             nothing
@@ -38,6 +49,33 @@ class VideoService:
         self._cell_size = cell_size
         self._frame_rate = frame_rate
         self._debug = debug
+        self._layers = {}
+        self._wait_for_events = wait_for_events
+        self._atlas = GlyphAtlas(cell_size, globals.FONT_SIZE, width // cell_size)
+        self._next_frame = None
+
+    # method to start drawing into a retained layer
+    def begin_layer(self, name, opaque = False):
+        """Makes the named layer's render texture, cleared, the target of drawing, creating it if
+        needed. Layers cannot be nested, and this must be called outside of the frame's drawing.
+
+        Args:
+            name (string): The name of the layer.
+            opaque (bool): whether to clear to the screen's background, for a whole frame, rather
+                than to transparent.
+
+        Returns:
+            nothing
+        """
+        if name not in self._layers:
+            self._layers[name] = [pyray.load_render_texture(self._width, self._height), None]
+        pyray.begin_texture_mode(self._layers[name][0])
+        if opaque:
+            pyray.clear_background(pyray.BLACK)
+            if self._debug == True:
+                self._draw_grid()
+        else:
+            pyray.clear_background(pyray.BLANK)
 
     # method to release computer resources and close game window
     def close_window(self):
@@ -49,6 +87,10 @@ class VideoService:
         Returns:
             nothing
         """
+        for texture, version in self._layers.values():
+            pyray.unload_render_texture(texture)
+        self._layers = {}
+        self._atlas.unload()
         pyray.close_window()
 
     # method to erase space in preparation of drawing next scene
@@ -86,17 +128,101 @@ class VideoService:
         
     # method to draw multiple actors in buffer
     def draw_actors(self, actors):
-        """Draws the text for the given list of actors on the screen.
+        """Draws the text for the given list of actors on the screen. Actors showing one of the
+        atlas's glyphs are gathered by glyph and color and drawn from the atlas, a run of
+        neighbouring cells at a time, so the actors are drawn grouped rather than in the order
+        given, and must not overlap.
 
         Args:
-            actors (list): A list of actors to draw.
+            actors (iterable): The actors to draw, such as a list or a live group view.
 
         Returns:
             nothing
         """ 
+        # gather every actor by what it shows, then ask the atlas once per group
+        batches = {}
         for actor in actors:
-            self.draw_actor(actor)
+            key = (actor.get_text(), actor.get_font_size(), actor.get_color())
+            batch = batches.get(key)
+            if batch is None:
+                batch = batches[key] = []
+            batch.append(actor)
+        for (text, font_size, color), batch in batches.items():
+            if self._atlas.has_glyph(text, font_size):
+                positions = [actor.get_position() for actor in batch]
+                self._atlas.draw(text, color, [(position.get_y(), position.get_x()) for position in positions])
+            else:
+                for actor in batch:
+                    self.draw_actor(actor)
+
+    # method to draw the same text in many places
+    def draw_glyphs(self, text, positions, font_size, color):
+        """Draws the given text at each of the given positions, from the glyph atlas if it holds
+        the text, for things drawn straight from a board rather than kept as actors.
+
+        Args:
+            text (string): The text to draw.
+            positions (iterable): The screen coordinates (Point) to draw it at.
+            font_size (int): The font size.
+            color (Color): The color.
+
+        Returns:
+            nothing
+        """ 
+        if not self._atlas.has_glyph(text, font_size):
+            for position in positions:
+                self.draw_text(text, position, font_size, color)
+            return
+        self._atlas.draw(text, color, [(position.get_y(), position.get_x()) for position in positions])
     
+    # method to draw a retained layer in buffer
+    def draw_layer(self, name):
+        """Copies a retained layer onto the screen in one call. The layer must have been brought up
+        to date with update_layer before clear_buffer was called.
+
+        Args:
+            name (string): The name of the layer.
+
+        Returns:
+            nothing
+        """ 
+        if name in self._layers:
+            texture = self._layers[name][0].texture
+
+            # render textures are stored upside down, so read them with a negative height
+            source = pyray.Rectangle(0, 0, texture.width, -texture.height)
+            pyray.draw_texture_rec(texture, source, pyray.Vector2(0, 0), pyray.WHITE)
+
+    # method to draw text that has no actor in buffer
+    def draw_text(self, text, position, font_size, color):
+        """Draws the given text on the screen, for things drawn straight from a board rather than
+        kept as actors.
+
+        Args:
+            text (string): The text to draw.
+            position (Point): The screen coordinates to draw it at.
+            font_size (int): The font size.
+            color (Color): The color.
+
+        Returns:
+            nothing
+        """ 
+        pyray.draw_text(text, position.get_x(), position.get_y(), font_size, color.to_tuple())
+
+    # method to finish drawing into a retained layer
+    def end_layer(self, name, version):
+        """Makes the screen the target of drawing again and marks the layer as drawn.
+
+        Args:
+            name (string): The name of the layer.
+            version (int): The version the layer was drawn at.
+
+        Returns:
+            nothing
+        """
+        pyray.end_texture_mode()
+        self._layers[name][1] = version
+
     # method to write what is in the buffer onto the screen
     def flush_buffer(self):
         """Copies the buffer contents to the screen. This method should be called at the end of
@@ -110,6 +236,26 @@ class VideoService:
         """ 
         pyray.end_drawing()
 
+    # method to wait for the next frame
+    def wait_for_frame(self):
+        """Sleeps until the next frame is due, holding the frame rate. A frame that ran more than
+        a whole frame late starts the count again, so the frames after it do not rush to catch up.
+        This method should be called once a frame, after flush_buffer.
+
+        Args:
+            none
+
+        Returns:
+            nothing
+        """
+        interval = 1 / self._frame_rate
+        now = time.perf_counter()
+        if self._next_frame is None or now > self._next_frame + interval:
+            self._next_frame = now
+        elif now < self._next_frame:
+            time.sleep(self._next_frame - now)
+        self._next_frame += interval
+
     # method to return the current cell size
     def get_cell_size(self):
         """Gets the video screen's cell size.
@@ -146,6 +292,19 @@ class VideoService:
         """
         return self._width
 
+    # method to check whether a retained layer needs redrawing
+    def is_layer_current(self, name, version):
+        """Whether or not the named layer was last drawn at the given version.
+
+        Args:
+            name (string): The name of the layer.
+            version (int): The version of the layer's actors.
+
+        Returns:
+            bool: True if the layer is up to date; false if otherwise.
+        """
+        return name in self._layers and self._layers[name][1] == version
+
     # method return True if the user has not closed it 
     def is_window_open(self):
         """Whether or not the window was closed by the user.
@@ -168,8 +327,56 @@ class VideoService:
         Returns:
             nothing
         """
+        # frames are paced by wait_for_frame rather than by raylib, so the wait can be timed apart
         pyray.init_window(self._width, self._height, self._caption)
-        pyray.set_target_fps(self._frame_rate)
+        pyray.set_target_fps(0)
+        self._atlas.load()
+
+        # raylib 4.2 and newer can block in flush_buffer until there is input
+        if self._wait_for_events and hasattr(pyray, "enable_event_waiting"):
+            pyray.enable_event_waiting()
+
+    # method to redraw a retained layer if it changed
+    def update_layer(self, name, actors, version):
+        """Draws the given actors into the named layer's render texture, but only if the layer is
+        new or its version differs from the one it was last drawn at. This method should be called
+        before clear_buffer, outside of the frame's drawing.
+
+        Args:
+            name (string): The name of the layer.
+            actors (iterable): The actors on the layer.
+            version (int): A counter that changes whenever the actors do.
+
+        Returns:
+            nothing
+        """
+        if self.is_layer_current(name, version):
+            return
+        self.begin_layer(name)
+        self.draw_actors(actors)
+        self.end_layer(name, version)
+
+    # method to redraw a retained layer of shaded cells if it changed
+    def update_shade_layer(self, name, shades, version):
+        """Fills grid cells with the given colors in the named layer's render texture, but only if
+        the layer is new or its version differs from the one it was last drawn at. This method
+        should be called before clear_buffer, outside of the frame's drawing.
+
+        Args:
+            name (string): The name of the layer.
+            shades (iterable): The (Point, Color) of each cell to fill, the point at its top left.
+            version (int): A counter that changes whenever the shades do.
+
+        Returns:
+            nothing
+        """
+        if self.is_layer_current(name, version):
+            return
+        self.begin_layer(name)
+        for position, color in shades:
+            pyray.draw_rectangle(int(position.get_x()), int(position.get_y()), \
+                self._cell_size, self._cell_size, color.to_tuple())
+        self.end_layer(name, version)
 
     # method to segment the game screen
     def _draw_grid(self):
@@ -10,19 +10,26 @@ class Color:
     """A color.
 
     The responsibility of Color is to hold and provide information about itself. Color has a few 
-    convenience methods for comparing them and converting to a tuple.
+    convenience methods for comparing them and converting to a tuple. Colors are immutable and
+    slotted, and each distinct color is only built once, so the palette in globals is shared by
+    every actor that uses it.
 
     Attributes:
         _red (int): The red value.
         _green (int): The green value.
         _blue (int): The blue value.
         _alpha (int): The alpha or opacity.
+        _tuple (tuple): The four values, kept ready for drawing.
     """
+    __slots__ = ("_red", "_green", "_blue", "_alpha", "_tuple")
+
+    # shared colors { key: (red, green, blue, alpha), value: Color }
+    _cache = {}
     
     # default constructor
-    def __init__(self, red, green, blue, alpha = 255):
-        """Constructs a new Color using the specified red, green, blue and alpha values. The alpha 
-        value is the color's opacity.
+    def __new__(cls, red, green, blue, alpha = 255):
+        """Gets a Color with the specified red, green, blue and alpha values, reusing the shared one
+        if it has been built before. The alpha value is the color's opacity.
         
         Args:
             red (int): A red value.
@@ -31,12 +38,37 @@ class Color:
             alpha (int): An alpha or opacity.
 
         Returns: 
-            nothing
+            Color: The shared color.
+        """
+        key = (red, green, blue, alpha)
+        color = cls._cache.get(key)
+        if color is None:
+            color = object.__new__(cls)
+            object.__setattr__(color, "_red", red)
+            object.__setattr__(color, "_green", green)
+            object.__setattr__(color, "_blue", blue)
+            object.__setattr__(color, "_alpha", alpha)
+            object.__setattr__(color, "_tuple", key)
+            cls._cache[key] = color
+        return color
+
+    # method to stop colors being changed once shared
+    def __setattr__(self, name, value):
+        """Refuses to change a Color, since the same one is shared by many actors.
+
+        Raises:
+            AttributeError: Always.
+        """
+        raise AttributeError("Color is immutable")
+
+    # method to let colors be copied between processes
+    def __reduce__(self):
+        """Tells pickle to rebuild the Color through the constructor.
+
+        Returns:
+            Tuple: The class and its arguments.
         """
-        self._red = red
-        self._green = green
-        self._blue = blue 
-        self._alpha = alpha
+        return (Color, self._tuple)
 
     # method to return the rgba values individually
     def to_tuple(self):
@@ -48,7 +80,7 @@ class Color:
         Returns:
             Tuple(int, int, int, int): The color as a tuple.
         """
-        return (self._red, self._green, self._blue, self._alpha)  
+        return self._tuple
 
     # method to compare two colors
     def equals(self, other):
@@ -0,0 +1,106 @@
+"""
+file: game_result.py
+author: Jerry Lane
+purpose: This class holds the outcome of a finished game.
+"""
+
+# class declaration
+class GameResult:
+    """The outcome of a game.
+
+    The responsibility of GameResult is to hold and provide the summary of a game once it is over,
+    so that many games can be compared without keeping their casts around.
+
+    Attributes:
+        _winner (string): "player", "enemy", or None if the game did not finish.
+        _turns (int): The number of turns played.
+        _shots (int): The number of shots the player fired.
+        _hits (int): The number of the player's shots that hit an enemy ship.
+        _enemy_shots (int): The number of shots the enemy fired.
+        _enemy_hits (int): The number of defender ships the enemy destroyed.
+    """
+
+    # default constructor
+    def __init__(self, winner, turns, shots, hits, enemy_shots, enemy_hits):
+        """Constructs a new GameResult using the specified values.
+        
+        Args:
+            winner (string): "player", "enemy", or None if the game did not finish.
+            turns (int): The number of turns played.
+            shots (int): The number of shots the player fired.
+            hits (int): The number of the player's shots that hit.
+            enemy_shots (int): The number of shots the enemy fired.
+            enemy_hits (int): The number of defender ships the enemy destroyed.
+
+        Returns: 
+            nothing
+        """
+        self._winner = winner
+        self._turns = turns
+        self._shots = shots
+        self._hits = hits
+        self._enemy_shots = enemy_shots
+        self._enemy_hits = enemy_hits
+
+    # method to return the enemy's hits
+    def get_enemy_hits(self):
+        """Gets the number of defender ships the enemy destroyed.
+        
+        Returns:
+            integer: The enemy's hits.
+        """
+        return self._enemy_hits
+
+    # method to return the enemy's shots
+    def get_enemy_shots(self):
+        """Gets the number of shots the enemy fired.
+        
+        Returns:
+            integer: The enemy's shots.
+        """
+        return self._enemy_shots
+
+    # method to return the player's hits
+    def get_hits(self):
+        """Gets the number of the player's shots that hit.
+        
+        Returns:
+            integer: The player's hits.
+        """
+        return self._hits
+
+    # method to return the player's shots
+    def get_shots(self):
+        """Gets the number of shots the player fired.
+        
+        Returns:
+            integer: The player's shots.
+        """
+        return self._shots
+
+    # method to return the number of turns
+    def get_turns(self):
+        """Gets the number of turns played.
+        
+        Returns:
+            integer: The turns played.
+        """
+        return self._turns
+
+    # method to return the winner
+    def get_winner(self):
+        """Gets the winner of the game.
+        
+        Returns:
+            string: "player", "enemy", or None if the game did not finish.
+        """
+        return self._winner
+
+    # method to return the values as a tuple
+    def to_tuple(self):
+        """Gets the result as a tuple of (winner, turns, shots, hits, enemy_shots, enemy_hits).
+
+        Returns:
+            Tuple: The result as a tuple.
+        """
+        return (self._winner, self._turns, self._shots, self._hits, self._enemy_shots, self._enemy_hits)
@@ -0,0 +1,136 @@
+"""
+file: input_snapshot.py
+author: Jerry Lane
+purpose: This class holds what the keyboard did over one frame, read
+once so everything that frame sees the same keys.
+"""
+
+# class declaration
+class InputSnapshot:
+    """The keyboard as it stood at one frame.
+
+    The responsibility of an InputSnapshot is to hold, unchanging, which keys were down when the
+    frame was sampled and every key event since the frame before, in the order they happened:
+    "pressed", "released", and "repeat" for a held key's automatic repeats. Presses and releases
+    that both fell between two frames are kept, so a quick tap is never lost at a low frame rate.
+    Keys are named by the KeyboardService that takes the snapshot.
+
+    Attributes:
+        _down (frozenset): The keys down when the frame was sampled.
+        _events (tuple): The (key, kind) of each event since the last frame, in order.
+        _steps (tuple): The cursor step (Point) of each arrow key press or repeat, in order.
+        _direction (Point): The direction of the arrow keys held, scaled to a cell.
+    """
+
+    __slots__ = ("_down", "_events", "_steps", "_direction")
+
+    # default constructor
+    def __init__(self, down, events, steps, direction):
+        """Constructs a new InputSnapshot, which cannot be changed afterward.
+
+        Args:
+            down (iterable): The keys down when the frame was sampled.
+            events (iterable): The (key, kind) of each event since the last frame, in order.
+            steps (iterable): The cursor step of each arrow key press or repeat, in order.
+            direction (Point): The direction of the arrow keys held.
+        """
+        object.__setattr__(self, "_down", frozenset(down))
+        object.__setattr__(self, "_events", tuple(events))
+        object.__setattr__(self, "_steps", tuple(steps))
+        object.__setattr__(self, "_direction", direction)
+
+    # method to stop snapshots being changed once taken
+    def __setattr__(self, name, value):
+        """Refuses to change an InputSnapshot, since everything in the frame shares it.
+
+        Raises:
+            AttributeError: Always.
+        """
+        raise AttributeError("InputSnapshot is immutable")
+
+    # method to count a key's presses
+    def count_presses(self, key):
+        """Gets how many times the given key was pressed since the last frame, not counting repeats.
+
+        Args:
+            key (string): The key's name.
+
+        Returns:
+            integer: The number of presses.
+        """
+        return self._events.count((key, "pressed"))
+
+    # method to count a key's releases
+    def count_releases(self, key):
+        """Gets how many times the given key was released since the last frame.
+
+        Args:
+            key (string): The key's name.
+
+        Returns:
+            integer: The number of releases.
+        """
+        return self._events.count((key, "released"))
+
+    # method to return the arrow keys' direction
+    def get_direction(self):
+        """Gets the direction of the arrow keys held when the frame was sampled.
+
+        Returns:
+            Point: The direction, scaled to a cell, or (0, 0) for none.
+        """
+        return self._direction
+
+    # method to return the events
+    def get_events(self):
+        """Gets every key event since the last frame.
+
+        Returns:
+            tuple: The (key, kind) of each event, in order; kind is "pressed", "released" or "repeat".
+        """
+        return self._events
+
+    # method to return the cursor steps
+    def get_steps(self):
+        """Gets the cursor step of each arrow key press or repeat since the last frame.
+
+        Returns:
+            tuple: The steps (Point), scaled to a cell, in order.
+        """
+        return self._steps
+
+    # method to check a key is down
+    def is_down(self, key):
+        """Whether or not the given key was down when the frame was sampled.
+
+        Args:
+            key (string): The key's name.
+
+        Returns:
+            bool: True if it was down; False if otherwise.
+        """
+        return key in self._down
+
+    # method to check a key was pressed
+    def is_pressed(self, key):
+        """Whether or not the given key was pressed since the last frame.
+
+        Args:
+            key (string): The key's name.
+
+        Returns:
+            bool: True if it was pressed at least once; False if otherwise.
+        """
+        return (key, "pressed") in self._events
+
+    # method to check a key was released
+    def is_released(self, key):
+        """Whether or not the given key was released since the last frame.
+
+        Args:
+            key (string): The key's name.
+
+        Returns:
+            bool: True if it was released at least once; False if otherwise.
+        """
+        return (key, "released") in self._events
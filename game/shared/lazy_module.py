@@ -0,0 +1,44 @@
+"""
+file: lazy_module.py
+author: Jerry Lane
+purpose: This class stands in for a module until something is first
+read from it, so a native library is only loaded when it is used.
+"""
+# import importlib to load the module when it is needed
+import importlib
+
+# class declaration
+class LazyModule:
+    """A module imported on first use.
+
+    The responsibility of a LazyModule is to put off importing a module until one of its names is
+    first read. The services that draw and read the keyboard use one for pyray, so that headless
+    games, tools and anything else that never opens a window never load raylib. Each name is copied
+    onto the stand-in the first time it is read, so later reads cost the same as reading a module.
+
+    Attributes:
+        _name (string): The name of the module.
+    """
+
+    # default constructor
+    def __init__(self, name):
+        """Constructs a new LazyModule for the named module, without importing it.
+
+        Args:
+            name (string): The name of the module.
+        """
+        self._name = name
+
+    # method called for a name not yet copied
+    def __getattr__(self, name):
+        """Imports the module if need be and reads the given name from it.
+
+        Args:
+            name (string): The name to read.
+
+        Returns:
+            The module's value for the name.
+        """
+        value = getattr(importlib.import_module(self._name), name)
+        setattr(self, name, value)
+        return value
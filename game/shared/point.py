@@ -9,23 +9,93 @@ class Point:
     """A distance from a relative origin (0, 0).
 
     The responsibility of Point is to hold and provide information about itself. Point has a few 
-    convenience methods for adding, scaling, and comparing them.
+    convenience methods for adding, scaling, and comparing them. Points are immutable and slotted,
+    and integer Points are shared: asking for the same grid position twice gives back the same
+    object, so moving actors around the grid does not keep allocating new ones.
 
     Attributes:
         _x (integer): The horizontal distance from the origin.
         _y (integer): The vertical distance from the origin.
     """
+    __slots__ = ("_x", "_y")
+
+    # shared integer points { key: (x, y), value: Point }, and how many to keep
+    _cache = {}
+    CACHE_LIMIT = 65536
     
     # default constructor
-    def __init__(self, x, y):
-        """Constructs a new Point using the specified x and y values.
+    def __new__(cls, x, y):
+        """Gets a Point with the specified x and y values, reusing a shared one when both values
+        are integers.
         
         Args:
             x (int): The specified x value.
             y (int): The specified y value.
         """
-        self._x = x
-        self._y = y
+        # hand back the shared point if there is one
+        cacheable = type(x) is int and type(y) is int
+        if cacheable:
+            point = cls._cache.get((x, y))
+            if point is not None:
+                return point
+
+        # otherwise build a new one, sharing it if there is still room
+        point = object.__new__(cls)
+        object.__setattr__(point, "_x", x)
+        object.__setattr__(point, "_y", y)
+        if cacheable and len(cls._cache) < cls.CACHE_LIMIT:
+            cls._cache[(x, y)] = point
+        return point
+
+    # method to stop points being changed once shared
+    def __setattr__(self, name, value):
+        """Refuses to change a Point, since the same one may be shared by many actors.
+
+        Raises:
+            AttributeError: Always.
+        """
+        raise AttributeError("Point is immutable")
+
+    # method to compare two points with ==
+    def __eq__(self, other):
+        """Whether or not this Point has the same x and y as the given one.
+
+        Args:
+            other (Point): The Point to compare.
+
+        Returns: 
+            boolean: True if both x and y are equal; false if otherwise.
+        """
+        if not isinstance(other, Point):
+            return NotImplemented
+        return self._x == other._x and self._y == other._y
+
+    # method to let points be dictionary keys
+    def __hash__(self):
+        """Gets a hash that matches __eq__.
+
+        Returns:
+            integer: The hash of (x, y).
+        """
+        return hash((self._x, self._y))
+
+    # method to let points be copied between processes
+    def __reduce__(self):
+        """Tells pickle to rebuild the Point through the constructor.
+
+        Returns:
+            Tuple: The class and its arguments.
+        """
+        return (Point, (self._x, self._y))
+
+    # method to show a point when debugging
+    def __repr__(self):
+        """Gets a readable form of the Point.
+
+        Returns:
+            string: The Point as Point(x, y).
+        """
+        return f"Point({self._x}, {self._y})"
 
     # method to add two points together
     def add(self, other):
@@ -39,6 +109,8 @@ class Point:
         """
         x = self._x + other.get_x()
         y = self._y + other.get_y()
+        if x == self._x and y == self._y:
+            return self
         return Point(x, y)
 
     # method to compare two points
@@ -82,4 +154,6 @@ class Point:
         Returns:
             Point: A new Point that is scaled.
         """
+        if factor == 1:
+            return self
         return Point(self._x * factor, self._y * factor)
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+file: tournament_stats.py
+author: Jerry Lane
+purpose: This class keeps running totals over the results of many games.
+"""
+# import math for the square roots in the confidence intervals
+import math
+
+# class declaration
+class TournamentStats:
+    """Running totals over many games.
+
+    The responsibility of TournamentStats is to fold in game results one at a time, without keeping
+    them, and report the player's win rate and turns-to-win with 95% confidence intervals.
+
+    Attributes:
+        _games (int): The number of games counted.
+        _wins (int): The number of games the player won.
+        _losses (int): The number of games the enemy won.
+        _turns_sum (int): The total turns over the player's wins.
+        _turns_squares (int): The total of the squared turns over the player's wins.
+    """
+
+    # z value for a 95% confidence interval
+    Z = 1.96
+
+    # default constructor
+    def __init__(self):
+        """Constructs a new, empty TournamentStats.
+        
+        Returns:
+            nothing
+        """
+        self._games = 0
+        self._wins = 0
+        self._losses = 0
+        self._turns_sum = 0
+        self._turns_squares = 0
+
+    # method to count one game
+    def add_result(self, result):
+        """Folds one game's result into the totals.
+
+        Args:
+            result (tuple): A GameResult tuple (winner, turns, shots, hits, enemy_shots, enemy_hits).
+
+        Returns:
+            nothing
+        """
+        winner, turns = result[0], result[1]
+        self._games += 1
+        if winner == "player":
+            self._wins += 1
+            self._turns_sum += turns
+            self._turns_squares += turns * turns
+        elif winner == "enemy":
+            self._losses += 1
+
+    # method to return the number of games
+    def get_games(self):
+        """Gets the number of games counted.
+
+        Returns:
+            integer: The number of games.
+        """
+        return self._games
+
+    # method to return the mean turns to win
+    def get_mean_turns_to_win(self):
+        """Gets the mean number of turns the player took to win, with its confidence interval.
+
+        Returns:
+            Tuple(float, float, float): The mean, low, and high bounds, or None if the player never
+            won. With a single win there is no spread to go on, so both bounds are None.
+        """
+        if self._wins == 0:
+            return None
+        mean = self._turns_sum / self._wins
+        if self._wins < 2:
+            return (mean, None, None)
+        variance = (self._turns_squares - self._wins * mean * mean) / (self._wins - 1)
+        margin = self.Z * math.sqrt(max(variance, 0) / self._wins)
+        return (mean, mean - margin, mean + margin)
+
+    # method to return the win rate
+    def get_win_rate(self):
+        """Gets the player's win rate with its Wilson score confidence interval.
+
+        Returns:
+            Tuple(float, float, float): The rate, low, and high bounds, or None if no games were counted.
+        """
+        if self._games == 0:
+            return None
+        n = self._games
+        rate = self._wins / n
+        z2 = self.Z * self.Z
+        centre = (rate + z2 / (2 * n)) / (1 + z2 / n)
+        margin = self.Z * math.sqrt(rate * (1 - rate) / n + z2 / (4 * n * n)) / (1 + z2 / n)
+        return (rate, max(0.0, centre - margin), min(1.0, centre + margin))
+
+    # method to describe the totals
+    def to_report(self):
+        """Gets the totals as lines of text for printing.
+
+        Returns:
+            string: The report.
+        """
+        lines = [f"Games played: {self._games}  (player {self._wins}, enemy {self._losses}, " \
+            f"unfinished {self._games - self._wins - self._losses})"]
+        win_rate = self.get_win_rate()
+        if win_rate is not None:
+            lines.append(f"Player win rate: {win_rate[0]:.4f}  (95% CI {win_rate[1]:.4f} - {win_rate[2]:.4f})")
+        turns = self.get_mean_turns_to_win()
+        if turns is not None and turns[1] is None:
+            lines.append(f"Mean turns to win: {turns[0]:.2f}  (95% CI n/a)")
+        elif turns is not None:
+            lines.append(f"Mean turns to win: {turns[0]:.2f}  (95% CI {turns[1]:.2f} - {turns[2]:.2f})")
+        return "\n".join(lines)
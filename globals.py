@@ -8,13 +8,21 @@ import os
 from game.shared.color import Color
 
 # global values
-FRAME_RATE = 12
+FRAME_RATE = 60
+TICK_RATE = 60
+REPEAT_DELAY = 0.25
+REPEAT_RATE = 12
+MAX_LAG = 0.25
 MAX_X = 900
 MAX_Y = 615
 CELL_SIZE = 15
 FONT_SIZE = 15
 COLS = 60
 ROWS = 40
+VIEW_COLS = MAX_X // CELL_SIZE
+VIEW_ROWS = (MAX_Y // CELL_SIZE - 2) // 2
+MAX_BOARD = 10000
+SPARSE_CELLS = 1 << 16
 CAPTION = "Battle Ships"
 DATA_PATH = os.path.dirname(os.path.abspath(__file__)) + "/data/messages.txt"
 WHITE = Color(255, 255, 255, 255)